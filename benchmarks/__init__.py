@@ -0,0 +1,7 @@
+"""
+Benchmarks of the clients and indexes, run against a local stand-in for the PokeAPI and generated
+fixtures, so that they need no network access. Each one is a module to run from the repository's
+root, e.g.:
+
+    python -m benchmarks.sessions
+"""
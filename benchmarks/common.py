@@ -0,0 +1,58 @@
+"""
+Helpers shared by the benchmarks: timing of calls, measurement of the memory retained by built
+objects, reporting of results, and generated fixtures of the sizes of actual API payloads.
+"""
+
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple, Type
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pokedex.models import Gender, Move, Pokemon
+from tests.stub import sample_data
+
+# Fixtures of increasing size, along with the lengths of their lists: a Gender, a Move with as
+# many flavor texts as actual ones, and a Pokémon with as many moves as Mew's
+FIXTURES: Dict[str, Tuple[str, Type[BaseModel], Dict[str, int]]] = {
+    "small": ("gender", Gender, {"pokemon_species_details": 20}),
+    "medium": ("move", Move, {"flavor_text_entries": 150, "names": 11, "learned_by_pokemon": 300}),
+    "large": ("pokemon", Pokemon, {"moves": 370, "version_group_details": 8, "game_indices": 20}),
+}
+
+
+def quiet() -> None:
+    """Silences the clients' logging, which would otherwise dominate the measurements."""
+    logger.remove()
+
+
+def fixture(size: str, item_id: int = 1) -> Tuple[str, Dict[str, Any]]:
+    """Returns the endpoint name and data of a fixture of the given size, see `FIXTURES`."""
+    endpoint, model_class, sizes = FIXTURES[size]
+    return endpoint, sample_data(model_class, sizes, id=item_id, name=f"{endpoint}-{item_id}")
+
+
+def measure(function: Callable[[], Any], repeat: int = 5) -> float:
+    """Returns the best time, in seconds, of a call to the provided function over some runs."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def retained(build: Callable[[], Any]) -> int:
+    """Returns the bytes still allocated once the object returned by the function is built."""
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def report(label: str, value: float, unit: str) -> None:
+    """Prints a result, aligned with the others."""
+    print(f"{label:<48} {value:>12,.2f} {unit}")
@@ -0,0 +1,54 @@
+"""
+Memory held per object by the regular models and by their compact records, see
+`pokedex.models.compact`, as measured by tracemalloc. Objects of each class are built from the
+same data, so that the strings they hold are shared and only the objects, nested ones included,
+are counted. Whole Pokémon are then measured from the raw bytes of their responses, strings
+included, as the client builds them, as regular models and as compact records, each with and
+without interned references. The interned cases are what a fully warmed cache holds per Pokémon.
+"""
+
+import json
+from typing import List
+
+from benchmarks.common import fixture, quiet, report, retained
+from pokedex.client.construction import construct_model
+from pokedex.client.decoding import get_decoder
+from pokedex.models import Pokemon
+from pokedex.models.compact import COMPACT_CLASSES
+from tests.stub import sample_data
+
+OBJECTS = 10_000
+POKEMON = 10
+
+
+def main() -> None:
+    quiet()
+    for model_class in COMPACT_CLASSES:
+        data = sample_data(model_class)
+        for compact in (False, True):
+            size: int = retained(
+                lambda: [
+                    construct_model(model_class, data, compact=compact) for _ in range(OBJECTS)
+                ]
+            )
+            label: str = "compact" if compact else "regular"
+            report(f"{model_class.__name__}, {label}", size / OBJECTS, "bytes/object")
+
+    decode = get_decoder()
+    contents: List[bytes] = [
+        json.dumps(fixture("large", item_id)[1]).encode() for item_id in range(1, POKEMON + 1)
+    ]
+    for label, options in [
+        ("regular", {}),
+        ("regular, interned", {"intern": True}),
+        ("compact", {"compact": True}),
+        ("compact, interned", {"compact": True, "intern": True}),
+    ]:
+        size = retained(
+            lambda: [construct_model(Pokemon, decode(content), **options) for content in contents]
+        )
+        report(f"large Pokemon, {label}", size / POKEMON / 1024, "KB/object")
+
+
+if __name__ == "__main__":
+    main()
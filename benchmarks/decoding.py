@@ -0,0 +1,48 @@
+"""
+Throughput of the decoding of responses per fixture size: `response.json()`, as the get_*
+methods used to, against each JSON library installed among those `get_decoder` supports, reading
+the raw bytes. Decoding is measured alone, then followed by the validation of the model.
+"""
+
+import json
+from typing import Any, Callable, Dict
+
+import requests
+
+from benchmarks.common import FIXTURES, fixture, measure, quiet, report
+from pokedex.client.decoding import get_decoder
+
+
+def _response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response._content = content
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    return response
+
+
+def main() -> None:
+    quiet()
+    for size, (_, model_class, _) in FIXTURES.items():
+        content: bytes = json.dumps(fixture(size)[1]).encode()
+        decoders: Dict[str, Callable[[], Any]] = {
+            "response.json()": lambda: _response(content).json()
+        }
+        for name in ("json", "ujson", "orjson"):
+            try:
+                decode = get_decoder(name)
+            except ImportError:
+                continue
+            decoders[name] = lambda decode=decode: decode(content)
+
+        print(f"{size} {model_class.__name__}, {len(content) / 1024:,.0f} KB")
+        for name, decode in decoders.items():
+            report(f"  {name}, decoding", len(content) / measure(decode) / 1024 ** 2, "MB/s")
+            report(
+                f"  {name}, decoding and validation",
+                1 / measure(lambda: model_class(**decode())),
+                "models/s",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Latency and memory of eager against lazy parsing on the largest fixtures, a Move and a Pokémon,
+from the raw bytes of their responses. Lazy models are measured both untouched and once their
+deferred sub-collections have been accessed. Memory is the size of what a model keeps allocated
+once built, as measured by tracemalloc.
+"""
+
+import json
+from typing import Any
+
+from benchmarks.common import FIXTURES, fixture, measure, quiet, report, retained
+from pokedex.client.construction import defer_model
+from pokedex.client.decoding import get_decoder
+
+
+
+def main() -> None:
+    quiet()
+    decode = get_decoder()
+    for size in ("medium", "large"):
+        _, model_class, _ = FIXTURES[size]
+        content: bytes = json.dumps(fixture(size)[1]).encode()
+
+        def eager() -> Any:
+            return model_class(**decode(content))
+
+        def lazy() -> Any:
+            return defer_model(model_class, decode(content))
+
+        def lazy_accessed() -> Any:
+            model = lazy()
+            for name in model_class.__lazy_fields__:
+                getattr(model, name)
+            return model
+
+        label: str = f"{size} {model_class.__name__}, {len(content) / 1024:,.0f} KB"
+        for variant, build in [("eager", eager), ("lazy", lazy), ("lazy, accessed", lazy_accessed)]:
+            report(f"{label}, {variant}, latency", measure(build) * 1000, "ms")
+            report(f"{label}, {variant}, memory", retained(build) / 1024, "KB")
+
+
+if __name__ == "__main__":
+    main()
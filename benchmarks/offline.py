@@ -0,0 +1,37 @@
+"""
+Latency of the OfflinePokeClient's queries per fixture size, from a snapshot mirrored from the
+stand-in API. Snapshot reads are measured with the in-memory cache disabled, so that every query
+decompresses and builds its model, eagerly and lazily, along with cache hits for reference.
+"""
+
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import FIXTURES, fixture, measure, quiet, report
+from pokedex.client import OfflinePokeClient, PokeClient, mirror_snapshot
+from tests.stub import StubAPI
+
+
+def main() -> None:
+    quiet()
+    with tempfile.TemporaryDirectory() as directory:
+        path: Path = Path(directory) / "snapshot.db"
+        with StubAPI() as api:
+            for size in FIXTURES:
+                api.add(*fixture(size))
+            with PokeClient(base_url=api.base_url) as client:
+                mirror_snapshot(client, path, [endpoint for endpoint, _, _ in FIXTURES.values()])
+
+        for size, (endpoint, _, _) in FIXTURES.items():
+            for label, options in [
+                ("snapshot read", {"cache_size": 0}),
+                ("lazy snapshot read", {"cache_size": 0, "lazy": True}),
+                ("cache hit", {"cache_size": None}),
+            ]:
+                with OfflinePokeClient(path, **options) as client:
+                    get = getattr(client, f"get_{endpoint}")
+                    report(f"{size} {endpoint}, {label}", measure(lambda: get(1)) * 1e6, "µs")
+
+
+if __name__ == "__main__":
+    main()
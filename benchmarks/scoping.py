@@ -0,0 +1,68 @@
+"""
+Parse time and memory of the largest fixture, a Pokémon, unscoped against scoped to a version
+group, from the raw bytes of its response. The fixture's per-game entries are spread over as many
+version groups and versions as Mew's, of which the scope keeps one version group and its two
+versions. Memory is the size of what a model keeps allocated once built, as measured by
+tracemalloc.
+"""
+
+import json
+from typing import Any, Dict
+
+from benchmarks.common import FIXTURES, measure, quiet, report, retained
+from pokedex.client.decoding import get_decoder
+from pokedex.client.pruning import Scope, prune
+from pokedex.models import Pokemon
+from tests.stub import sample_data
+
+VERSION_GROUPS: int = 20
+VERSIONS: int = 30
+
+SCOPE: Scope = {
+    "version_group": frozenset(("version-group-1",)),
+    "version": frozenset(("version-1", "version-2")),
+}
+
+
+def _resource(endpoint: str, index: int) -> Dict[str, str]:
+    return {"name": f"{endpoint}-{index}", "url": f"https://pokeapi.co/api/v2/{endpoint}/{index}/"}
+
+
+def _spread_versions(data: Dict[str, Any]) -> None:
+    """Spreads the per-game entries of the Pokémon's data over distinct games, in place."""
+    for move_index, move in enumerate(data["moves"]):
+        for index, details in enumerate(move["version_group_details"]):
+            # Moves are learnable in more or fewer games, as Mew's are
+            group: int = (move_index + index) % VERSION_GROUPS + 1
+            details["version_group"] = _resource("version-group", group)
+    for held_item in data["held_items"]:
+        for index, details in enumerate(held_item["version_details"]):
+            details["version"] = _resource("version", index % VERSIONS + 1)
+    for index, game_index in enumerate(data["game_indices"]):
+        game_index["version"] = _resource("version", index % VERSIONS + 1)
+
+
+def main() -> None:
+    quiet()
+    decode = get_decoder()
+    _, _, sizes = FIXTURES["large"]
+    data = sample_data(Pokemon, {**sizes, "held_items": 4, "version_details": 8}, id=1)
+    _spread_versions(data)
+    content: bytes = json.dumps(data).encode()
+
+    def unscoped() -> Any:
+        return Pokemon(**decode(content))
+
+    def scoped() -> Any:
+        decoded: Dict[str, Any] = decode(content)
+        prune(Pokemon, decoded, SCOPE)
+        return Pokemon(**decoded)
+
+    label: str = f"large Pokemon, {len(content) / 1024:,.0f} KB"
+    for variant, build in [("unscoped", unscoped), ("scoped", scoped)]:
+        report(f"{label}, {variant}, parse time", measure(build) * 1000, "ms")
+        report(f"{label}, {variant}, memory", retained(build) / 1024, "KB")
+
+
+if __name__ == "__main__":
+    main()
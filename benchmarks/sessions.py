@@ -0,0 +1,39 @@
+"""
+Throughput of sequential queries with the PokeClient's pooled keep-alive session, against a new
+connection per request, as with module-level `requests.get` calls. The in-memory cache is
+disabled so that every query goes to the stand-in API.
+
+Over loopback a new connection costs almost nothing, so the gap is small here: it grows with the
+round-trip time to the server, and with a TLS handshake on each new connection to the real API.
+"""
+
+import requests
+
+from benchmarks.common import fixture, measure, quiet, report
+from pokedex.client import PokeClient
+from pokedex.models import Gender
+from tests.stub import StubAPI
+
+
+def main() -> None:
+    quiet()
+    with StubAPI() as api:
+        endpoint, data = fixture("small")
+        api.add(endpoint, data)
+        url: str = f"{api.base_url}{endpoint}/1/"
+
+        def module_level_get() -> Gender:
+            return Gender(**requests.get(url).json())
+
+        report("requests.get per query", 1 / measure(module_level_get), "requests/s")
+        for keep_alive in (False, True):
+            with PokeClient(base_url=api.base_url, cache_size=0, keep_alive=keep_alive) as client:
+                report(
+                    f"PokeClient, keep_alive={keep_alive}",
+                    1 / measure(lambda: client.get_gender(1)),
+                    "requests/s",
+                )
+
+
+if __name__ == "__main__":
+    main()
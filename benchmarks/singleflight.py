@@ -0,0 +1,53 @@
+"""
+Requests sent, and wall time, when 32 threads query the same Pokémon at the same moment: with a
+new request and model per caller, as with module-level `requests.get` calls, against the
+PokeClient, which coalesces the concurrent queries into a single one. The stand-in API takes 50
+milliseconds to answer, so that the queries overlap.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import requests
+
+from benchmarks.common import fixture, quiet, report
+from pokedex.client import PokeClient
+from pokedex.models import Pokemon
+from tests.stub import StubAPI
+
+CALLERS = 32
+
+
+def _storm(api: StubAPI, query: Callable[[], Pokemon]) -> None:
+    requests_sent: int = api.total_requests
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        list(executor.map(lambda _: query(), range(CALLERS)))
+    elapsed: float = time.perf_counter() - start
+    label: str = getattr(query, "__name__", "query")
+    report(f"{label}, requests sent", api.total_requests - requests_sent, "requests")
+    report(f"{label}, wall time", elapsed * 1000, "ms")
+
+
+def main() -> None:
+    quiet()
+    with StubAPI(delay=0.05) as api:
+        endpoint, data = fixture("large")
+        api.add(endpoint, data)
+        url: str = f"{api.base_url}{endpoint}/{data['name']}/"
+
+        def module_level_get() -> Pokemon:
+            return Pokemon(**requests.get(url).json())
+
+        _storm(api, module_level_get)
+        with PokeClient(base_url=api.base_url, max_workers=CALLERS) as client:
+
+            def single_flight() -> Pokemon:
+                return client.get_pokemon(data["name"])
+
+            _storm(api, single_flight)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Speedup of trusted model construction over full validation per fixture size: building models
+from decoded data alone, then through the PokeClient reading validated responses from its disk
+cache, with the in-memory cache disabled so that every query builds its model again.
+"""
+
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import FIXTURES, fixture, measure, quiet, report
+from pokedex.client import PokeClient
+from pokedex.client.construction import construct_model
+from pokedex.client.disk_cache import DiskCache
+from tests.stub import StubAPI
+
+
+def main() -> None:
+    quiet()
+    for size, (_, model_class, _) in FIXTURES.items():
+        data = fixture(size)[1]
+        validated: float = measure(lambda: model_class(**data))
+        constructed: float = measure(lambda: construct_model(model_class, data))
+        report(f"{size} {model_class.__name__}, validation", 1 / validated, "models/s")
+        report(f"{size} {model_class.__name__}, construction", 1 / constructed, "models/s")
+        report(f"{size} {model_class.__name__}, speedup", validated / constructed, "x")
+
+    with tempfile.TemporaryDirectory() as directory, StubAPI() as api:
+        for size in FIXTURES:
+            api.add(*fixture(size))
+        disk_cache = DiskCache(Path(directory) / "cache.db")
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            # Stores the responses, and marks them validated, with a first round of queries
+            for endpoint, _, _ in FIXTURES.values():
+                getattr(client, f"get_{endpoint}")(1)
+
+        for size, (endpoint, _, _) in FIXTURES.items():
+            latencies = []
+            for trusted in (False, True):
+                with PokeClient(
+                    base_url=api.base_url, disk_cache=disk_cache, cache_size=0, trusted=trusted
+                ) as client:
+                    get = getattr(client, f"get_{endpoint}")
+                    latencies.append(measure(lambda: get(1)))
+                    report(
+                        f"{size} {endpoint}, disk cache, trusted={trusted}",
+                        1 / latencies[-1],
+                        "queries/s",
+                    )
+            report(f"{size} {endpoint}, disk cache, speedup", latencies[0] / latencies[1], "x")
+        assert api.total_requests == len(FIXTURES), "queries should be served by the disk cache"
+
+
+if __name__ == "__main__":
+    main()
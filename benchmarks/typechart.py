@@ -0,0 +1,118 @@
+"""
+Throughput of the TypeChart, built from 18 generated Type models with random damage relations:
+matchups scored per second by walking the relations lists of the Type models, as callers used
+to, against vectorized scoring of a million dual-typed matchups by index and by name. Building,
+saving and loading the chart are timed as well.
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.common import measure, quiet, report
+from pokedex.indexes import TypeChart
+from pokedex.models import Type
+from tests.stub import sample_data
+
+TYPES = 18
+MATCHUPS = 1_000_000
+WALKED_MATCHUPS = 10_000
+_MULTIPLIERS = {"no_damage_to": 0.0, "half_damage_to": 0.5, "double_damage_to": 2.0}
+
+
+def _types(rng: np.random.Generator) -> List[Type]:
+    names: List[str] = [f"type-{index}" for index in range(TYPES)]
+    relations: Dict[str, List[List[dict]]] = {
+        relation: [[] for _ in names] for relation in _MULTIPLIERS
+    }
+    for attacker in range(TYPES):
+        for defender in range(TYPES):
+            relation: Optional[str] = rng.choice([*_MULTIPLIERS, None], p=[0.05, 0.2, 0.2, 0.55])
+            if relation is not None:
+                url: str = f"https://pokeapi.co/api/v2/type/{defender + 1}/"
+                relations[relation][attacker].append({"name": names[defender], "url": url})
+    return [
+        Type(
+            **sample_data(
+                Type,
+                id=index + 1,
+                name=name,
+                damage_relations={
+                    **{relation: lists[index] for relation, lists in relations.items()},
+                    "no_damage_from": [],
+                    "half_damage_from": [],
+                    "double_damage_from": [],
+                },
+            )
+        )
+        for index, name in enumerate(names)
+    ]
+
+
+def _walk(attacker: Type, defender: Type, second_defender: Optional[Type]) -> float:
+    """Scores a matchup from the Type models, going over the attacker's relations lists."""
+    score: float = 1.0
+    for defending in (defender, second_defender):
+        if defending is None:
+            continue
+        for relation, multiplier in _MULTIPLIERS.items():
+            others = getattr(attacker.damage_relations, relation)
+            if any(other.name == defending.name for other in others):
+                score *= multiplier
+    return score
+
+
+def main() -> None:
+    quiet()
+    rng = np.random.default_rng(0)
+    types: List[Type] = _types(rng)
+    chart: TypeChart = TypeChart.from_types(types)
+    report("build from Type models", measure(lambda: TypeChart.from_types(types)) * 1000, "ms")
+    with tempfile.TemporaryDirectory() as directory:
+        path: Path = Path(directory) / "typechart.npz"
+        report("save", measure(lambda: chart.save(path)) * 1000, "ms")
+        report("load", measure(lambda: TypeChart.load(path)) * 1000, "ms")
+
+    attacking = rng.integers(0, TYPES, MATCHUPS)
+    defending = rng.integers(0, TYPES, MATCHUPS)
+    second_defending = rng.integers(-1, TYPES, MATCHUPS)  # -1 is NO_TYPE, single-typed
+
+    sample = (
+        attacking[:WALKED_MATCHUPS],
+        defending[:WALKED_MATCHUPS],
+        second_defending[:WALKED_MATCHUPS],
+    )
+    walked = list(zip(*sample))
+
+    def walk() -> List[float]:
+        return [_walk(types[a], types[d], types[s] if s >= 0 else None) for a, d, s in walked]
+
+    assert np.array_equal(walk(), chart.score(*sample)), "the chart should match the Type models"
+    walk_time: float = measure(walk, repeat=3)
+    report("walking relations lists", WALKED_MATCHUPS / walk_time, "matchups/s")
+
+    report(
+        "TypeChart.score, by index",
+        MATCHUPS / measure(lambda: chart.score(attacking, defending, second_defending)),
+        "matchups/s",
+    )
+    names = np.array(chart.names + ("",))
+    attacking_names, defending_names = names[attacking], names[defending]
+    second_names = np.where(second_defending >= 0, names[second_defending], None)
+    report(
+        "TypeChart.score, by name",
+        MATCHUPS
+        / measure(lambda: chart.score(attacking_names, defending_names, second_names), repeat=3),
+        "matchups/s",
+    )
+    report(
+        "TypeChart.score_all",
+        MATCHUPS * TYPES / measure(lambda: chart.score_all(defending, second_defending)),
+        "matchups/s",
+    )
+
+
+if __name__ == "__main__":
+    main()
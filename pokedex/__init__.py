@@ -1 +1 @@
-from .client import PokeClient
+from .client import AsyncPokeClient, OfflinePokeClient, PokeClient
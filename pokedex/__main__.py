@@ -0,0 +1,29 @@
+import argparse
+
+from pokedex.client import PokeClient, mirror_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="pokedex", description="Tools around the PokeAPI.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    mirror_parser = subparsers.add_parser("mirror", help="mirror the API into a snapshot file")
+    mirror_parser.add_argument("path", help="location of the snapshot file, created if needed")
+    mirror_parser.add_argument("--base-url", default="https://pokeapi.co/api/v2/")
+    mirror_parser.add_argument("--resources", nargs="*", help="endpoints to mirror, default all")
+    mirror_parser.add_argument("--workers", type=int, default=10, help="parallel queries")
+    arguments = parser.parse_args()
+
+    if arguments.command == "mirror":
+        with PokeClient(
+            base_url=arguments.base_url, pool_maxsize=arguments.workers, cache_size=0
+        ) as client:
+            failures: int = mirror_snapshot(
+                client, arguments.path, arguments.resources, max_workers=arguments.workers
+            )
+        if failures:
+            raise SystemExit(f"{failures} items could not be mirrored, run again to resume")
+
+
+if __name__ == "__main__":
+    main()
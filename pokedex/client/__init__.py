@@ -1 +1,6 @@
+from .aio import AsyncPokeClient
 from .api import PokeClient
+from .exceptions import PokeAPIError, RateLimitError
+from .offline import OfflinePokeClient
+from .ratelimit import RateLimiter, SharedTokenBucket, TokenBucket
+from .snapshot import mirror_snapshot
@@ -0,0 +1,569 @@
+"""
+Asynchronous counterpart to the PokeClient, for use within asyncio applications. It requires the
+optional 'aiohttp' dependency, installable with the 'async' extra.
+"""
+
+import asyncio
+import functools
+from collections import deque
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pokedex.client.base import BaseClient
+from pokedex.client.cache import CacheManager
+from pokedex.client.decoding import Decoder
+from pokedex.client.endpoints import (
+    Endpoint,
+    FetchResult,
+    bind_endpoint_methods,
+    get_endpoint,
+    parse_resource_url,
+)
+from pokedex.client.exceptions import PokeAPIError, RateLimitError
+from pokedex.client.expansion import collect_references
+from pokedex.client.getters import AsyncEndpointGetters
+from pokedex.client.ratelimit import THROTTLING_STATUS_CODES, RateLimiter, parse_retry_after
+from pokedex.client.singleflight import AsyncSingleFlight
+from pokedex.models.commons import APIResource, NamedAPIResource
+from pokedex.models.resource import APIResourceList, NamedAPIResourceList
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncPokeClient(BaseClient, AsyncEndpointGetters):
+    """
+    High-level object to asynchronously query data from the PokeAPI. Each endpoint covered by the
+    PokeClient is available here as a coroutine, returning the same pokedex.models objects, and
+    has a batched counterpart as well, e.g. `await client.get_pokemons([1, 2, "pikachu"])`. As for
+    the PokeClient, queried models are kept in a CacheManager owned by the client, and concurrent
+    queries for the same item are coalesced into a single request.
+
+    All queries share a single pooled aiohttp connector, and the number of requests in flight at
+    any given time is bounded by a semaphore. Throttled requests are retried, and lower the number
+    of requests let in flight, as per the client's RateLimiter. The client should be closed once
+    done with, either explicitly with `await client.close()` or by using it as an async context
+    manager:
+
+        async with AsyncPokeClient(max_concurrency=20) as client:
+            pikachu = await client.get_pokemon("pikachu")
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://pokeapi.co/api/v2/",
+        max_concurrency: int = 10,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 15.0,
+        cache_size: Optional[int] = 64 * 1024 ** 2,
+        endpoint_cache_sizes: Optional[Dict[str, Optional[int]]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Union[str, Decoder, None] = None,
+        lazy: bool = False,
+        intern_resources: bool = True,
+        compact: bool = False,
+        languages: Optional[Iterable[str]] = None,
+        version_group: Optional[Union[str, int]] = None,
+    ):
+        """
+        Args:
+            base_url (str): the root url of the API, can be changed to query a mirror.
+            max_concurrency (int): the maximum number of requests in flight at the same time.
+            limit (int): the total number of simultaneous connections of the connector pool.
+            limit_per_host (int): the number of simultaneous connections to a single host.
+            keepalive_timeout (float): how long, in seconds, an idle connection is kept open.
+            cache_size (Optional[int]): the memory budget, in bytes, of the in-memory cache of
+                                        queried models. None means the cache is unbounded.
+            endpoint_cache_sizes (Optional[Dict[str, Optional[int]]]): per-endpoint budgets of the
+                                                                       in-memory cache, in bytes.
+            rate_limiter (Optional[RateLimiter]): the rate limiting and retry policies to send
+                                                  requests with. Defaults to a RateLimiter with
+                                                  no rate cap, allowing up to 'max_concurrency'
+                                                  requests in flight.
+            decoder (Union[str, Decoder, None]): the JSON library to decode responses with,
+                                                 among 'orjson', 'ujson' and 'json', or any
+                                                 callable taking bytes. Defaults to the fastest
+                                                 one installed.
+            lazy (bool): whether to defer the parsing of the heavy sub-collections of large
+                         models, such as a Pokémon's moves, to their first access.
+            intern_resources (bool): whether to share the NamedAPIResource and APIResource
+                                     objects of queried models with all other models holding
+                                     identical ones, which saves memory on large caches.
+            compact (bool): whether to hold the most repeated sub-objects of queried models, such
+                            as resource references and a Pokémon's move details, in read-only
+                            compact records exposing the same attributes, see
+                            `pokedex.models.compact`. This cuts their memory footprint severalfold.
+            languages (Optional[Iterable[str]]): the names of the languages to keep the localized
+                                                 entries of, such as names and flavor texts, e.g.
+                                                 ['en', 'ja']. Entries in other languages are
+                                                 dropped before models are built. None keeps all
+                                                 of them.
+            version_group (Optional[str]): the name or ID number of the version group to keep the
+                                           per-game entries of, such as a Pokémon's move learning
+                                           details, e.g. 'red-blue'. Entries for other games are
+                                           dropped before models are built. None keeps all of
+                                           them.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "The AsyncPokeClient requires 'aiohttp', install it with the 'async' extra"
+            )
+        super().__init__(
+            base_url=base_url,
+            decoder=decoder,
+            lazy=lazy,
+            intern_resources=intern_resources,
+            compact=compact,
+            languages=languages,
+            version_group=version_group,
+        )
+        self.max_concurrency: int = max_concurrency
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.rate_limiter: RateLimiter = (
+            rate_limiter
+            if rate_limiter is not None
+            else RateLimiter(max_concurrency=max_concurrency)
+        )
+        self.cache: CacheManager = CacheManager(cache_size, endpoint_cache_sizes)
+        self._in_flight: AsyncSingleFlight = AsyncSingleFlight()
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncPokeClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying session, releasing all pooled connections."""
+        if self._session is not None:
+            logger.debug("Closing client session and its pooled connections")
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        The aiohttp session the client sends its requests through. It is created on first use, as
+        aiohttp requires a running event loop to do so.
+        """
+        if self._session is None or self._session.closed:
+            logger.trace(
+                f"Creating connector pool (limit={self.limit}, "
+                f"limit_per_host={self.limit_per_host})"
+            )
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """The semaphore bounding the number of concurrent requests, created on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @staticmethod
+    def validate_response_status(response: "aiohttp.ClientResponse") -> None:
+        """
+        Checks the validity of the provided response's status code, expecting 200.
+
+        Args:
+            response (aiohttp.ClientResponse): the response of a GET request to the PokeAPI.
+
+        Returns:
+            Nothing, but will raise a PokeAPIError if status code is not 200, or more
+            specifically a RateLimitError if the request was throttled.
+        """
+        if response.status != 200:
+            logger.error(f"Expected status code 200 but received {response.status}, aborting")
+            message = (
+                f"GET request returned with status code {response.status}, when querying "
+                f"address '{response.url}' check the validity of your parameter"
+            )
+            if response.status == 429:
+                raise RateLimitError(
+                    message,
+                    status_code=response.status,
+                    url=str(response.url),
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                )
+            raise PokeAPIError(message, status_code=response.status, url=str(response.url))
+
+    async def _get_resource(
+        self,
+        endpoint: Endpoint,
+        item_id: Union[str, int],
+        fields: Optional[Iterable[str]] = None,
+    ) -> BaseModel:
+        """
+        Query an item's data from the given endpoint and return it organised in a model object.
+
+        Args:
+            endpoint (Endpoint): the registered endpoint to query.
+            item_id (Union[str, int]): the item's identifier, either its ID number or its name.
+            fields (Optional[Iterable[str]]): the names of the fields to get, for a partial view
+                                              of the item. None means all of them.
+
+        Returns:
+            An object of the endpoint's model class, holding the item's data.
+        """
+        self.validate_id(item_id)
+        fields = self._check_fields(endpoint, fields)
+        key: Union[str, int] = self.aliases.canonical(endpoint.name, item_id)
+        cached: Optional[BaseModel] = self.cache.get(endpoint.name, self._cache_key(key, fields))
+        if cached is not None:
+            return cached
+        return await self._in_flight.do(
+            (endpoint.name, self._cache_key(key, fields)),
+            functools.partial(self._load_resource, endpoint, key, fields),
+        )
+
+    async def _load_resource(
+        self,
+        endpoint: Endpoint,
+        key: Union[str, int],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> BaseModel:
+        """Queries an item missing from the in-memory cache, then caches its model object."""
+        if self._needs_versions(endpoint):
+            self._scope_versions(await self.get_version_group(self.version_group))
+        query_url: str = self.format_query_url(item_id=key, item_type=endpoint.name)
+        content: bytes = await self._request(endpoint, query_url)
+
+        model, size = self._parse_model(endpoint, content, fields=fields)
+        key = self._learn_aliases(endpoint, model, key)
+        self.cache.set(endpoint.name, self._cache_key(key, fields), model, size=size)
+        return model
+
+    async def _request(self, endpoint: Endpoint, query_url: str) -> bytes:
+        """
+        Sends a GET request to the provided url, within the limit of the client's semaphore, and
+        returns the raw body of the response. Throttled requests are retried as per the client's
+        RateLimiter, releasing the semaphore while waiting.
+
+        Args:
+            endpoint (Endpoint): the registered endpoint the url belongs to.
+            query_url (str): the url to send a GET request to.
+
+        Returns:
+            The content of the response, as bytes.
+        """
+        max_retries: int = self.rate_limiter.retries(endpoint.name)
+        for attempt in range(max_retries + 1):
+            async with self.semaphore:
+                acquired: bool = False
+                status: Optional[int] = None
+                try:
+                    await self.rate_limiter.acquire_async()
+                    acquired = True
+                    logger.debug(f"Sending GET request to '{query_url}'")
+                    async with self.session.get(query_url) as response:
+                        status = response.status
+                        if status not in THROTTLING_STATUS_CODES or attempt == max_retries:
+                            self.validate_response_status(response)
+                            return await response.read()
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                finally:
+                    # A failed acquire gives its slot back by itself
+                    if acquired:
+                        await self.rate_limiter.release_async(status)
+
+            delay: float = self.rate_limiter.backoff(attempt, retry_after)
+            logger.warning(
+                f"Request to '{query_url}' throttled with status code {status}, "
+                f"retrying in {delay:.2f}s ({attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+    async def load_aliases(self, resource: str) -> None:
+        """
+        Learns the name and ID number of all of an endpoint's items from its list endpoint, so
+        that queries by name are resolved to the same cache entries as queries by ID right away.
+
+        Args:
+            resource (str): the API resource name, e.g. 'pokemon-species'.
+        """
+        endpoint: Endpoint = get_endpoint(resource)
+        logger.debug(f"Loading the aliases of all {endpoint.label} items")
+        query_url: str = self.format_list_url(item_type=endpoint.name, limit=100_000)
+        content: bytes = await self._request(endpoint, query_url)
+        self.aliases.learn_resources(self.decode(content)["results"])
+
+    async def get(
+        self, resource: str, item_id: Union[str, int], fields: Optional[Iterable[str]] = None
+    ) -> BaseModel:
+        """
+        Query an item's data from any endpoint, by resource name. This is equivalent to calling
+        the endpoint's dedicated method, e.g. `await get("pokemon-species", 25)` is the same as
+        `await get_pokemon_species(25)`.
+
+        Args:
+            resource (str): the API resource name, e.g. 'pokemon-species'.
+            item_id (Union[str, int]): the item's identifier, either its ID number or its name.
+            fields (Optional[Iterable[str]]): the names of the fields to get, for a partial view
+                                              of the item. None means all of them.
+
+        Returns:
+            An object of the endpoint's model class, holding the item's data.
+        """
+        return await getattr(self, get_endpoint(resource).getter_name)(item_id, fields=fields)
+
+    async def get_by_url(self, url: str) -> BaseModel:
+        """
+        Query the item an API url points to, as found in NamedAPIResource and APIResource
+        references, e.g. 'https://pokeapi.co/api/v2/pokemon/25/'.
+
+        Args:
+            url (str): the url of the item.
+
+        Returns:
+            An object of the endpoint's model class, holding the item's data.
+        """
+        resource, item_id = parse_resource_url(url)
+        return await self.get(resource, item_id)
+
+    async def expand(
+        self, model: BaseModel, paths: Optional[Sequence[str]] = None, depth: int = 1
+    ) -> Dict[str, BaseModel]:
+        """
+        Resolves the resources referenced by a model, level by level: the references found at
+        each level of the graph are gathered, deduplicated, and queried concurrently in a single
+        wave, and the models they resolve to make up the next level.
+
+            expanded = await client.expand(pokemon, paths=["moves.move", "types.type"])
+            first_move = expanded[pokemon.moves[0].move.url]
+
+        Args:
+            model (BaseModel): the model to expand.
+            paths (Optional[Sequence[str]]): dotted attribute paths to the references to follow,
+                                             e.g. 'moves.move'. They are applied at every level,
+                                             and ignored by models they do not apply to. If None,
+                                             all references are followed.
+            depth (int): the number of levels to expand.
+
+        Returns:
+            A dictionary of the resolved models, keyed by the url of their references. References
+            which could not be resolved are left out.
+        """
+        resolved: Dict[str, BaseModel] = {}
+        level_models: List[BaseModel] = [model]
+
+        for level in range(1, depth + 1):
+            urls: List[str] = list(
+                dict.fromkeys(
+                    url
+                    for level_model in level_models
+                    for url in collect_references(level_model, paths)
+                    if url not in resolved
+                )
+            )
+            if not urls:
+                break
+
+            logger.debug(f"Expanding level {level} of the graph: {len(urls)} references")
+            results: List[FetchResult] = await asyncio.gather(
+                *(self._fetch_url_result(url) for url in urls)
+            )
+            level_models = []
+            for url, result in zip(urls, results):
+                if result.ok:
+                    resolved[url] = result.model
+                    level_models.append(result.model)
+        return resolved
+
+    async def _fetch_url_result(self, url: str) -> FetchResult:
+        """Queries the item an url points to, capturing any error into its FetchResult."""
+        resource, item_id = parse_resource_url(url)
+        return await self._fetch_result(get_endpoint(resource), item_id)
+
+    def get_many(
+        self,
+        resource: str,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]:
+        """
+        Query several items of an endpoint concurrently, within the limit of the client's
+        semaphore. A failed query does not abort the batch: its error is reported in its result
+        instead. Results are either awaited all at once, in the same order as the identifiers:
+
+            results = await client.get_many("pokemon", [1, 2, "pikachu"])
+
+        or streamed as they complete:
+
+            async for result in client.get_many("pokemon", [1, 2, "pikachu"], stream=True):
+                ...
+
+        Args:
+            resource (str): the API resource name, e.g. 'pokemon-species'.
+            item_ids (Iterable[Union[str, int]]): the items' identifiers, either ID numbers or
+                                                  names.
+            stream (bool): whether to return an async iterator yielding results as they complete,
+                           instead of an awaitable of all results.
+            fields (Optional[Iterable[str]]): the names of the fields to get, for partial views
+                                              of the items. None means all of them.
+
+        Returns:
+            The FetchResult of each item, holding either its model object or the error raised
+            when querying it.
+        """
+        endpoint: Endpoint = get_endpoint(resource)
+        item_ids = list(item_ids)
+        logger.debug(f"Querying {len(item_ids)} {endpoint.label} items")
+
+        if stream:
+            return self._stream_many(endpoint, item_ids, fields)
+        return asyncio.gather(
+            *(self._fetch_result(endpoint, item_id, fields) for item_id in item_ids)
+        )
+
+    async def iter_resources(
+        self, resource: str, page_size: int = 20
+    ) -> AsyncIterator[Union[NamedAPIResource, APIResource]]:
+        """
+        Iterates over all items of an endpoint, as listed by the API, page by page. The next page
+        is fetched in the background while the current one is being consumed.
+
+        Args:
+            resource (str): the API resource name, e.g. 'pokemon-species'.
+            page_size (int): the number of items to request per page.
+
+        Returns:
+            An async iterator over the NamedAPIResource of each item, or its APIResource for
+            endpoints whose items have no name.
+        """
+        endpoint: Endpoint = get_endpoint(resource)
+        page_url: str = self.format_list_url(item_type=endpoint.name, limit=page_size)
+
+        next_page: Optional[asyncio.Future] = asyncio.ensure_future(
+            self._get_page(endpoint, page_url)
+        )
+        try:
+            while next_page is not None:
+                page: Union[NamedAPIResourceList, APIResourceList] = await next_page
+                next_page = (
+                    asyncio.ensure_future(self._get_page(endpoint, page.next))
+                    if page.next
+                    else None
+                )
+                for reference in page.results:
+                    yield reference
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def iter_models(self, resource: str, page_size: int = 20) -> AsyncIterator[BaseModel]:
+        """
+        Iterates over the model objects of all items of an endpoint, in the order listed by the
+        API. Items are queried ahead of consumption, within the limit of the client's semaphore.
+
+        Args:
+            resource (str): the API resource name, e.g. 'pokemon-species'.
+            page_size (int): the number of items to request per page of the list endpoint.
+
+        Returns:
+            An async iterator over the model object of each item.
+        """
+        endpoint: Endpoint = get_endpoint(resource)
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            async for reference in self.iter_resources(endpoint.name, page_size=page_size):
+                _, item_id = parse_resource_url(reference.url)
+                pending.append(asyncio.ensure_future(self.get(endpoint.name, item_id)))
+                if len(pending) > 2 * self.max_concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get_page(
+        self, endpoint: Endpoint, page_url: str
+    ) -> Union[NamedAPIResourceList, APIResourceList]:
+        """Queries a page of an endpoint's list, learning the aliases of the listed items."""
+        return self._parse_page(endpoint, await self._request(endpoint, page_url))
+
+    async def _stream_many(
+        self,
+        endpoint: Endpoint,
+        item_ids: List[Union[str, int]],
+        fields: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[FetchResult]:
+        """Yields the FetchResult of each item as soon as its query completes."""
+        tasks = [
+            asyncio.ensure_future(self._fetch_result(endpoint, item_id, fields))
+            for item_id in item_ids
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_result(
+        self,
+        endpoint: Endpoint,
+        item_id: Union[str, int],
+        fields: Optional[Iterable[str]] = None,
+    ) -> FetchResult:
+        """Queries a single item of a batch, capturing any error into its FetchResult."""
+        try:
+            return FetchResult(
+                item_id, await self.get(endpoint.name, item_id, fields=fields), None
+            )
+        except Exception as error:
+            logger.warning(f"Query for {endpoint.label} with ID '{item_id}' failed: {error}")
+            return FetchResult(item_id, None, error)
+
+
+def _make_getter(endpoint: Endpoint) -> Callable:
+    async def getter(
+        self: AsyncPokeClient, item_id: Union[str, int], fields: Optional[Iterable[str]] = None
+    ) -> BaseModel:
+        return await self._get_resource(endpoint, item_id, fields)
+
+    getter.__annotations__["return"] = endpoint.model
+    return getter
+
+
+def _make_batch_getter(endpoint: Endpoint) -> Callable:
+    def batch_getter(
+        self: AsyncPokeClient,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]:
+        return self.get_many(endpoint.name, item_ids, stream=stream, fields=fields)
+
+    return batch_getter
+
+
+bind_endpoint_methods(AsyncPokeClient, _make_getter, _make_batch_getter)
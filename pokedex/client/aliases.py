@@ -0,0 +1,75 @@
+"""
+Name and ID aliases of the API resources. Most items can be queried either by ID number or by
+name, and resolving both to a canonical ID lets them share the same cache entries and requests.
+"""
+
+import threading
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+from loguru import logger
+
+from pokedex.client.endpoints import parse_resource_url
+
+
+class AliasTable:
+    """
+    A name <-> ID mapping for each endpoint, learned from the items queried by a client as well
+    as from the API's list endpoints.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, Dict[str, int]] = {}
+        self._names: Dict[str, Dict[int, str]] = {}
+
+    def canonical(self, endpoint: str, item_id: Union[str, int]) -> Union[str, int]:
+        """
+        Normalizes an identifier to the item's ID number whenever it is known, so that e.g. 25,
+        '25' and 'pikachu' all resolve to the same key.
+
+        Args:
+            endpoint (str): the API resource name the item belongs to.
+            item_id (Union[str, int]): the item's identifier, either its ID number or its name.
+
+        Returns:
+            The item's ID number if it could be resolved, otherwise the provided name.
+        """
+        if isinstance(item_id, int):
+            return item_id
+        if item_id.isdecimal():  # unlike isdigit, rejects digits int() can't parse, e.g. '²'
+            return int(item_id)
+        return self._ids.get(endpoint, {}).get(item_id, item_id)
+
+    def name(self, endpoint: str, item_id: int) -> Optional[str]:
+        """Returns the known name of an endpoint's item from its ID number, if any."""
+        return self._names.get(endpoint, {}).get(item_id)
+
+    def learn(self, endpoint: str, item_id: int, name: str) -> None:
+        """
+        Records that the given name and ID number designate the same item of an endpoint.
+
+        Args:
+            endpoint (str): the API resource name the item belongs to.
+            item_id (int): the item's ID number.
+            name (str): the item's name.
+        """
+        with self._lock:
+            self._ids.setdefault(endpoint, {})[name] = item_id
+            self._names.setdefault(endpoint, {})[item_id] = name
+
+    def learn_resources(self, resources: Iterable[Mapping[str, str]]) -> None:
+        """
+        Records the aliases designated by named resource references, as found in the results of
+        the API's list endpoints, e.g. {'name': 'pikachu', 'url': '.../pokemon/25/'}.
+
+        Args:
+            resources (Iterable[Mapping[str, str]]): the references, with 'name' and 'url' keys.
+        """
+        learned: int = 0
+        for resource in resources:
+            if not resource.get("name"):
+                continue
+            endpoint, item_id = parse_resource_url(resource["url"])
+            self.learn(endpoint, item_id, resource["name"])
+            learned += 1
+        logger.trace(f"Learned {learned} aliases from resource references")
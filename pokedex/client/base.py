@@ -0,0 +1,237 @@
+"""
+Behaviour shared by the synchronous and asynchronous clients, which only differ in how they send
+their requests to the API.
+"""
+
+from typing import Any, Hashable, Iterable, Optional, Tuple, Union
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pokedex.client.aliases import AliasTable
+from pokedex.client.construction import (
+    check_fields,
+    construct_model,
+    defer_model,
+    project_model,
+    share_references,
+)
+from pokedex.client.decoding import Decoder, get_decoder
+from pokedex.client.endpoints import Endpoint
+from pokedex.client.pruning import Scope, prune
+from pokedex.models.resource import APIResourceList, NamedAPIResourceList
+
+
+class BaseClient:
+    """
+    Common base to the PokeAPI clients, holding the API location as well as the helpers to build
+    and validate queries. Identifiers are resolved to canonical ID numbers through an AliasTable,
+    learned from the queried items, so that queries by name and by ID share their cache entries.
+    Response bodies are decoded with the fastest JSON library available, see `get_decoder`. In
+    lazy mode, the heavy sub-collections of large models, such as a Pokémon's moves, are only
+    parsed on first access, see `LazyModel`. The resource references of built models are shared
+    with all other models holding identical ones, see `intern_resource`, and can be held in
+    compact records, see `pokedex.models.compact`. Clients scoped to some languages, or to a
+    version group, drop the localized and per-game entries of the other ones before building
+    models, see `prune`.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://pokeapi.co/api/v2/",
+        decoder: Union[str, Decoder, None] = None,
+        lazy: bool = False,
+        intern_resources: bool = True,
+        compact: bool = False,
+        languages: Optional[Iterable[str]] = None,
+        version_group: Optional[Union[str, int]] = None,
+    ):
+        self.base_url: str = base_url
+        self.aliases: AliasTable = AliasTable()
+        self.decode: Decoder = get_decoder(decoder)
+        self.lazy: bool = lazy
+        self.intern_resources: bool = intern_resources
+        self.compact: bool = compact
+        self.scope: Scope = {}
+        if languages is not None:
+            self.scope["language"] = frozenset(languages)
+        self.version_group: Optional[Union[str, int]] = version_group
+
+    def format_query_url(self, item_id: Union[str, int], item_type: str) -> str:
+        """
+        Returns the PokeAPI url to send a GET request to for a specific pokemon's information.
+
+        Args:
+            item_id (Union[str, int]): the item's identifier, either its ID number or its name.
+            item_type (str): the item's type, either a pokemon or a berry, etc.
+
+        Returns:
+            The proper url to send a GET request to.
+        """
+        logger.trace(f"Formatting query url for item_attribute_id '{item_id}'")
+        return f"{self.base_url.rstrip('/')}/{item_type}/{item_id}/"
+
+    def format_list_url(self, item_type: str, limit: int = 20, offset: int = 0) -> str:
+        """
+        Returns the PokeAPI url to send a GET request to for a page of an endpoint's items.
+
+        Args:
+            item_type (str): the item's type, either a pokemon or a berry, etc.
+            limit (int): the number of items in the page.
+            offset (int): the number of items before the page.
+
+        Returns:
+            The proper url to send a GET request to.
+        """
+        return f"{self.base_url.rstrip('/')}/{item_type}/?limit={limit}&offset={offset}"
+
+    @staticmethod
+    def validate_id(provided_id: Union[str, int]) -> None:
+        """
+        Checks the validity of the provided ID for use in PokeAPI: should be integer or string.
+
+        Args:
+            provided_id (Union[str, int]): the identifier to use in a query.
+
+        Returns:
+            Nothing, but will raise a TypeError if validation is unsuccessful.
+        """
+        if not (isinstance(provided_id, str) or isinstance(provided_id, int)):
+            logger.error(
+                f"The provided pokemon ID is of type '{type(provided_id)}' but should be "
+                f"either 'int' or 'string'"
+            )
+            raise TypeError("Invalid type for provided ID, should be either 'integer' or 'string'.")
+
+    @staticmethod
+    def _check_fields(
+        endpoint: Endpoint, fields: Optional[Iterable[str]]
+    ) -> Optional[Tuple[str, ...]]:
+        """Normalizes the fields requested for a partial view, None meaning the whole model."""
+        return check_fields(endpoint.model, fields) if fields is not None else None
+
+    @staticmethod
+    def _cache_key(key: Union[str, int], fields: Optional[Tuple[str, ...]]) -> Hashable:
+        """Returns the key to cache a model object under, partial views having their own."""
+        return key if fields is None else (key, fields)
+
+    def _validates_fully(self, endpoint: Endpoint, fields: Optional[Tuple[str, ...]]) -> bool:
+        """
+        Whether `_parse_model` validates all of an item's data, rather than only a partial view
+        of it, the entries left after pruning it to the client's scope, or the fields not
+        deferred by lazy parsing.
+        """
+        return (
+            fields is None
+            and not self.scope
+            and not (self.lazy and getattr(endpoint.model, "__lazy_fields__", None))
+        )
+
+    def _needs_versions(self, endpoint: Endpoint) -> bool:
+        """
+        Whether the scoped version group has to be queried before parsing an item of the provided
+        endpoint, to match the item's per-game entries against its versions.
+        """
+        return (
+            self.version_group is not None
+            and "version_group" not in self.scope
+            and endpoint.name != "version-group"
+        )
+
+    def _scope_versions(self, version_group: BaseModel) -> None:
+        """Scopes the per-game entries of items to the provided VersionGroup and its versions."""
+        versions = frozenset(version.name for version in version_group.versions)
+        logger.debug(f"Scoping items to version group '{version_group.name}': {sorted(versions)}")
+        self.scope = {
+            **self.scope,
+            "version_group": frozenset((version_group.name,)),
+            "version": versions,
+        }
+
+    def _parse_model(
+        self,
+        endpoint: Endpoint,
+        content: bytes,
+        trusted: bool = False,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Tuple[BaseModel, int]:
+        """
+        Decodes the raw data of an item, drops the entries out of the client's scope, and
+        organises it in the endpoint's model class.
+
+        Args:
+            endpoint (Endpoint): the registered endpoint the item belongs to.
+            content (bytes): the raw data of the item.
+            trusted (bool): whether the data was already validated, in which case the model
+                            object is constructed without validating it again.
+            fields (Optional[Tuple[str, ...]]): the fields to build a partial view with, as
+                                                returned by `_check_fields`. None means all of
+                                                them.
+
+        Returns:
+            An object of the endpoint's model class holding the item's data, and the size in
+            bytes of the data it holds, to account for in the in-memory cache.
+        """
+        data: Any = self.decode(content)
+        # The cached size is estimated by scaling the raw length to the share of the data kept,
+        # as measuring what is left would cost as much as building the model again
+        share: float = prune(endpoint.model, data, self.scope) if self.scope else 1.0
+        intern: bool = self.intern_resources
+        compact: bool = self.compact
+        logger.trace(f"Formatting {endpoint.label} data into {endpoint.model.__name__} object")
+        if fields is not None:
+            model: BaseModel = project_model(
+                endpoint.model, data, fields, trusted=trusted, intern=intern, compact=compact
+            )
+            aliases = [endpoint.model.__fields__[name].alias for name in fields]
+            share *= _weight(data.get(alias) for alias in aliases) / _weight(data.values())
+            return model, int(len(content) * share)
+        if self.lazy and getattr(endpoint.model, "__lazy_fields__", None):
+            model = defer_model(
+                endpoint.model, data, trusted=trusted, intern=intern, compact=compact
+            )
+        elif trusted:
+            model = construct_model(endpoint.model, data, intern=intern, compact=compact)
+        else:
+            model = share_references(endpoint.model(**data), intern, compact)
+        return model, int(len(content) * share)
+
+    def _parse_page(
+        self, endpoint: Endpoint, content: bytes
+    ) -> Union[NamedAPIResourceList, APIResourceList]:
+        """Decodes the raw data of a page of an endpoint's list, learning the listed aliases."""
+        data: Any = self.decode(content)
+        if endpoint.named:
+            self.aliases.learn_resources(data["results"])
+            return NamedAPIResourceList(**data)
+        return APIResourceList(**data)
+
+    def _learn_aliases(
+        self, endpoint: Endpoint, model: BaseModel, key: Union[str, int]
+    ) -> Union[str, int]:
+        """
+        Records the name and ID number of a queried item, and returns the canonical key to cache
+        its model object under.
+
+        Args:
+            endpoint (Endpoint): the registered endpoint the item belongs to.
+            model (BaseModel): the model object of the item.
+            key (Union[str, int]): the key the item was queried with.
+
+        Returns:
+            The item's ID number if it has one, otherwise the provided key.
+        """
+        item_id = getattr(model, "id", None)
+        name = getattr(model, "name", None)
+        if isinstance(item_id, int) and isinstance(name, str):
+            self.aliases.learn(endpoint.name, item_id, name)
+        return item_id if isinstance(item_id, int) else key
+
+
+def _weight(values: Iterable[Any]) -> int:
+    """
+    Returns a rough weight of the provided values of an item's fields, to estimate the share of
+    its data they hold: the length of lists, whose entries hold the bulk of the data, and one
+    for any other value.
+    """
+    return max(1, sum(len(value) if isinstance(value, list) and value else 1 for value in values))
@@ -0,0 +1,201 @@
+"""
+In-memory cache of the model objects queried by a client. It is owned by the client instance, so
+that it goes away with it, and its budget is expressed in bytes rather than in a number of
+entries, as some models are orders of magnitude bigger than others.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel
+
+_CacheKey = Tuple[str, Hashable]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, either for a single endpoint or aggregated over all of them."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_size: Optional[int]
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _EndpointStats:
+    __slots__ = ("hits", "misses", "evictions", "size")
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.size: int = 0
+
+
+class CacheManager:
+    """
+    A least-recently-used cache of model objects, bounded by a memory budget in bytes shared by
+    all endpoints. Each endpoint can additionally be given its own budget, within the shared one,
+    and a budget of 0 disables caching for that endpoint.
+
+    The size of an entry is approximated by the size of the raw response it was built from, which
+    scales with the size of the resulting model object.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 64 * 1024 ** 2,
+        endpoint_max_sizes: Optional[Dict[str, Optional[int]]] = None,
+    ):
+        """
+        Args:
+            max_size (Optional[int]): the memory budget, in bytes, for all endpoints. None means
+                                      the cache is unbounded.
+            endpoint_max_sizes (Optional[Dict[str, Optional[int]]]): per-endpoint budgets, in
+                                                                     bytes, e.g. {'pokemon': 0}.
+        """
+        self.max_size: Optional[int] = max_size
+        self.endpoint_max_sizes: Dict[str, Optional[int]] = dict(endpoint_max_sizes or {})
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_CacheKey, Tuple[BaseModel, int]]" = OrderedDict()
+        self._endpoint_entries: Dict[str, "OrderedDict[Hashable, None]"] = {}
+        self._stats: Dict[str, _EndpointStats] = {}
+        self._size: int = 0
+
+    def get(self, endpoint: str, key: Hashable) -> Optional[BaseModel]:
+        """
+        Fetch a cached model, marking it as recently used.
+
+        Args:
+            endpoint (str): the API resource name the model belongs to.
+            key (Hashable): the identifier the model was cached under.
+
+        Returns:
+            The cached model, or None if it is not in the cache.
+        """
+        with self._lock:
+            stats: _EndpointStats = self._endpoint_stats(endpoint)
+            entry = self._entries.get((endpoint, key))
+            if entry is None:
+                stats.misses += 1
+                return None
+            stats.hits += 1
+            self._entries.move_to_end((endpoint, key))
+            self._endpoint_entries[endpoint].move_to_end(key)
+            return entry[0]
+
+    def set(self, endpoint: str, key: Hashable, value: BaseModel, size: int) -> None:
+        """
+        Cache a model, then evict the least recently used entries until the cache fits both its
+        own and the endpoint's budget again.
+
+        Args:
+            endpoint (str): the API resource name the model belongs to.
+            key (Hashable): the identifier to cache the model under.
+            value (BaseModel): the model to cache.
+            size (int): the approximate size of the model, in bytes.
+        """
+        endpoint_max_size: Optional[int] = self.endpoint_max_sizes.get(endpoint, self.max_size)
+        budgets = (endpoint_max_size, self.max_size)
+        if any(budget is not None and size > budget for budget in budgets):
+            logger.trace(f"Not caching {endpoint} '{key}' as it exceeds the cache's budget")
+            return
+
+        with self._lock:
+            self._discard(endpoint, key)
+            stats: _EndpointStats = self._endpoint_stats(endpoint)
+            self._entries[(endpoint, key)] = (value, size)
+            self._endpoint_entries.setdefault(endpoint, OrderedDict())[key] = None
+            stats.size += size
+            self._size += size
+
+            while endpoint_max_size is not None and stats.size > endpoint_max_size:
+                oldest_key = next(iter(self._endpoint_entries[endpoint]))
+                self._discard(endpoint, oldest_key)
+                stats.evictions += 1
+            while self.max_size is not None and self._size > self.max_size:
+                oldest_endpoint, oldest_key = next(iter(self._entries))
+                self._discard(oldest_endpoint, oldest_key)
+                self._stats[oldest_endpoint].evictions += 1
+
+    def invalidate(self, endpoint: Optional[str] = None, key: Optional[Hashable] = None) -> None:
+        """
+        Removes cached models: a specific one, all of an endpoint's, or everything if no endpoint
+        is given. Statistics are kept.
+
+        Args:
+            endpoint (Optional[str]): the API resource name whose models to remove.
+            key (Optional[Hashable]): the identifier of the model to remove, within the endpoint.
+                                      The partial views of the model, cached under a (key,
+                                      fields) tuple, are removed along with it.
+        """
+        with self._lock:
+            if endpoint is None:
+                logger.debug("Invalidating all cached models")
+                keys = list(self._entries)
+            elif key is None:
+                logger.debug(f"Invalidating all cached {endpoint} models")
+                keys = [(endpoint, key) for key in self._endpoint_entries.get(endpoint, ())]
+            else:
+                keys = [
+                    (endpoint, cached_key)
+                    for cached_key in self._endpoint_entries.get(endpoint, ())
+                    if cached_key == key
+                    or (isinstance(cached_key, tuple) and cached_key[:1] == (key,))
+                ]
+            for cached_endpoint, cached_key in keys:
+                self._discard(cached_endpoint, cached_key)
+
+    def cache_info(self, endpoint: Optional[str] = None) -> CacheInfo:
+        """
+        Returns the statistics of the cache, either for the given endpoint or aggregated over all
+        of them.
+
+        Args:
+            endpoint (Optional[str]): the API resource name to get statistics for.
+
+        Returns:
+            A CacheInfo tuple with the hits, misses, evictions, number of entries, size and
+            maximum size of the cache.
+        """
+        with self._lock:
+            if endpoint is not None:
+                stats: _EndpointStats = self._stats.get(endpoint, _EndpointStats())
+                return CacheInfo(
+                    stats.hits,
+                    stats.misses,
+                    stats.evictions,
+                    len(self._endpoint_entries.get(endpoint, ())),
+                    stats.size,
+                    self.endpoint_max_sizes.get(endpoint, self.max_size),
+                )
+            return CacheInfo(
+                sum(stats.hits for stats in self._stats.values()),
+                sum(stats.misses for stats in self._stats.values()),
+                sum(stats.evictions for stats in self._stats.values()),
+                len(self._entries),
+                self._size,
+                self.max_size,
+            )
+
+    def _endpoint_stats(self, endpoint: str) -> _EndpointStats:
+        if endpoint not in self._stats:
+            self._stats[endpoint] = _EndpointStats()
+        return self._stats[endpoint]
+
+    def _discard(self, endpoint: str, key: Hashable) -> None:
+        """Removes an entry from the cache, if present. Should be called with the lock held."""
+        entry = self._entries.pop((endpoint, key), None)
+        if entry is None:
+            return
+        del self._endpoint_entries[endpoint][key]
+        self._stats[endpoint].size -= entry[1]
+        self._size -= entry[1]
@@ -0,0 +1,374 @@
+"""
+Construction of model objects without validation, for data which has already been validated once,
+such as the items stored in a snapshot or in the disk cache. Nested models are constructed
+recursively from the models' field definitions, while other values are kept as decoded.
+
+Model objects can also be built as partial views, holding only some of their fields, in which case
+only the data of these fields is validated or constructed, or with their heavy sub-collections
+deferred until first accessed.
+
+When interning is requested, the NamedAPIResource and APIResource objects of the built models are
+replaced by shared instances, see `intern_resource`. When compaction is requested, the objects of
+the most repeated model classes are replaced by compact records, see `pokedex.models.compact`.
+"""
+
+import functools
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Type, Union
+
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+from pokedex.models.commons import APIResource, NamedAPIResource, intern_resource
+from pokedex.models.compact import COMPACT_CLASSES, CompactRecord, intern_record
+from pokedex.models.lazy import LazyModel
+
+# Fields always included in partial views whenever a model has them, as they identify the item
+_IDENTIFYING_FIELDS = ("id", "name")
+
+_VALUE, _MODEL, _MODEL_LIST, _OTHER = range(4)
+
+_RESOURCE_CLASSES = (NamedAPIResource, APIResource)
+
+
+class _Plan(NamedTuple):
+    """How to construct the objects of a model class, worked out once per class."""
+
+    # For each field: its name, the key its value is found under in the data, how to construct
+    # it, the nested model class if any, and the field itself for values left to pydantic.
+    fields: List[Tuple[str, str, int, Optional[Type[BaseModel]], ModelField]]
+    # The fields not required in the data, which get their default when missing.
+    defaults: List[Tuple[str, ModelField]]
+    has_private_attributes: bool
+
+
+def construct_model(
+    model_class: Type[BaseModel],
+    data: Mapping[str, Any],
+    intern: bool = False,
+    compact: bool = False,
+) -> Union[BaseModel, CompactRecord]:
+    """
+    Builds a model object from trusted data, constructing nested models recursively instead of
+    validating them. Keys not matching any field are ignored, and missing fields get their default,
+    as with regular validation.
+
+    Args:
+        model_class (Type[BaseModel]): the model class to build an object of.
+        data (Mapping[str, Any]): the decoded data of the object, e.g. an API response.
+        intern (bool): whether to use shared instances of the resource references.
+        compact (bool): whether to build compact records for the model classes having some.
+
+    Returns:
+        An object of the provided model class, or its compact record, holding the data.
+    """
+    if compact and model_class in COMPACT_CLASSES:
+        return _construct_record(model_class, data, intern)
+    plan: _Plan = _plan(model_class)
+    values: Dict[str, Any] = {}
+    for name, key, kind, nested_class, field in plan.fields:
+        if key not in data:
+            continue
+        value = data[key]
+        if value is None or kind == _VALUE:
+            values[name] = value
+        elif kind == _MODEL:
+            values[name] = construct_model(nested_class, value, intern, compact)
+        elif kind == _MODEL_LIST:
+            values[name] = [
+                construct_model(nested_class, item, intern, compact) if item is not None else None
+                for item in value
+            ]
+        else:
+            values[name], _ = field.validate(value, values, loc=name, cls=model_class)
+
+    # Same as BaseModel.construct, without going over the fields a second time
+    fields_set = set(values)
+    for name, field in plan.defaults:
+        if name not in values:
+            values[name] = field.get_default()
+    model = model_class.__new__(model_class)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__fields_set__", fields_set)
+    if plan.has_private_attributes:
+        model._init_private_attributes()
+    if intern and model_class in _RESOURCE_CLASSES:
+        return intern_resource(model)
+    return model
+
+
+def _construct_record(
+    model_class: Type[BaseModel], data: Mapping[str, Any], intern: bool
+) -> CompactRecord:
+    """Builds the compact record of a model class from trusted data."""
+    values: List[Any] = []
+    for name, key, kind, nested_class, field in _plan(model_class).fields:
+        value = data.get(key)
+        if value is None or kind == _VALUE:
+            pass
+        elif kind == _MODEL:
+            value = construct_model(nested_class, value, intern, True)
+        elif kind == _MODEL_LIST:
+            value = tuple(
+                construct_model(nested_class, item, intern, True) if item is not None else None
+                for item in value
+            )
+        else:
+            value, _ = field.validate(value, {}, loc=name, cls=model_class)
+        values.append(value)
+    record: CompactRecord = COMPACT_CLASSES[model_class](*values)
+    return intern_record(record) if intern and model_class in _RESOURCE_CLASSES else record
+
+
+def compact_references(value: Any, intern: bool = False) -> Any:
+    """
+    Replaces, in place, the objects held by a model object which have a compact record class,
+    at any depth, by their compact records. This is meant for models built with validation, as
+    `construct_model` can build compact records right away.
+
+    Args:
+        value (Any): a model object, or a list of them.
+        intern (bool): whether to use shared instances of the resource references.
+
+    Returns:
+        The provided value, or its compact record if it has one itself.
+    """
+    if isinstance(value, BaseModel):
+        if type(value) in COMPACT_CLASSES:
+            record: CompactRecord = COMPACT_CLASSES[type(value)](
+                *(
+                    tuple(compact_references(item, intern) for item in field_value)
+                    if isinstance(field_value, list)
+                    else compact_references(field_value, intern)
+                    for field_value in (getattr(value, name) for name in value.__fields__)
+                )
+            )
+            return intern_record(record) if intern and type(value) in _RESOURCE_CLASSES else record
+        values = value.__dict__
+        for name, item in values.items():
+            if isinstance(item, (BaseModel, list)):
+                values[name] = compact_references(item, intern)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (BaseModel, list)):
+                value[index] = compact_references(item, intern)
+    return value
+
+
+def share_references(value: Any, intern: bool = False, compact: bool = False) -> Any:
+    """
+    Interns or compacts, in place, the objects held by a model object built with validation, see
+    `intern_references` and `compact_references`.
+
+    Args:
+        value (Any): a model object, or a list of them.
+        intern (bool): whether to use shared instances of the resource references.
+        compact (bool): whether to use compact records for the model classes having some.
+
+    Returns:
+        The provided value, or its replacement if it is interned or compacted itself.
+    """
+    if compact:
+        return compact_references(value, intern)
+    if intern:
+        return intern_references(value)
+    return value
+
+
+def intern_references(value: Any) -> Any:
+    """
+    Replaces, in place, the NamedAPIResource and APIResource objects held by a model object, at
+    any depth, by their shared instances. This is meant for models built with validation, as
+    `construct_model` can intern references while building them.
+
+    Args:
+        value (Any): a model object, or a list of them.
+
+    Returns:
+        The provided value, or the shared instance of it if it is a resource reference itself.
+    """
+    if isinstance(value, _RESOURCE_CLASSES):
+        return intern_resource(value)
+    if isinstance(value, BaseModel):
+        values = value.__dict__
+        for name, item in values.items():
+            if isinstance(item, (BaseModel, list)):
+                values[name] = intern_references(item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (BaseModel, list)):
+                value[index] = intern_references(item)
+    return value
+
+
+def check_fields(model_class: Type[BaseModel], fields: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Checks that the provided field names exist in a model class, and normalizes them to the sorted
+    tuple of field names a partial view holds, including the identifying 'id' and 'name' fields
+    whenever the model has them.
+
+    Args:
+        model_class (Type[BaseModel]): the model class to build partial views of.
+        fields (Iterable[str]): the names of the fields to include in the partial views.
+
+    Returns:
+        A sorted tuple of field names, but will raise a ValueError if any field is unknown.
+    """
+    fields = set(fields)
+    unknown = fields.difference(model_class.__fields__)
+    if unknown:
+        logger.error(f"Unknown fields {sorted(unknown)} for model '{model_class.__name__}'")
+        raise ValueError(
+            f"Unknown fields {sorted(unknown)} for model '{model_class.__name__}', should be among "
+            f"{list(model_class.__fields__)}."
+        )
+    fields.update(name for name in _IDENTIFYING_FIELDS if name in model_class.__fields__)
+    return tuple(sorted(fields))
+
+
+def project_model(
+    model_class: Type[BaseModel],
+    data: Mapping[str, Any],
+    fields: Iterable[str],
+    trusted: bool = False,
+    intern: bool = False,
+    compact: bool = False,
+) -> BaseModel:
+    """
+    Builds a partial view of a model object, holding only the provided fields. The data of these
+    fields only is validated, or constructed if trusted, and the other fields are left unset.
+
+    Args:
+        model_class (Type[BaseModel]): the model class to build an object of.
+        data (Mapping[str, Any]): the decoded data of the object, e.g. an API response.
+        fields (Iterable[str]): the names of the fields to include, as returned by `check_fields`.
+        trusted (bool): whether the data was already validated, in which case the fields are
+                        constructed without validating them.
+        intern (bool): whether to use shared instances of the resource references.
+        compact (bool): whether to use compact records for the model classes having some.
+
+    Returns:
+        An object of the provided model class holding the provided fields, but will raise a
+        ValidationError if any of their data is invalid.
+    """
+    model_fields: Dict[str, ModelField] = model_class.__fields__
+    if trusted:
+        return construct_model(
+            model_class,
+            {
+                model_fields[name].alias: data[model_fields[name].alias]
+                for name in fields
+                if model_fields[name].alias in data
+            },
+            intern,
+            compact,
+        )
+
+    values: Dict[str, Any] = {}
+    errors: List[ErrorWrapper] = []
+    for name in fields:
+        field: ModelField = model_fields[name]
+        if field.alias not in data:
+            if field.required:
+                errors.append(ErrorWrapper(MissingError(), loc=field.alias))
+            else:
+                values[name] = field.get_default()
+            continue
+        value, error = field.validate(data[field.alias], values, loc=field.alias, cls=model_class)
+        if error:
+            errors.append(error)
+        else:
+            values[name] = share_references(value, intern, compact)
+    if errors:
+        raise ValidationError(errors, model_class)
+    return model_class.construct(_fields_set=set(values), **values)
+
+
+def defer_model(
+    model_class: Type[LazyModel],
+    data: Mapping[str, Any],
+    trusted: bool = False,
+    intern: bool = False,
+    compact: bool = False,
+) -> LazyModel:
+    """
+    Builds a model object whose heavy sub-collections, as listed in its class' `__lazy_fields__`,
+    are only validated, or constructed if trusted, on first access. Until then they hold their
+    decoded data. The other fields are built right away.
+
+    Args:
+        model_class (Type[LazyModel]): the model class to build an object of.
+        data (Mapping[str, Any]): the decoded data of the object, e.g. an API response.
+        trusted (bool): whether the data was already validated, in which case the fields are
+                        constructed without validating them.
+        intern (bool): whether to use shared instances of the resource references.
+        compact (bool): whether to use compact records for the model classes having some.
+
+    Returns:
+        An object of the provided model class, holding the data. Errors in the data of deferred
+        fields are only raised when accessing them.
+    """
+    lazy_fields: Tuple[str, ...] = model_class.__lazy_fields__
+    eager_fields = [name for name in model_class.__fields__ if name not in lazy_fields]
+    model: LazyModel = project_model(
+        model_class, data, eager_fields, trusted=trusted, intern=intern, compact=compact
+    )
+
+    loaders = {}
+    for name in lazy_fields:
+        alias: str = model_class.__fields__[name].alias
+        raw = {alias: data[alias]} if alias in data else {}
+        loaders[name] = functools.partial(
+            _load_field, model_class, name, raw, trusted, intern, compact
+        )
+        if raw:
+            model.__fields_set__.add(name)
+    model.defer(loaders)
+    return model
+
+
+def _load_field(
+    model_class: Type[BaseModel],
+    name: str,
+    data: Mapping[str, Any],
+    trusted: bool,
+    intern: bool,
+    compact: bool,
+) -> Any:
+    """Builds the value of a single field of a model object from its data."""
+    model: BaseModel = project_model(
+        model_class, data, (name,), trusted=trusted, intern=intern, compact=compact
+    )
+    return model.__dict__.get(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _plan(model_class: Type[BaseModel]) -> _Plan:
+    """Works out how to construct each field of a model class."""
+    fields = []
+    for name, field in model_class.__fields__.items():
+        nested_class: Optional[Type[BaseModel]] = (
+            field.type_
+            if isinstance(field.type_, type) and issubclass(field.type_, BaseModel)
+            else None
+        )
+        if field.sub_fields and field.shape == SHAPE_SINGLETON:
+            kind = _OTHER  # unions are left to pydantic to pick the right member
+        elif nested_class is None:
+            kind = _VALUE
+        elif field.shape == SHAPE_SINGLETON:
+            kind = _MODEL
+        elif field.shape == SHAPE_LIST:
+            kind = _MODEL_LIST
+        else:
+            kind = _OTHER
+        fields.append((name, field.alias, kind, nested_class, field))
+    return _Plan(
+        fields=fields,
+        defaults=[
+            (name, field) for name, field in model_class.__fields__.items() if not field.required
+        ],
+        has_private_attributes=bool(model_class.__private_attributes__),
+    )
@@ -0,0 +1,57 @@
+"""
+Decoders turning the raw bytes of API responses into the Python objects models are built from.
+The fastest JSON library available is used by default: 'orjson', then 'ujson', then the standard
+library's 'json'. The faster ones are installable with the 'fast' extra.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+from loguru import logger
+
+Decoder = Callable[[bytes], Any]
+
+_DECODERS: Dict[str, Optional[Decoder]] = {"json": json.loads}
+
+try:
+    import orjson
+
+    _DECODERS["orjson"] = orjson.loads
+except ImportError:  # pragma: no cover
+    _DECODERS["orjson"] = None
+
+try:
+    import ujson
+
+    _DECODERS["ujson"] = ujson.loads
+except ImportError:  # pragma: no cover
+    _DECODERS["ujson"] = None
+
+_PREFERENCE = ("orjson", "ujson", "json")
+
+
+def get_decoder(decoder: Union[str, Decoder, None] = None) -> Decoder:
+    """
+    Returns the function to decode the raw bytes of responses with.
+
+    Args:
+        decoder (Union[str, Decoder, None]): either the name of a JSON library among 'orjson',
+                                             'ujson' and 'json', a callable taking bytes, or None
+                                             to pick the fastest library available.
+
+    Returns:
+        A callable decoding bytes, but will raise a ValueError if the named library is not
+        supported, or an ImportError if it is not installed.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        decoder = next(name for name in _PREFERENCE if _DECODERS[name] is not None)
+        logger.trace(f"Decoding responses with '{decoder}'")
+    if decoder not in _DECODERS:
+        logger.error(f"Unsupported decoder '{decoder}'")
+        raise ValueError(f"Unsupported decoder '{decoder}', should be one of {list(_PREFERENCE)}.")
+    if _DECODERS[decoder] is None:
+        logger.error(f"Decoder '{decoder}' is not installed")
+        raise ImportError(f"Decoder '{decoder}' is not installed, install it with the 'fast' extra")
+    return _DECODERS[decoder]
@@ -0,0 +1,269 @@
+"""
+Persistent cache of raw API responses, stored in an SQLite database so that it survives restarts
+and can be shared by several processes on the same host.
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+
+from loguru import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    content BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    validated INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint);
+-- Running total of the stored sizes, kept up to date by triggers so that every process sharing
+-- the database sees the same, without summing over all responses on each write
+CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL);
+INSERT OR IGNORE INTO totals SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_inserted AFTER INSERT ON responses BEGIN
+    UPDATE totals SET size = size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_deleted AFTER DELETE ON responses BEGIN
+    UPDATE totals SET size = size - OLD.size;
+END;
+"""
+
+
+class CachedResponse(NamedTuple):
+    """A response body stored in the cache, along with its HTTP validators."""
+
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: Optional[float]
+    # Whether the body was successfully parsed into a fully validated model once
+    validated: bool = False
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the response can be served without revalidating it against the API."""
+        return self.expires_at is None or self.expires_at > time.time()
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """The headers to send for a conditional GET revalidating this response."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """
+    An SQLite-backed store of compressed API responses. Entries expire after a time-to-live which
+    can be set per endpoint, after which they are revalidated with a conditional GET instead of
+    being downloaded again. Once the stored data exceeds the maximum size, the least recently
+    accessed entries are evicted.
+
+    The database runs in WAL mode, so that several processes on the same host can read from and
+    write to the same cache file concurrently.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        default_ttl: Optional[float] = 86400.0,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        max_size: Optional[int] = 512 * 1024 ** 2,
+        compression_level: int = 6,
+    ):
+        """
+        Args:
+            path (Union[str, Path]): location of the SQLite database file, created if needed.
+            default_ttl (Optional[float]): seconds for which a stored response is considered fresh.
+                                           None means responses never expire.
+            ttls (Optional[Dict[str, Optional[float]]]): per-endpoint overrides of the default
+                                                         time-to-live, e.g. {'pokemon': 3600}.
+            max_size (Optional[int]): maximum size in bytes of the stored (compressed) responses.
+                                      None means no limit.
+            compression_level (int): zlib compression level used for the stored responses.
+        """
+        self.path: Path = Path(path)
+        self.default_ttl: Optional[float] = default_ttl
+        self.ttls: Dict[str, Optional[float]] = dict(ttls or {})
+        self.max_size: Optional[int] = max_size
+        self.compression_level: int = compression_level
+
+        logger.debug(f"Opening response cache database at '{self.path}'")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        # Rows replaced by INSERT OR REPLACE only fire the delete trigger with this on
+        self._connection.execute("PRAGMA recursive_triggers=ON")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "DiskCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """Returns the time-to-live, in seconds, of responses from the given endpoint."""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Fetch a stored response, whether it is still fresh or not.
+
+        Args:
+            url (str): the queried url the response was stored for.
+
+        Returns:
+            The CachedResponse, or None if nothing is stored for this url.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, etag, last_modified, expires_at, validated FROM responses "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+        content, etag, last_modified, expires_at, validated = row
+        logger.trace(f"Found cached response for '{url}'")
+        return CachedResponse(
+            zlib.decompress(content), etag, last_modified, expires_at, bool(validated)
+        )
+
+    def set(
+        self,
+        url: str,
+        endpoint: str,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store a response, replacing any previous one for the same url, then evict the least
+        recently accessed entries if the cache has grown over its maximum size. The response is
+        not flagged as validated until `mark_validated` is called for it.
+
+        Args:
+            url (str): the queried url.
+            endpoint (str): the API resource name the url belongs to, which sets its TTL.
+            content (bytes): the raw body of the response.
+            etag (Optional[str]): the 'ETag' header of the response, if any.
+            last_modified (Optional[str]): the 'Last-Modified' header of the response, if any.
+        """
+        compressed: bytes = zlib.compress(content, self.compression_level)
+        now: float = time.time()
+        ttl: Optional[float] = self.ttl(endpoint)
+        logger.trace(f"Storing response for '{url}' ({len(compressed)} bytes compressed)")
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (
+                    url,
+                    endpoint,
+                    compressed,
+                    etag,
+                    last_modified,
+                    None if ttl is None else now + ttl,
+                    now,
+                    len(compressed),
+                ),
+            )
+            self._evict()
+
+    def refresh(self, url: str, endpoint: str) -> None:
+        """
+        Marks a stored response as fresh again, after the API confirmed it has not changed.
+
+        Args:
+            url (str): the queried url.
+            endpoint (str): the API resource name the url belongs to, which sets its TTL.
+        """
+        now: float = time.time()
+        ttl: Optional[float] = self.ttl(endpoint)
+        logger.trace(f"Refreshing cached response for '{url}'")
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE url = ?",
+                (None if ttl is None else now + ttl, now, url),
+            )
+
+    def mark_validated(self, url: str) -> None:
+        """
+        Flags a stored response as validated, after its body was successfully parsed into a fully
+        validated model, so that it can later be trusted without validating it again.
+
+        Args:
+            url (str): the queried url.
+        """
+        logger.trace(f"Flagging cached response for '{url}' as validated")
+        with self._lock:
+            self._connection.execute("UPDATE responses SET validated = 1 WHERE url = ?", (url,))
+
+    def delete(self, endpoint: Optional[str] = None, url: Optional[str] = None) -> None:
+        """
+        Removes stored responses: the one for a specific url, all of an endpoint's, or everything
+        if neither is given.
+
+        Args:
+            endpoint (Optional[str]): the API resource name whose responses to remove.
+            url (Optional[str]): the url whose response to remove.
+        """
+        with self._lock:
+            if url is not None:
+                self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+            elif endpoint is not None:
+                self._connection.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
+            else:
+                self._connection.execute("DELETE FROM responses")
+
+    def size(self) -> int:
+        """Returns the total size, in bytes, of the stored compressed responses."""
+        with self._lock:
+            return self._connection.execute("SELECT size FROM totals").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Deletes the least recently accessed entries until the cache fits its maximum size."""
+        if self.max_size is None:
+            return
+        excess: int = (
+            self._connection.execute("SELECT size FROM totals").fetchone()[0] - self.max_size
+        )
+        if excess <= 0:
+            return
+
+        # Only reads, through the index, as many of the oldest entries as need to go
+        evicted = []
+        cursor = self._connection.execute("SELECT url, size FROM responses ORDER BY accessed_at")
+        for url, size in cursor:
+            evicted.append((url,))
+            excess -= size
+            if excess <= 0:
+                break
+        cursor.close()
+        logger.debug(f"Evicting {len(evicted)} responses to fit the cache's maximum size")
+        self._connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
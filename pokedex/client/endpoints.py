@@ -0,0 +1,265 @@
+"""
+Registry of the PokeAPI endpoints covered by the clients. Each endpoint maps an API resource name,
+such as 'pokemon-species', to the pokedex.models class its data is organised in. The clients
+build their get_* methods from this table instead of defining each of them by hand.
+"""
+
+import inspect
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, Type, Union
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pokedex import models
+
+
+class Endpoint(NamedTuple):
+    """
+    An API endpoint, and the model class its responses are organised in. Items of unnamed
+    endpoints can only be queried by ID, and are listed as APIResource rather than
+    NamedAPIResource. The getters' parameter taking an item's identifier is named after the
+    endpoint, e.g. 'berry_id', unless another name is provided.
+    """
+
+    name: str
+    model: Type[BaseModel]
+    plural: str
+    named: bool = True
+    parameter: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        """A human-readable name for the endpoint's items, for use in logs and docs."""
+        return self.name.replace("-", " ")
+
+    @property
+    def getter_name(self) -> str:
+        """The name of the client method querying a single item of this endpoint."""
+        return f"get_{self.name.replace('-', '_')}"
+
+    @property
+    def parameter_name(self) -> str:
+        """The name of the getter's parameter taking the item's identifier, e.g. 'pokemon_id'."""
+        return self.parameter or f"{self.name.replace('-', '_')}_id"
+
+    @property
+    def batch_getter_name(self) -> str:
+        """The name of the client method querying several items of this endpoint at once."""
+        return f"get_{self.plural}"
+
+
+ENDPOINTS: Dict[str, Endpoint] = {
+    endpoint.name: endpoint
+    for endpoint in (
+        Endpoint("berry", models.Berry, "berries"),
+        Endpoint("berry-firmness", models.BerryFirmness, "berry_firmnesses"),
+        Endpoint("berry-flavor", models.BerryFlavor, "berry_flavors"),
+        Endpoint("contest-type", models.ContestType, "contest_types"),
+        Endpoint("contest-effect", models.ContestEffect, "contest_effects", named=False),
+        Endpoint(
+            "super-contest-effect", models.SuperContestEffect, "super_contest_effects", named=False
+        ),
+        Endpoint("encounter-method", models.EncounterMethod, "encounter_methods"),
+        Endpoint("encounter-condition", models.EncounterCondition, "encounter_conditions"),
+        Endpoint(
+            "encounter-condition-value",
+            models.EncounterConditionValue,
+            "encounter_condition_values",
+        ),
+        Endpoint("evolution-chain", models.EvolutionChain, "evolution_chains", named=False),
+        Endpoint("evolution-trigger", models.EvolutionTrigger, "evolution_triggers"),
+        Endpoint("generation", models.Generation, "generations"),
+        Endpoint("pokedex", models.Pokedex, "pokedexes"),
+        Endpoint("version", models.Version, "versions"),
+        Endpoint("version-group", models.VersionGroup, "version_groups"),
+        Endpoint("item", models.Item, "items"),
+        Endpoint("item-attribute", models.ItemAttribute, "item_attributes"),
+        Endpoint("item-category", models.ItemCategory, "item_categories"),
+        Endpoint("item-fling-effect", models.ItemFlingEffect, "item_fling_effects"),
+        Endpoint("item-pocket", models.ItemPocket, "item_pockets"),
+        Endpoint("location", models.Location, "locations"),
+        Endpoint("location-area", models.LocationArea, "location_areas"),
+        Endpoint("pal-park-area", models.PalParkArea, "pal_park_areas"),
+        Endpoint("region", models.Region, "regions"),
+        Endpoint("machine", models.Machine, "machines", named=False),
+        Endpoint("move", models.Move, "moves"),
+        Endpoint("move-ailment", models.MoveAilment, "move_ailments"),
+        Endpoint("move-battle-style", models.MoveBattleStyle, "move_battle_styles"),
+        Endpoint("move-category", models.ModelName, "move_categories"),
+        Endpoint("move-damage-class", models.MoveDamageClass, "move_damage_classes"),
+        Endpoint("move-learn-method", models.MoveLearnMethod, "move_learn_methods"),
+        Endpoint("move-target", models.MoveTarget, "move_targets"),
+        Endpoint("ability", models.Ability, "abilities"),
+        Endpoint("characteristic", models.Characteristic, "characteristics", named=False),
+        Endpoint("egg-group", models.EggGroup, "egg_groups"),
+        Endpoint("gender", models.Gender, "genders"),
+        Endpoint("growth-rate", models.GrowthRate, "growth_rates"),
+        Endpoint("nature", models.Nature, "natures"),
+        Endpoint("pokeathlon-stat", models.PokeathlonStat, "pokeathlon_stats"),
+        Endpoint("pokemon", models.Pokemon, "pokemons"),
+        Endpoint("pokemon-color", models.PokemonColor, "pokemon_colors"),
+        Endpoint("pokemon-form", models.PokemonForm, "pokemon_forms", parameter="pokemon_id"),
+        Endpoint("pokemon-habitat", models.PokemonHabitat, "pokemon_habitats"),
+        Endpoint("pokemon-shape", models.PokemonShape, "pokemon_shapes"),
+        Endpoint("pokemon-species", models.PokemonSpecies, "pokemon_species_list"),
+        Endpoint("stat", models.Stat, "stats"),
+        Endpoint("type", models.Type, "types"),
+        Endpoint("language", models.Language, "languages"),
+    )
+}
+
+
+class FetchResult(NamedTuple):
+    """The outcome of querying one item as part of a batch: either its model or the error."""
+
+    item_id: Union[str, int]
+    model: Optional[BaseModel]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def get_endpoint(resource: str) -> Endpoint:
+    """
+    Returns the registered endpoint for the provided resource name.
+
+    Args:
+        resource (str): the API resource name, e.g. 'pokemon-species'. Underscores are accepted in
+                        place of dashes.
+
+    Returns:
+        The corresponding Endpoint, but will raise a ValueError if the resource is not covered.
+    """
+    try:
+        return ENDPOINTS[resource.replace("_", "-")]
+    except KeyError:
+        logger.error(f"No endpoint is registered for resource '{resource}'")
+        raise ValueError(f"Unknown resource '{resource}', should be one of {list(ENDPOINTS)}.")
+
+
+def parse_resource_url(url: str) -> Tuple[str, int]:
+    """
+    Returns the resource name and ID number an API url points to, e.g. ('pokemon', 25) for
+    'https://pokeapi.co/api/v2/pokemon/25/'.
+
+    Args:
+        url (str): the url of an API resource, as found in NamedAPIResource and APIResource.
+
+    Returns:
+        A tuple of the resource name and ID number, but will raise a ValueError if the url does
+        not point to a specific item.
+    """
+    parts = url.split("?")[0].rstrip("/").split("/")
+    if len(parts) < 2 or not parts[-1].isdigit():
+        logger.error(f"Could not parse a resource name and ID from url '{url}'")
+        raise ValueError(f"Url '{url}' does not point to a specific API resource.")
+    return parts[-2], int(parts[-1])
+
+
+def bind_endpoint_methods(
+    client_class: type,
+    make_getter: Callable[[Endpoint], Callable],
+    make_batch_getter: Callable[[Endpoint], Callable],
+) -> type:
+    """
+    Binds to the provided client class a single-item and a batched getter method for each of the
+    registered endpoints, e.g. 'get_pokemon' and 'get_pokemons'.
+
+    Args:
+        client_class (type): the client class to add the methods to.
+        make_getter (Callable): builds the function querying one item of the given endpoint.
+        make_batch_getter (Callable): builds the function querying several items of the given
+                                      endpoint.
+
+    Returns:
+        The client class, so that this can be used as a class decorator.
+    """
+    for endpoint in ENDPOINTS.values():
+        model_path = f"{endpoint.model.__module__}.{endpoint.model.__name__}"
+
+        getter = _rename_identifier(make_getter(endpoint), endpoint.parameter_name)
+        getter.__name__ = endpoint.getter_name
+        getter.__qualname__ = f"{client_class.__name__}.{endpoint.getter_name}"
+        indent: str = " " * len(f"{endpoint.parameter_name} (Union[str, int]): ")
+        getter.__doc__ = f"""
+        Query a {endpoint.label}'s data and return it organised in a {endpoint.model.__name__}
+        object.
+
+        Args:
+            {endpoint.parameter_name} (Union[str, int]): the {endpoint.label}'s identifier, either
+            {indent}its ID number or its name.
+            fields (Optional[Iterable[str]]): the names of the fields to get, for a partial
+                                              view of the item. Only their data is validated.
+                                              None means all of them.
+
+        Returns:
+            A {model_path} object of the item's data.
+        """
+        setattr(client_class, endpoint.getter_name, getter)
+
+        batch_getter = make_batch_getter(endpoint)
+        batch_getter.__name__ = endpoint.batch_getter_name
+        batch_getter.__qualname__ = f"{client_class.__name__}.{endpoint.batch_getter_name}"
+        batch_getter.__doc__ = f"""
+        Query several {endpoint.label} items concurrently, see `get_many` for the details.
+
+        Args:
+            item_ids (Iterable[Union[str, int]]): the items' identifiers, either ID numbers or
+                                                  names.
+            stream (bool): whether to yield results as they complete instead of returning them
+                           all at once, in input order.
+            fields (Optional[Iterable[str]]): the names of the fields to get, for partial views
+                                              of the items. None means all of them.
+
+        Returns:
+            The FetchResult of each item, holding either a {model_path} object or the
+            error raised when querying it.
+        """
+        setattr(client_class, endpoint.batch_getter_name, batch_getter)
+    return client_class
+
+
+def _rename_identifier(getter: Callable, parameter: str) -> Callable:
+    """
+    Renames the 'item_id' parameter of a getter built by the clients, so that it can be passed
+    by keyword under the endpoint's own name, e.g. `get_berry(berry_id=1)`. The getter is
+    returned as is when the names already match.
+
+    Args:
+        getter (Callable): the function querying one item, taking 'item_id' after 'self'.
+        parameter (str): the name to expose the parameter under.
+
+    Returns:
+        A function with the same behaviour and the renamed parameter in its signature.
+    """
+    if parameter == "item_id":
+        return getter
+
+    if inspect.iscoroutinefunction(getter):
+
+        async def renamed(self, *args, **kwargs):
+            if parameter in kwargs:
+                kwargs["item_id"] = kwargs.pop(parameter)
+            return await getter(self, *args, **kwargs)
+
+    else:
+
+        def renamed(self, *args, **kwargs):
+            if parameter in kwargs:
+                kwargs["item_id"] = kwargs.pop(parameter)
+            return getter(self, *args, **kwargs)
+
+    signature: inspect.Signature = inspect.signature(getter)
+    renamed.__signature__ = signature.replace(
+        parameters=[
+            argument.replace(name=parameter) if argument.name == "item_id" else argument
+            for argument in signature.parameters.values()
+        ]
+    )
+    renamed.__annotations__ = {
+        parameter if name == "item_id" else name: annotation
+        for name, annotation in getter.__annotations__.items()
+    }
+    return renamed
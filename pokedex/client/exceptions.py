@@ -0,0 +1,28 @@
+"""
+Exceptions raised by the clients when the API does not answer a query successfully.
+"""
+
+from typing import Optional
+
+
+class PokeAPIError(Exception):
+    """Raised when a query to the API returns with an unexpected status code."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, url: Optional[str] = None):
+        super().__init__(message)
+        self.status_code: Optional[int] = status_code
+        self.url: Optional[str] = url
+
+
+class RateLimitError(PokeAPIError):
+    """Raised when the API still throttles a query after all retries have been spent."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        url: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message, status_code=status_code, url=url)
+        self.retry_after: Optional[float] = retry_after
@@ -0,0 +1,86 @@
+"""
+Discovery of the resource references held by model objects, which clients follow to expand a
+model into the graph of models it links to.
+"""
+
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from pokedex.client.endpoints import ENDPOINTS
+from pokedex.models.commons import APIResource, NamedAPIResource
+from pokedex.models.compact import CompactAPIResource, CompactNamedAPIResource, CompactRecord
+
+_REFERENCE_CLASSES = (NamedAPIResource, APIResource, CompactNamedAPIResource, CompactAPIResource)
+
+
+def collect_references(model: BaseModel, paths: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Returns the urls of the resources referenced by a model, either anywhere in it or at the
+    provided paths, skipping references to endpoints the clients do not cover.
+
+    Args:
+        model (BaseModel): the model to look for references in.
+        paths (Optional[Sequence[str]]): dotted attribute paths to the references to collect,
+                                         e.g. 'moves.move' for the 'move' of every entry in
+                                         'moves'. Lists and tuples are traversed transparently,
+                                         as are the compact records of compact models, and paths
+                                         not applying to the model are ignored. If None, all
+                                         references are collected.
+
+    Returns:
+        The unique urls of the referenced resources, in order of discovery.
+    """
+    if paths is None:
+        references = _walk(model)
+    else:
+        references = (
+            reference
+            for path in paths
+            for value in _follow(model, path.split("."))
+            for reference in _walk(value)
+        )
+
+    urls: Dict[str, None] = {}
+    for reference in references:
+        if _endpoint_name(reference.url) in ENDPOINTS:
+            urls[reference.url] = None
+    return list(urls)
+
+
+def _follow(value: Any, attributes: List[str]) -> Iterator[Any]:
+    """Yields the values found at the end of an attribute path, traversing lists on the way."""
+    if isinstance(value, (list, tuple)):
+        for element in value:
+            yield from _follow(element, attributes)
+    elif not attributes:
+        yield value
+    elif attributes[0] in _field_names(value):
+        yield from _follow(getattr(value, attributes[0]), attributes[1:])
+
+
+def _walk(value: Any) -> Iterator[APIResource]:
+    """Yields all resource references found in a value, recursively."""
+    if isinstance(value, _REFERENCE_CLASSES):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for element in value:
+            yield from _walk(element)
+    else:
+        for field_name in _field_names(value):
+            yield from _walk(getattr(value, field_name, None))
+
+
+def _field_names(value: Any) -> Iterable[str]:
+    """Returns the names of the fields of a model object or compact record, if value is one."""
+    if isinstance(value, BaseModel):
+        return value.__fields__
+    if isinstance(value, CompactRecord):
+        return [field.name for field in fields(value)]
+    return ()
+
+
+def _endpoint_name(url: str) -> str:
+    parts = url.rstrip("/").split("/")
+    return parts[-2] if len(parts) >= 2 else ""
@@ -0,0 +1,14 @@
+"""
+Static declarations of the get_* methods the clients build from the endpoints registry, see
+`bind_endpoint_methods`. The methods are only bound when the client modules are imported, so
+these classes are empty at runtime: their stub, getters.pyi, declares each method with its
+parameters and return type for type checkers and IDEs.
+"""
+
+
+class EndpointGetters:
+    """The get_* methods of the PokeClient, declared in getters.pyi."""
+
+
+class AsyncEndpointGetters:
+    """The get_* methods of the AsyncPokeClient, declared in getters.pyi."""
@@ -0,0 +1,1071 @@
+"""
+Declarations of the get_* methods bound to the clients, see getters.py. Generated from the
+endpoints registry with `python -m tests.test_getters`, which should be run again whenever an
+endpoint is added.
+"""
+
+from typing import AsyncIterator, Awaitable, Iterable, Iterator, List, Optional, Union
+
+from pokedex import models
+from pokedex.client.endpoints import FetchResult
+
+
+class EndpointGetters:
+    def get_berry(
+        self,
+        berry_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Berry: ...
+    def get_berries(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_berry_firmness(
+        self,
+        berry_firmness_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.BerryFirmness: ...
+    def get_berry_firmnesses(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_berry_flavor(
+        self,
+        berry_flavor_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.BerryFlavor: ...
+    def get_berry_flavors(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_contest_type(
+        self,
+        contest_type_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ContestType: ...
+    def get_contest_types(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_contest_effect(
+        self,
+        contest_effect_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ContestEffect: ...
+    def get_contest_effects(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_super_contest_effect(
+        self,
+        super_contest_effect_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.SuperContestEffect: ...
+    def get_super_contest_effects(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_encounter_method(
+        self,
+        encounter_method_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EncounterMethod: ...
+    def get_encounter_methods(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_encounter_condition(
+        self,
+        encounter_condition_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EncounterCondition: ...
+    def get_encounter_conditions(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_encounter_condition_value(
+        self,
+        encounter_condition_value_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EncounterConditionValue: ...
+    def get_encounter_condition_values(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_evolution_chain(
+        self,
+        evolution_chain_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EvolutionChain: ...
+    def get_evolution_chains(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_evolution_trigger(
+        self,
+        evolution_trigger_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EvolutionTrigger: ...
+    def get_evolution_triggers(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_generation(
+        self,
+        generation_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Generation: ...
+    def get_generations(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokedex(
+        self,
+        pokedex_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Pokedex: ...
+    def get_pokedexes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_version(
+        self,
+        version_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Version: ...
+    def get_versions(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_version_group(
+        self,
+        version_group_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.VersionGroup: ...
+    def get_version_groups(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_item(
+        self,
+        item_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Item: ...
+    def get_items(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_item_attribute(
+        self,
+        item_attribute_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemAttribute: ...
+    def get_item_attributes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_item_category(
+        self,
+        item_category_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemCategory: ...
+    def get_item_categories(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_item_fling_effect(
+        self,
+        item_fling_effect_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemFlingEffect: ...
+    def get_item_fling_effects(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_item_pocket(
+        self,
+        item_pocket_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemPocket: ...
+    def get_item_pockets(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_location(
+        self,
+        location_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Location: ...
+    def get_locations(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_location_area(
+        self,
+        location_area_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.LocationArea: ...
+    def get_location_areas(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pal_park_area(
+        self,
+        pal_park_area_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PalParkArea: ...
+    def get_pal_park_areas(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_region(
+        self,
+        region_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Region: ...
+    def get_regions(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_machine(
+        self,
+        machine_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Machine: ...
+    def get_machines(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_move(
+        self,
+        move_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Move: ...
+    def get_moves(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_move_ailment(
+        self,
+        move_ailment_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveAilment: ...
+    def get_move_ailments(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_move_battle_style(
+        self,
+        move_battle_style_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveBattleStyle: ...
+    def get_move_battle_styles(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_move_category(
+        self,
+        move_category_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ModelName: ...
+    def get_move_categories(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_move_damage_class(
+        self,
+        move_damage_class_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveDamageClass: ...
+    def get_move_damage_classes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_move_learn_method(
+        self,
+        move_learn_method_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveLearnMethod: ...
+    def get_move_learn_methods(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_move_target(
+        self,
+        move_target_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveTarget: ...
+    def get_move_targets(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_ability(
+        self,
+        ability_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Ability: ...
+    def get_abilities(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_characteristic(
+        self,
+        characteristic_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Characteristic: ...
+    def get_characteristics(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_egg_group(
+        self,
+        egg_group_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EggGroup: ...
+    def get_egg_groups(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_gender(
+        self,
+        gender_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Gender: ...
+    def get_genders(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_growth_rate(
+        self,
+        growth_rate_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.GrowthRate: ...
+    def get_growth_rates(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_nature(
+        self,
+        nature_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Nature: ...
+    def get_natures(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokeathlon_stat(
+        self,
+        pokeathlon_stat_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokeathlonStat: ...
+    def get_pokeathlon_stats(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokemon(
+        self,
+        pokemon_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Pokemon: ...
+    def get_pokemons(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokemon_color(
+        self,
+        pokemon_color_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonColor: ...
+    def get_pokemon_colors(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokemon_form(
+        self,
+        pokemon_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonForm: ...
+    def get_pokemon_forms(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokemon_habitat(
+        self,
+        pokemon_habitat_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonHabitat: ...
+    def get_pokemon_habitats(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokemon_shape(
+        self,
+        pokemon_shape_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonShape: ...
+    def get_pokemon_shapes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_pokemon_species(
+        self,
+        pokemon_species_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonSpecies: ...
+    def get_pokemon_species_list(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_stat(
+        self,
+        stat_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Stat: ...
+    def get_stats(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_type(
+        self,
+        type_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Type: ...
+    def get_types(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+    def get_language(
+        self,
+        language_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Language: ...
+    def get_languages(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[List[FetchResult], Iterator[FetchResult]]: ...
+
+class AsyncEndpointGetters:
+    async def get_berry(
+        self,
+        berry_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Berry: ...
+    def get_berries(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_berry_firmness(
+        self,
+        berry_firmness_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.BerryFirmness: ...
+    def get_berry_firmnesses(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_berry_flavor(
+        self,
+        berry_flavor_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.BerryFlavor: ...
+    def get_berry_flavors(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_contest_type(
+        self,
+        contest_type_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ContestType: ...
+    def get_contest_types(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_contest_effect(
+        self,
+        contest_effect_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ContestEffect: ...
+    def get_contest_effects(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_super_contest_effect(
+        self,
+        super_contest_effect_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.SuperContestEffect: ...
+    def get_super_contest_effects(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_encounter_method(
+        self,
+        encounter_method_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EncounterMethod: ...
+    def get_encounter_methods(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_encounter_condition(
+        self,
+        encounter_condition_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EncounterCondition: ...
+    def get_encounter_conditions(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_encounter_condition_value(
+        self,
+        encounter_condition_value_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EncounterConditionValue: ...
+    def get_encounter_condition_values(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_evolution_chain(
+        self,
+        evolution_chain_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EvolutionChain: ...
+    def get_evolution_chains(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_evolution_trigger(
+        self,
+        evolution_trigger_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EvolutionTrigger: ...
+    def get_evolution_triggers(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_generation(
+        self,
+        generation_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Generation: ...
+    def get_generations(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokedex(
+        self,
+        pokedex_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Pokedex: ...
+    def get_pokedexes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_version(
+        self,
+        version_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Version: ...
+    def get_versions(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_version_group(
+        self,
+        version_group_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.VersionGroup: ...
+    def get_version_groups(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_item(
+        self,
+        item_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Item: ...
+    def get_items(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_item_attribute(
+        self,
+        item_attribute_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemAttribute: ...
+    def get_item_attributes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_item_category(
+        self,
+        item_category_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemCategory: ...
+    def get_item_categories(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_item_fling_effect(
+        self,
+        item_fling_effect_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemFlingEffect: ...
+    def get_item_fling_effects(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_item_pocket(
+        self,
+        item_pocket_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ItemPocket: ...
+    def get_item_pockets(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_location(
+        self,
+        location_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Location: ...
+    def get_locations(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_location_area(
+        self,
+        location_area_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.LocationArea: ...
+    def get_location_areas(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pal_park_area(
+        self,
+        pal_park_area_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PalParkArea: ...
+    def get_pal_park_areas(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_region(
+        self,
+        region_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Region: ...
+    def get_regions(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_machine(
+        self,
+        machine_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Machine: ...
+    def get_machines(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_move(
+        self,
+        move_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Move: ...
+    def get_moves(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_move_ailment(
+        self,
+        move_ailment_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveAilment: ...
+    def get_move_ailments(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_move_battle_style(
+        self,
+        move_battle_style_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveBattleStyle: ...
+    def get_move_battle_styles(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_move_category(
+        self,
+        move_category_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.ModelName: ...
+    def get_move_categories(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_move_damage_class(
+        self,
+        move_damage_class_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveDamageClass: ...
+    def get_move_damage_classes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_move_learn_method(
+        self,
+        move_learn_method_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveLearnMethod: ...
+    def get_move_learn_methods(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_move_target(
+        self,
+        move_target_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.MoveTarget: ...
+    def get_move_targets(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_ability(
+        self,
+        ability_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Ability: ...
+    def get_abilities(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_characteristic(
+        self,
+        characteristic_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Characteristic: ...
+    def get_characteristics(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_egg_group(
+        self,
+        egg_group_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.EggGroup: ...
+    def get_egg_groups(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_gender(
+        self,
+        gender_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Gender: ...
+    def get_genders(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_growth_rate(
+        self,
+        growth_rate_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.GrowthRate: ...
+    def get_growth_rates(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_nature(
+        self,
+        nature_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Nature: ...
+    def get_natures(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokeathlon_stat(
+        self,
+        pokeathlon_stat_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokeathlonStat: ...
+    def get_pokeathlon_stats(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokemon(
+        self,
+        pokemon_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Pokemon: ...
+    def get_pokemons(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokemon_color(
+        self,
+        pokemon_color_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonColor: ...
+    def get_pokemon_colors(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokemon_form(
+        self,
+        pokemon_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonForm: ...
+    def get_pokemon_forms(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokemon_habitat(
+        self,
+        pokemon_habitat_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonHabitat: ...
+    def get_pokemon_habitats(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokemon_shape(
+        self,
+        pokemon_shape_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonShape: ...
+    def get_pokemon_shapes(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_pokemon_species(
+        self,
+        pokemon_species_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.PokemonSpecies: ...
+    def get_pokemon_species_list(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_stat(
+        self,
+        stat_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Stat: ...
+    def get_stats(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_type(
+        self,
+        type_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Type: ...
+    def get_types(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
+    async def get_language(
+        self,
+        language_id: Union[str, int],
+        fields: Optional[Iterable[str]] = ...,
+    ) -> models.Language: ...
+    def get_languages(
+        self,
+        item_ids: Iterable[Union[str, int]],
+        stream: bool = ...,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]: ...
@@ -0,0 +1,147 @@
+"""
+A client serving models from a local snapshot of the API, with no network dependency.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import parse_qs
+
+from loguru import logger
+
+from pokedex.client.api import PokeClient
+from pokedex.client.decoding import Decoder
+from pokedex.client.endpoints import Endpoint
+from pokedex.client.exceptions import PokeAPIError
+from pokedex.client.snapshot import Snapshot
+
+
+class OfflinePokeClient(PokeClient):
+    """
+    Drop-in replacement for the PokeClient which reads items from a snapshot file created with
+    `mirror_snapshot`, instead of querying the API. It exposes the same interface, get_* methods,
+    batched queries and list iteration included, and keeps queried models in the same in-memory
+    cache.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Union[str, Path],
+        max_workers: int = 10,
+        cache_size: Optional[int] = 64 * 1024 ** 2,
+        endpoint_cache_sizes: Optional[Dict[str, Optional[int]]] = None,
+        decoder: Union[str, Decoder, None] = None,
+        trusted: bool = True,
+        lazy: bool = False,
+        intern_resources: bool = True,
+        compact: bool = False,
+        languages: Optional[Iterable[str]] = None,
+        version_group: Optional[Union[str, int]] = None,
+    ):
+        """
+        Args:
+            snapshot_path (Union[str, Path]): location of the snapshot file to read from.
+            max_workers (int): the maximum number of threads used to run batched queries.
+            cache_size (Optional[int]): the memory budget, in bytes, of the in-memory cache of
+                                        queried models. None means the cache is unbounded.
+            endpoint_cache_sizes (Optional[Dict[str, Optional[int]]]): per-endpoint budgets of the
+                                                                       in-memory cache, in bytes.
+            decoder (Union[str, Decoder, None]): the JSON library to decode items with, see
+                                                 `get_decoder`. Defaults to the fastest one.
+            trusted (bool): whether to build models without validating them, as the items of a
+                            snapshot have been validated when mirrored.
+            lazy (bool): whether to defer the parsing of the heavy sub-collections of large
+                         models, such as a Pokémon's moves, to their first access.
+            intern_resources (bool): whether to share the NamedAPIResource and APIResource
+                                     objects of queried models with all other models holding
+                                     identical ones, which saves memory on large caches.
+            compact (bool): whether to hold the most repeated sub-objects of queried models, such
+                            as resource references and a Pokémon's move details, in read-only
+                            compact records exposing the same attributes, see
+                            `pokedex.models.compact`. This cuts their memory footprint severalfold.
+            languages (Optional[Iterable[str]]): the names of the languages to keep the localized
+                                                 entries of, such as names and flavor texts, e.g.
+                                                 ['en', 'ja']. Entries in other languages are
+                                                 dropped before models are built. None keeps all
+                                                 of them.
+            version_group (Optional[str]): the name or ID number of the version group to keep the
+                                           per-game entries of, such as a Pokémon's move learning
+                                           details, e.g. 'red-blue'. Entries for other games are
+                                           dropped before models are built. None keeps all of
+                                           them.
+        """
+        super().__init__(
+            max_workers=max_workers,
+            cache_size=cache_size,
+            endpoint_cache_sizes=endpoint_cache_sizes,
+            decoder=decoder,
+            trusted=trusted,
+            lazy=lazy,
+            intern_resources=intern_resources,
+            compact=compact,
+            languages=languages,
+            version_group=version_group,
+        )
+        self.snapshot: Snapshot = Snapshot(snapshot_path, readonly=True)
+
+    def close(self) -> None:
+        """Closes the snapshot file."""
+        self.snapshot.close()
+        super().close()
+
+    def _read(self, endpoint: Endpoint, query_url: str) -> Tuple[bytes, bool]:
+        """
+        Reads the data the provided url would have returned from the snapshot: either an item's
+        data, or a page of an endpoint's list.
+
+        Args:
+            endpoint (Endpoint): the registered endpoint the url belongs to.
+            query_url (str): the url the data would have been queried from.
+
+        Returns:
+            The item's or page's data, as bytes, and True as the items of a snapshot were fully
+            validated when mirrored.
+        """
+        path, _, query = query_url.partition("?")
+        if query:
+            return self._list_page(endpoint, query), True
+
+        item_id: str = path.rstrip("/").rsplit("/", 1)[-1]
+        logger.trace(f"Reading {endpoint.label} with ID '{item_id}' from the snapshot")
+        content: Optional[bytes] = self.snapshot.get(endpoint.name, item_id)
+        if content is None:
+            logger.error(f"No {endpoint.label} with ID '{item_id}' in the snapshot")
+            raise PokeAPIError(
+                f"No {endpoint.label} with ID '{item_id}' in snapshot '{self.snapshot.path}', "
+                f"check the validity of your parameter",
+                status_code=404,
+                url=query_url,
+            )
+        return content, True
+
+    def _list_page(self, endpoint: Endpoint, query: str) -> bytes:
+        """Builds a page of an endpoint's list, as the API would, from the snapshot's items."""
+        parameters = parse_qs(query)
+        limit: int = int(parameters.get("limit", ["20"])[0])
+        offset: int = int(parameters.get("offset", ["0"])[0])
+        count: int = self.snapshot.count(endpoint.name)
+
+        results = []
+        for item_id, name in self.snapshot.list(endpoint.name, limit=limit, offset=offset):
+            url: str = self.format_query_url(item_id=item_id, item_type=endpoint.name)
+            results.append({"name": name, "url": url} if endpoint.named else {"url": url})
+        page = {
+            "count": count,
+            "next": (
+                self.format_list_url(endpoint.name, limit=limit, offset=offset + limit)
+                if offset + limit < count
+                else None
+            ),
+            "previous": (
+                self.format_list_url(endpoint.name, limit=limit, offset=max(0, offset - limit))
+                if offset > 0
+                else None
+            ),
+            "results": results,
+        }
+        return json.dumps(page).encode()
@@ -0,0 +1,150 @@
+"""
+Pruning of the decoded data of items, before model objects are built from it. Many items embed
+lists of localized entries, such as their names or flavor texts, in every language the PokeAPI
+supports, and lists of per-game entries, such as a Pokémon's move learning details, for every
+game since Red and Blue. Clients scoped to some languages, or to a version group, drop the
+other entries beforehand, which saves both the time to parse them and the memory to hold them.
+
+A scope maps the key entries are matched on, such as 'language' or 'version_group', to the names
+of the resources to keep. Entries are matched on the NamedAPIResource their model class holds
+under that key, and entries without one are kept. Entries left without any of their per-game
+details, such as a move the Pokémon can't learn in the scoped games, are dropped as well. Which
+lists to prune is worked out from the model classes' fields.
+"""
+
+import functools
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+from pokedex.models.commons import NamedAPIResource
+from pokedex.models.moves import PastMoveStatValues
+from pokedex.models.pokemon import AbilityEffectChange
+
+Scope = Dict[str, FrozenSet[str]]
+
+# The keys matching entries to the games they apply to
+_VERSION_KEYS = frozenset(("version", "version_group"))
+
+# Entries of these classes record the game their data changed in, rather than the games it
+# applies to, and are kept whatever the scoped version group
+_HISTORY_CLASSES = (AbilityEffectChange, PastMoveStatValues)
+
+
+class _Step(NamedTuple):
+    """How to prune the value of one field of a model class, worked out once per class."""
+
+    alias: str
+    is_list: bool
+    # The keys the entries of a list are matched on, and how to prune the entries themselves
+    keys: Tuple[str, ...]
+    steps: Tuple["_Step", ...]
+    # Whether entries are dropped for the games they apply to, in which case an object left
+    # without any is dropped too
+    per_game: bool
+
+
+def prune(model_class: Type[BaseModel], data: Dict[str, Any], scope: Scope) -> float:
+    """
+    Drops in place, from the decoded data of an object of the provided model class, the list
+    entries not matching the provided scope, at any depth.
+
+    Args:
+        model_class (Type[BaseModel]): the model class the data is organised in.
+        data (Dict[str, Any]): the decoded data of the object, e.g. an API response.
+        scope (Scope): for each key to match entries on, the names of the resources to keep.
+
+    Returns:
+        The share of the entries of the pruned lists which were kept, 1.0 if none was dropped.
+        As these lists hold the bulk of the data, it roughly scales the size of the data too.
+    """
+    steps: Tuple[_Step, ...] = _steps(model_class, frozenset(scope))
+    if not steps:
+        return 1.0
+    kept, seen, _ = _prune(data, steps, scope)
+    return kept / seen if kept < seen else 1.0
+
+
+def _prune(
+    data: Dict[str, Any], steps: Tuple[_Step, ...], scope: Scope
+) -> Tuple[int, int, bool]:
+    """
+    Applies the pruning steps of a model class to its data, see `prune`. Returns the number of
+    list entries kept and seen, and whether the object was left without any of its per-game
+    details.
+    """
+    kept_count: int = 0
+    seen_count: int = 0
+    emptied: bool = False
+    for alias, is_list, keys, nested_steps, per_game in steps:
+        value: Any = data.get(alias)
+        if not value:
+            continue
+        if not is_list:
+            nested_kept, nested_seen, nested_emptied = _prune(value, nested_steps, scope)
+            kept_count, seen_count = kept_count + nested_kept, seen_count + nested_seen
+            emptied = emptied or nested_emptied
+            continue
+        kept: List[Any] = []
+        for entry in value:
+            if entry is not None:
+                if keys and not _matches(entry, keys, scope):
+                    continue
+                if nested_steps:
+                    nested_kept, nested_seen, nested_emptied = _prune(entry, nested_steps, scope)
+                    seen_count += nested_seen
+                    if nested_emptied:
+                        continue
+                    kept_count += nested_kept
+            kept.append(entry)
+        kept_count, seen_count = kept_count + len(kept), seen_count + len(value)
+        if len(kept) != len(value):
+            data[alias] = kept
+            emptied = emptied or (per_game and not kept)
+    return kept_count, seen_count, emptied
+
+
+def _matches(entry: Dict[str, Any], keys: Tuple[str, ...], scope: Scope) -> bool:
+    """Whether a list entry matches the scope on all of the provided keys."""
+    for key in keys:
+        reference: Any = entry.get(key)
+        if reference is not None and reference.get("name") not in scope[key]:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _steps(
+    model_class: Type[BaseModel],
+    keys: FrozenSet[str],
+    parents: Tuple[Type[BaseModel], ...] = (),
+) -> Tuple[_Step, ...]:
+    """
+    Works out which fields of a model class hold entries to prune on the provided keys. Fields
+    nesting one of their parent classes, such as a ChainLink's evolves_to, are not followed.
+    """
+    parents = parents + (model_class,)
+    steps: List[_Step] = []
+    for field in model_class.__fields__.values():
+        nested_class: Any = field.type_
+        if not (isinstance(nested_class, type) and issubclass(nested_class, BaseModel)):
+            continue
+        if nested_class in parents:
+            continue
+        nested_steps: Tuple[_Step, ...] = _steps(nested_class, keys, parents)
+        nested_per_game: bool = any(step.per_game for step in nested_steps)
+        if field.shape == SHAPE_LIST:
+            entry_keys: Tuple[str, ...] = tuple(
+                key
+                for key in sorted(keys)
+                if key in nested_class.__fields__
+                and nested_class.__fields__[key].type_ is NamedAPIResource
+                and not (key in _VERSION_KEYS and issubclass(nested_class, _HISTORY_CLASSES))
+            )
+            if entry_keys or nested_steps:
+                per_game: bool = nested_per_game or not _VERSION_KEYS.isdisjoint(entry_keys)
+                steps.append(_Step(field.alias, True, entry_keys, nested_steps, per_game))
+        elif field.shape == SHAPE_SINGLETON and not field.sub_fields and nested_steps:
+            steps.append(_Step(field.alias, False, (), nested_steps, nested_per_game))
+    return tuple(steps)
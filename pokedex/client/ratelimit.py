@@ -0,0 +1,370 @@
+"""
+Client-side rate limiting: a token bucket bounding the request rate, retries with jittered
+exponential backoff for throttled queries, and a concurrency limit adapting to the API's answers.
+The token bucket can be shared by all processes of a machine through a SharedTokenBucket.
+"""
+
+import asyncio
+import os
+import random
+import struct
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Status codes of the responses retried after a backoff
+THROTTLING_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Status codes signalling an overloaded API, which lower the concurrency limit. Other retried
+# codes, as well as requests getting no response at all, are plain failures and leave it as is.
+CONGESTION_STATUS_CODES = frozenset({429, 503})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the value of a 'Retry-After' header, which is either a number of seconds or an HTTP
+    date.
+
+    Args:
+        value (Optional[str]): the header's value, if the header was present.
+
+    Returns:
+        The number of seconds to wait before retrying, or None if it could not be determined.
+    """
+    if not value:
+        return None
+    if value.strip().isdecimal():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        logger.warning(f"Could not parse 'Retry-After' header value '{value}'")
+        return None
+
+
+class TokenBucket:
+    """
+    A token bucket refilled at a constant rate, from which each request draws a token. Requests
+    finding the bucket empty wait for their token to be refilled, so bursts are smoothed down to
+    the bucket's rate.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate (float): the number of tokens refilled per second, i.e. the sustained rate.
+            burst (Optional[int]): the capacity of the bucket, i.e. the number of requests which
+                                   can be sent at once. Defaults to one second worth of tokens.
+        """
+        self.rate: float = rate
+        self.capacity: float = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens: float = self.capacity
+        self._updated_at: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket, going into debt if it is empty.
+
+        Returns:
+            The number of seconds to wait before the reserved token is actually available.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = self._refill(self._tokens, self._updated_at, now)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def _refill(self, tokens: float, updated_at: float, now: float) -> float:
+        return min(self.capacity, tokens + max(0.0, now - updated_at) * self.rate)
+
+    def acquire(self) -> None:
+        """Takes a token from the bucket, blocking until it is available."""
+        delay: float = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Takes a token from the bucket, waiting without blocking the event loop."""
+        delay: float = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    A token bucket whose state lives in a small file, locked with `flock` on every draw, so that
+    all the processes of a machine pointing to the same file draw from the same bucket. This
+    bounds the aggregate request rate of e.g. every worker of an application server:
+
+        limiter = RateLimiter(bucket=SharedTokenBucket("/tmp/pokeapi.bucket", rate=10))
+        client = PokeClient(rate_limiter=limiter)
+
+    All processes sharing a file should use the same rate and burst. This is only available on
+    POSIX systems.
+    """
+
+    _STATE = struct.Struct("dd")
+
+    def __init__(self, path: Union[str, Path], rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            path (Union[str, Path]): location of the file holding the bucket's state, created if
+                                     needed.
+            rate (float): the number of tokens refilled per second, i.e. the sustained rate.
+            burst (Optional[int]): the capacity of the bucket, i.e. the number of requests which
+                                   can be sent at once. Defaults to one second worth of tokens.
+        """
+        if fcntl is None:
+            raise ImportError("The SharedTokenBucket requires 'fcntl', only available on POSIX")
+        super().__init__(rate, burst)
+        self.path: Path = Path(path)
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def close(self) -> None:
+        """Closes the state file."""
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the shared bucket, going into debt if it is empty.
+
+        Returns:
+            The number of seconds to wait before the reserved token is actually available.
+        """
+        with self._lock:
+            fd: int = self._file()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now: float = time.time()
+                tokens, updated_at = self._read(fd, now)
+                tokens = self._refill(tokens, updated_at, now) - 1
+                os.pwrite(fd, self._STATE.pack(tokens, now), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        return max(0.0, -tokens / self.rate)
+
+    def _file(self) -> int:
+        """
+        Returns the descriptor of the state file, opened again after a fork: descriptors
+        inherited from the parent process share its locks, which would then not exclude it.
+        """
+        if self._fd is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+            self._pid = os.getpid()
+        return self._fd
+
+    def _read(self, fd: int, now: float) -> Tuple[float, float]:
+        """Reads the bucket's state, which starts full if the file is new or unreadable."""
+        data: bytes = os.pread(fd, self._STATE.size, 0)
+        if len(data) != self._STATE.size:
+            logger.debug(f"Initializing shared token bucket at '{self.path}'")
+            return self.capacity, now
+        return self._STATE.unpack(data)
+
+
+class AdaptiveConcurrency:
+    """
+    A limit on the number of requests in flight which adapts to the API's answers: it is halved
+    whenever a request is throttled, and grows back by about one for every window of successful
+    requests. A given instance should be used either from threads or from a single event loop.
+    """
+
+    def __init__(self, initial: int = 10, minimum: int = 1, maximum: int = 10):
+        """
+        Args:
+            initial (int): the limit to start with.
+            minimum (int): the limit never goes below this.
+            maximum (int): the limit never goes above this.
+        """
+        self.minimum: int = minimum
+        self.maximum: int = maximum
+        self.limit: float = float(initial)
+        self._in_flight: int = 0
+        self._condition = threading.Condition()
+        self._async_condition: Optional[asyncio.Condition] = None
+
+    def acquire(self) -> None:
+        """Blocks until a request can be sent within the current limit."""
+        with self._condition:
+            self._condition.wait_for(self._has_room)
+            self._in_flight += 1
+
+    def release(self, throttled: Optional[bool]) -> None:
+        """
+        Frees the slot of a completed request and adapts the limit to its outcome.
+
+        Args:
+            throttled (Optional[bool]): whether the API throttled the request. None leaves the
+                                        limit as is, e.g. for requests which failed otherwise.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._adapt(throttled)
+            self._condition.notify_all()
+
+    async def acquire_async(self) -> None:
+        """Waits, without blocking the event loop, until a request can be sent."""
+        if self._async_condition is None:
+            self._async_condition = asyncio.Condition()
+        async with self._async_condition:
+            await self._async_condition.wait_for(self._has_room)
+            self._in_flight += 1
+
+    async def release_async(self, throttled: Optional[bool]) -> None:
+        """
+        Frees the slot of a completed request and adapts the limit to its outcome.
+
+        Args:
+            throttled (Optional[bool]): whether the API throttled the request. None leaves the
+                                        limit as is, e.g. for requests which failed otherwise.
+        """
+        async with self._async_condition:
+            self._in_flight -= 1
+            self._adapt(throttled)
+            self._async_condition.notify_all()
+
+    def _has_room(self) -> bool:
+        return self._in_flight < int(self.limit)
+
+    def _adapt(self, throttled: Optional[bool]) -> None:
+        if throttled is None:
+            return
+        if throttled:
+            self.limit = max(float(self.minimum), self.limit / 2)
+            logger.debug(f"Request throttled, lowering concurrency limit to {int(self.limit)}")
+        else:
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+
+
+class RateLimiter:
+    """
+    Bundles the client-side rate limiting policies: an optional token bucket bounding the request
+    rate, an adaptive concurrency limit, and the retry budget and backoff of throttled requests.
+
+    Requests answered with a 429 or 5xx status code are retried after a jittered exponential
+    backoff, or after the delay requested by the API in a 'Retry-After' header, up to a number of
+    retries which can be set per endpoint. Only 429 and 503 answers, which signal an overloaded
+    API, lower the concurrency limit.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: int = 3,
+        endpoint_max_retries: Optional[Dict[str, int]] = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        bucket: Optional[TokenBucket] = None,
+    ):
+        """
+        Args:
+            rate (Optional[float]): the maximum sustained number of requests per second. None
+                                    means the rate is not limited.
+            burst (Optional[int]): the number of requests which can be sent at once, on top of
+                                   the sustained rate. Defaults to one second worth of requests.
+            max_retries (int): the number of times a throttled request is retried.
+            endpoint_max_retries (Optional[Dict[str, int]]): per-endpoint overrides of the number
+                                                             of retries, e.g. {'pokemon': 5}.
+            backoff_base (float): the backoff, in seconds, before the first retry. It doubles for
+                                  each following retry.
+            backoff_max (float): the maximum backoff, in seconds, between two retries.
+            max_concurrency (int): the maximum, and initial, number of requests in flight.
+            min_concurrency (int): the number of requests in flight allowed at the very least.
+            bucket (Optional[TokenBucket]): a token bucket to use instead of creating one from
+                                            'rate' and 'burst', e.g. a SharedTokenBucket to share
+                                            the rate with other processes.
+        """
+        self.bucket: Optional[TokenBucket] = (
+            bucket if bucket is not None else (TokenBucket(rate, burst) if rate else None)
+        )
+        self.max_retries: int = max_retries
+        self.endpoint_max_retries: Dict[str, int] = dict(endpoint_max_retries or {})
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.concurrency: AdaptiveConcurrency = AdaptiveConcurrency(
+            initial=max_concurrency, minimum=min_concurrency, maximum=max_concurrency
+        )
+
+    def retries(self, endpoint: str) -> int:
+        """Returns the number of times a throttled request to the given endpoint is retried."""
+        return self.endpoint_max_retries.get(endpoint, self.max_retries)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns the number of seconds to wait before retrying a throttled request.
+
+        Args:
+            attempt (int): the number of retries already made for this request.
+            retry_after (Optional[float]): the delay requested by the API, if any, which is
+                                           honoured over the exponential backoff, up to the
+                                           maximum backoff.
+
+        Returns:
+            The delay before the next retry, in seconds.
+        """
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request can be sent within the concurrency limit and request rate. If the
+        wait is interrupted, the concurrency slot taken is given back before the error is raised.
+        """
+        self.concurrency.acquire()
+        if self.bucket is not None:
+            try:
+                self.bucket.acquire()
+            except BaseException:
+                self.concurrency.release(None)
+                raise
+
+    def release(self, status_code: Optional[int]) -> None:
+        """
+        Records the outcome of a request sent after `acquire`.
+
+        Args:
+            status_code (Optional[int]): the status code of the response, None if the request
+                                         got no response, e.g. on a connection error.
+        """
+        self.concurrency.release(_is_congested(status_code))
+
+    async def acquire_async(self) -> None:
+        """
+        Waits until a request can be sent within the concurrency limit and request rate. If the
+        wait is cancelled or times out, the concurrency slot taken is given back, see `acquire`.
+        """
+        await self.concurrency.acquire_async()
+        if self.bucket is not None:
+            try:
+                await self.bucket.acquire_async()
+            except BaseException:
+                await self.concurrency.release_async(None)
+                raise
+
+    async def release_async(self, status_code: Optional[int]) -> None:
+        """Records the outcome of a request sent after `acquire_async`, see `release`."""
+        await self.concurrency.release_async(_is_congested(status_code))
+
+
+def _is_congested(status_code: Optional[int]) -> Optional[bool]:
+    """Whether a status code signals an overloaded API, None for requests without a response."""
+    return None if status_code is None else status_code in CONGESTION_STATUS_CODES
@@ -0,0 +1,97 @@
+"""
+Coalescing of concurrent identical calls: while a call for a given key is in flight, any other
+caller asking for the same key waits for it and shares its result instead of repeating the work.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls sharing a key, across threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        Runs the provided function, unless a call for the same key is already in flight, in
+        which case its result is waited for and returned instead.
+
+        Args:
+            key (Hashable): the key identifying identical calls.
+            function (Callable[[], T]): the function to run, with no arguments.
+
+        Returns:
+            The result of the function, either from this call or the one in flight. Errors raised
+            by the function are propagated to all of its waiting callers.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader: bool = future is None
+            if is_leader:
+                future = self._calls[key] = Future()
+
+        if not is_leader:
+            logger.trace(f"Waiting on in-flight call for '{key}'")
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Deduplicates concurrent calls sharing a key, across the tasks of an event loop. Calls run in
+    their own task, which every caller awaits through a shield, so that cancelling one of the
+    callers, the first one included, neither cancels the call nor the other callers.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Awaits the provided coroutine function, unless a call for the same key is already in
+        flight, in which case its result is awaited and returned instead.
+
+        Args:
+            key (Hashable): the key identifying identical calls.
+            function (Callable[[], Awaitable[T]]): the coroutine function to await, with no
+                                                   arguments.
+
+        Returns:
+            The result of the function, either from this call or the one in flight. Errors raised
+            by the function are propagated to all of its waiting callers.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(functools.partial(self._forget, key))
+        else:
+            logger.trace(f"Waiting on in-flight call for '{key}'")
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        """Removes a completed call, and retrieves its error in case no caller is left for it."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,273 @@
+"""
+Offline snapshots of the PokeAPI. A snapshot is a single SQLite file holding the compressed raw
+data of every item of the mirrored endpoints, which the OfflinePokeClient serves models from.
+
+A snapshot can be created or resumed from the command line:
+
+    python -m pokedex mirror pokeapi.db --workers 16
+"""
+
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from loguru import logger
+
+from pokedex.client.api import PokeClient
+from pokedex.client.endpoints import ENDPOINTS, Endpoint, get_endpoint, parse_resource_url
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    endpoint TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    content BLOB NOT NULL,
+    PRIMARY KEY (endpoint, id)
+);
+CREATE INDEX IF NOT EXISTS items_name ON items (endpoint, name);
+CREATE TABLE IF NOT EXISTS completed_endpoints (endpoint TEXT PRIMARY KEY);
+"""
+
+
+class Snapshot:
+    """
+    Storage of a snapshot file. Items are stored compressed, keyed by endpoint and ID number,
+    and can also be looked up by name. Endpoints are marked as completed once all of their items
+    have been stored, so that an interrupted mirroring can be resumed.
+    """
+
+    def __init__(self, path: Union[str, Path], readonly: bool = False):
+        """
+        Args:
+            path (Union[str, Path]): location of the snapshot file, created if needed.
+            readonly (bool): whether to open the snapshot for reading only.
+        """
+        self.path: Path = Path(path)
+        self.readonly: bool = readonly
+        self._lock = threading.Lock()
+
+        logger.debug(f"Opening snapshot at '{self.path}'")
+        if readonly:
+            self._connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commits pending writes and closes the snapshot file."""
+        with self._lock:
+            if not self.readonly:
+                self._connection.commit()
+            self._connection.close()
+
+    def get(self, endpoint: str, item_id: Union[str, int]) -> Optional[bytes]:
+        """
+        Fetch the raw data of an item.
+
+        Args:
+            endpoint (str): the API resource name the item belongs to.
+            item_id (Union[str, int]): the item's identifier, either its ID number or its name.
+
+        Returns:
+            The item's data as bytes, or None if it is not in the snapshot.
+        """
+        if isinstance(item_id, int) or item_id.isdecimal():
+            query = "SELECT content FROM items WHERE endpoint = ? AND id = ?"
+            item_id = int(item_id)
+        else:
+            query = "SELECT content FROM items WHERE endpoint = ? AND name = ?"
+        with self._lock:
+            row = self._connection.execute(query, (endpoint, item_id)).fetchone()
+        return zlib.decompress(row[0]) if row is not None else None
+
+    def put(self, endpoint: str, item_id: int, name: Optional[str], content: bytes) -> None:
+        """
+        Store the raw data of an item, replacing any previous version. Writes are committed with
+        `commit`, when the endpoint is marked as completed, or when the snapshot is closed.
+
+        Args:
+            endpoint (str): the API resource name the item belongs to.
+            item_id (int): the item's ID number.
+            name (Optional[str]): the item's name, if it has one.
+            content (bytes): the item's raw data.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)",
+                (endpoint, item_id, name, zlib.compress(content, 9)),
+            )
+
+    def commit(self) -> None:
+        """Commits pending writes, so that they survive the process being killed."""
+        with self._lock:
+            self._connection.commit()
+
+    def list(
+        self, endpoint: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Tuple[int, Optional[str]]]:
+        """
+        Returns the ID number and name of the stored items of an endpoint, ordered by ID.
+
+        Args:
+            endpoint (str): the API resource name whose items to list.
+            limit (Optional[int]): the maximum number of items to list, all of them if None.
+            offset (int): the number of items to skip.
+
+        Returns:
+            A list of (ID number, name) tuples.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT id, name FROM items WHERE endpoint = ? ORDER BY id LIMIT ? OFFSET ?",
+                (endpoint, -1 if limit is None else limit, offset),
+            ).fetchall()
+
+    def count(self, endpoint: str) -> int:
+        """Returns the number of stored items of an endpoint."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM items WHERE endpoint = ?", (endpoint,)
+            ).fetchone()[0]
+
+    def ids(self, endpoint: str) -> Set[int]:
+        """Returns the ID numbers of the stored items of an endpoint."""
+        return {item_id for item_id, _ in self.list(endpoint)}
+
+    def iter_content(self, endpoint: str) -> Iterator[Tuple[int, bytes]]:
+        """
+        Iterates over the stored items of an endpoint, ordered by ID.
+
+        Args:
+            endpoint (str): the API resource name whose items to iterate over.
+
+        Returns:
+            An iterator over (ID number, raw data) tuples.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, content FROM items WHERE endpoint = ? ORDER BY id", (endpoint,)
+            ).fetchall()
+        for item_id, content in rows:
+            yield item_id, zlib.decompress(content)
+
+    def is_completed(self, endpoint: str) -> bool:
+        """Whether all items of an endpoint have been stored."""
+        with self._lock:
+            return (
+                self._connection.execute(
+                    "SELECT 1 FROM completed_endpoints WHERE endpoint = ?", (endpoint,)
+                ).fetchone()
+                is not None
+            )
+
+    def mark_completed(self, endpoint: str) -> None:
+        """Records that all items of an endpoint have been stored, and commits them."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO completed_endpoints VALUES (?)", (endpoint,)
+            )
+            self._connection.commit()
+
+
+def mirror_snapshot(
+    client: PokeClient,
+    path: Union[str, Path],
+    resources: Optional[Iterable[str]] = None,
+    page_size: int = 100,
+    max_workers: Optional[int] = None,
+    commit_every: int = 100,
+) -> int:
+    """
+    Crawls the provided endpoints into a snapshot file, querying items in parallel. Endpoints
+    already completed are skipped, as are the items already stored for the others, so that an
+    interrupted mirroring can be resumed by running it again. Items are validated against their
+    model class before being stored, so that clients can trust the snapshot's data.
+
+    Args:
+        client (PokeClient): the client to query the API with.
+        path (Union[str, Path]): location of the snapshot file, created if needed.
+        resources (Optional[Iterable[str]]): the API resource names to mirror, all registered
+                                             endpoints if None.
+        page_size (int): the number of items to request per page of the list endpoints.
+        max_workers (Optional[int]): the maximum number of threads to use, defaults to the
+                                     client's.
+        commit_every (int): the number of items stored between two commits of the snapshot, so
+                            that an interrupted mirroring of a large endpoint loses at most that
+                            many items.
+
+    Returns:
+        The number of items, or item lists, which could not be queried. Their endpoints are left
+        uncompleted.
+    """
+    endpoints: List[Endpoint] = (
+        [get_endpoint(resource) for resource in resources]
+        if resources is not None
+        else list(ENDPOINTS.values())
+    )
+    failures: int = 0
+
+    with Snapshot(path) as snapshot, ThreadPoolExecutor(
+        max_workers=max_workers or client.max_workers
+    ) as executor:
+        for endpoint in endpoints:
+            if snapshot.is_completed(endpoint.name):
+                logger.debug(f"Skipping {endpoint.label} items, already mirrored")
+                continue
+
+            stored: Set[int] = snapshot.ids(endpoint.name)
+            missing: Dict[int, Optional[str]] = {}
+            try:
+                for reference in client.iter_resources(endpoint.name, page_size=page_size):
+                    _, item_id = parse_resource_url(reference.url)
+                    if item_id not in stored:
+                        missing[item_id] = getattr(reference, "name", None)
+            except Exception as error:
+                logger.warning(f"Could not list {endpoint.label} items: {error}")
+                failures += 1
+                continue
+            logger.info(f"Mirroring {len(missing)} {endpoint.label} items")
+
+            futures = {
+                executor.submit(_mirror_item, client, endpoint, item_id): item_id
+                for item_id in missing
+            }
+            endpoint_failures: int = 0
+            for position, future in enumerate(as_completed(futures), start=1):
+                item_id: int = futures[future]
+                try:
+                    snapshot.put(endpoint.name, item_id, missing[item_id], future.result())
+                except Exception as error:
+                    logger.warning(f"Could not mirror {endpoint.label} '{item_id}': {error}")
+                    endpoint_failures += 1
+                if position % commit_every == 0:
+                    snapshot.commit()
+
+            if endpoint_failures:
+                logger.warning(f"{endpoint_failures} {endpoint.label} items failed to mirror")
+                failures += endpoint_failures
+            else:
+                snapshot.mark_completed(endpoint.name)
+    return failures
+
+
+def _mirror_item(client: PokeClient, endpoint: Endpoint, item_id: int) -> bytes:
+    """
+    Queries an item's raw data, and validates all of it against the endpoint's model class,
+    regardless of the client's lazy parsing, compact models or scope.
+    """
+    content: bytes = client._request(endpoint, client.format_query_url(item_id, endpoint.name))
+    endpoint.model(**client.decode(content))
+    return content
@@ -0,0 +1,5 @@
+from .encounters import UNKNOWN_METHOD, EncounterIndex, EncounterRates
+from .evolution import EvolutionIndex, EvolutionNode
+from .learnset import LearnsetIndex
+from .search import SEARCHABLE_RESOURCES, SearchHit, SearchIndex, tokenize
+from .typechart import NO_TYPE, TypeChart
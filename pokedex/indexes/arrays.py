@@ -0,0 +1,18 @@
+"""
+Access to the optional 'numpy' dependency the array-backed indexes are built on, installable with
+the 'indexes' extra.
+"""
+
+from loguru import logger
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def require_numpy() -> None:
+    """Raises an ImportError if the optional 'numpy' dependency is not installed."""
+    if np is None:
+        logger.error("The indexes require 'numpy', which is not installed")
+        raise ImportError("The indexes require 'numpy', install it with the 'indexes' extra")
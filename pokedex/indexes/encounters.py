@@ -0,0 +1,361 @@
+"""
+Encounter index, flattening the encounters of all LocationArea items into columnar arrays, so that
+where and how likely a Pokémon is encountered is aggregated with a few NumPy calls instead of
+querying every area and walking its encounters. It requires the optional 'numpy' dependency,
+installable with the 'indexes' extra.
+
+Each encounter slot is a row of the index: the Pokémon, area, version and method codes, the level
+range, the chance of the slot in percent, and a bitmask of the condition values it requires, such
+as a time of day.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from loguru import logger
+
+from pokedex.indexes.arrays import np, require_numpy
+from pokedex.models import LocationArea
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pokedex.client import PokeClient
+
+_VOCABULARIES: Tuple[str, ...] = ("pokemon", "areas", "versions", "methods", "conditions")
+
+# The method name of the encounter slots whose method is missing from the API's data
+UNKNOWN_METHOD: str = "unknown"
+
+# The integer columns of the index, and their types
+_COLUMNS: Dict[str, str] = {
+    "pokemon": "int32",
+    "areas": "int32",
+    "versions": "int16",
+    "methods": "int16",
+    "min_levels": "int16",
+    "max_levels": "int16",
+    "chances": "int16",
+}
+
+
+class EncounterRates(NamedTuple):
+    """
+    Aggregated encounters, one element per combination of Pokémon or area, version and method.
+    """
+
+    # The names of the areas a Pokémon is encountered in, or of the Pokémon encountered in an area
+    names: "np.ndarray"
+    versions: "np.ndarray"
+    methods: "np.ndarray"
+    # The probabilities, between 0 and 1, to encounter the Pokémon with the method
+    chances: "np.ndarray"
+    min_levels: "np.ndarray"
+    max_levels: "np.ndarray"
+
+
+class EncounterIndex:
+    """
+    All encounter slots of all location areas, queryable by Pokémon or by area. The chances of the
+    slots of a same Pokémon, area, version and method are summed up into the probability that an
+    encounter with that method is with that Pokémon:
+
+        index = EncounterIndex.from_snapshot("pokeapi.db")
+        rates = index.locations("pikachu", version="yellow", conditions=["time-day"])
+        best = rates.names[rates.chances.argmax()]
+
+    The index can be saved to and loaded from disk.
+    """
+
+    def __init__(self):
+        require_numpy()
+        # The names behind the codes of each column holding some
+        self.pokemon: List[str] = []
+        self.areas: List[str] = []
+        self.versions: List[str] = []
+        self.methods: List[str] = []
+        self.conditions: List[str] = []
+        self._codes: Dict[str, Dict[str, int]] = {vocabulary: {} for vocabulary in _VOCABULARIES}
+        # The rows of the index, sorted by Pokémon, and their order by area
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(0, dtype=dtype) for name, dtype in _COLUMNS.items()
+        }
+        self._condition_masks: np.ndarray = np.zeros((0, 0), dtype=np.uint64)
+        self._by_area: np.ndarray = np.zeros(0, dtype=np.intp)
+        self._sorted_areas: np.ndarray = np.zeros(0, dtype=np.int32)
+        # The names behind the codes, as arrays to decode query results with
+        self._names: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._columns["pokemon"])
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({len(self.pokemon)} pokemon, {len(self.areas)} areas, "
+            f"{len(self)} encounter slots)"
+        )
+
+    @classmethod
+    def from_areas(cls, areas: Iterable[LocationArea]) -> "EncounterIndex":
+        """
+        Builds the index from the encounters of the provided LocationArea models. Encounters
+        missing their Pokémon or version are skipped, and those missing their method are indexed
+        with the UNKNOWN_METHOD.
+
+        Args:
+            areas (Iterable[LocationArea]): the model objects of the areas to index.
+
+        Returns:
+            An EncounterIndex of the provided areas.
+        """
+        index = cls()
+        rows: Dict[str, List[int]] = {name: [] for name in _COLUMNS}
+        conditions: List[List[int]] = []
+        for area in areas:
+            area_code: int = index._code("areas", area.name)
+            for pokemon_encounter in area.pokemon_encounters:
+                if pokemon_encounter.pokemon is None:
+                    continue
+                pokemon: int = index._code("pokemon", pokemon_encounter.pokemon.name)
+                for version_detail in pokemon_encounter.version_details:
+                    if version_detail.version is None:
+                        continue
+                    version: int = index._code("versions", version_detail.version.name)
+                    for encounter in version_detail.encounter_details:
+                        method: str = (
+                            encounter.method.name
+                            if encounter.method is not None
+                            else UNKNOWN_METHOD
+                        )
+                        rows["pokemon"].append(pokemon)
+                        rows["areas"].append(area_code)
+                        rows["versions"].append(version)
+                        rows["methods"].append(index._code("methods", method))
+                        rows["min_levels"].append(encounter.min_level)
+                        rows["max_levels"].append(encounter.max_level)
+                        rows["chances"].append(encounter.chance)
+                        conditions.append(
+                            [
+                                index._code("conditions", value.name)
+                                for value in encounter.condition_values
+                            ]
+                        )
+
+        columns: Dict[str, np.ndarray] = {
+            name: np.array(values, dtype=_COLUMNS[name]) for name, values in rows.items()
+        }
+        masks: np.ndarray = np.zeros((len(conditions), _words(len(index.conditions))), np.uint64)
+        for row, codes in enumerate(conditions):
+            masks[row] = index._mask(codes)
+        order: np.ndarray = np.argsort(columns["pokemon"], kind="stable")
+        index._set_rows({name: column[order] for name, column in columns.items()}, masks[order])
+        logger.debug(f"Built the encounter index of {len(index)} encounter slots")
+        return index
+
+    @classmethod
+    def from_client(
+        cls, client: "PokeClient", path: Union[str, Path, None] = None
+    ) -> "EncounterIndex":
+        """
+        Builds the index from all LocationArea items, queried with the provided client. If a path
+        is provided, the index is loaded from it when it exists, and saved to it otherwise.
+
+        Args:
+            client (PokeClient): the client to query the LocationArea items with.
+            path (Union[str, Path, None]): location of the index's file, see `save`.
+
+        Returns:
+            An EncounterIndex of all location areas.
+        """
+        if path is not None and Path(path).exists():
+            return cls.load(path)
+        index: EncounterIndex = cls.from_areas(client.iter_models("location-area"))
+        if path is not None:
+            index.save(path)
+        return index
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot_path: Union[str, Path], path: Union[str, Path, None] = None
+    ) -> "EncounterIndex":
+        """
+        Builds the index from the LocationArea items of a snapshot, see `from_client`.
+
+        Args:
+            snapshot_path (Union[str, Path]): location of the snapshot file to read from.
+            path (Union[str, Path, None]): location of the index's file, see `save`.
+
+        Returns:
+            An EncounterIndex of all location areas of the snapshot.
+        """
+        from pokedex.client import OfflinePokeClient
+
+        with OfflinePokeClient(snapshot_path, cache_size=0) as client:
+            return cls.from_client(client, path)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Saves the index to a NumPy '.npz' file.
+
+        Args:
+            path (Union[str, Path]): location of the file, created or replaced.
+        """
+        logger.debug(f"Saving the encounter index to '{path}'")
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                condition_masks=self._condition_masks,
+                **self._columns,
+                **{
+                    f"{vocabulary}_names": np.array(getattr(self, vocabulary), dtype=str)
+                    for vocabulary in _VOCABULARIES
+                },
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "EncounterIndex":
+        """
+        Loads an index saved with `save`.
+
+        Args:
+            path (Union[str, Path]): location of the file.
+
+        Returns:
+            The saved EncounterIndex.
+        """
+        index = cls()
+        logger.debug(f"Loading the encounter index from '{path}'")
+        with np.load(path, allow_pickle=False) as data:
+            for vocabulary in _VOCABULARIES:
+                names: List[str] = data[f"{vocabulary}_names"].tolist()
+                setattr(index, vocabulary, names)
+                index._codes[vocabulary] = {name: code for code, name in enumerate(names)}
+            index._set_rows({name: data[name] for name in _COLUMNS}, data["condition_masks"])
+        return index
+
+    def locations(
+        self,
+        pokemon: str,
+        version: Optional[str] = None,
+        method: Optional[str] = None,
+        conditions: Optional[Iterable[str]] = None,
+    ) -> EncounterRates:
+        """
+        Returns where, and how likely, a Pokémon is encountered.
+
+        Args:
+            pokemon (str): the Pokémon's name, e.g. 'pikachu'.
+            version (Optional[str]): the name of the version to encounter it in. None means any.
+            method (Optional[str]): the name of the encounter method, e.g. 'walk'. None means any.
+            conditions (Optional[Iterable[str]]): the names of the condition values holding, e.g.
+                                                  ['time-day', 'season-spring']. Slots requiring
+                                                  others are left out. None counts all slots,
+                                                  which overstates the chances of Pokémon found
+                                                  under mutually exclusive conditions.
+
+        Returns:
+            The EncounterRates of the Pokémon, per area, version and method, but will raise a
+            ValueError if a name is not in the index.
+        """
+        code: int = self._code("pokemon", pokemon, add=False)
+        start, stop = np.searchsorted(self._columns["pokemon"], [code, code + 1])
+        return self._aggregate(np.arange(start, stop), "areas", version, method, conditions)
+
+    def pokemon_at(
+        self,
+        area: str,
+        version: Optional[str] = None,
+        method: Optional[str] = None,
+        conditions: Optional[Iterable[str]] = None,
+    ) -> EncounterRates:
+        """
+        Returns which Pokémon are encountered in an area, and how likely.
+
+        Args:
+            area (str): the location area's name, e.g. 'viridian-forest-area'.
+            version (Optional[str]): the name of the version to encounter them in. None means
+                                     any.
+            method (Optional[str]): the name of the encounter method. None means any.
+            conditions (Optional[Iterable[str]]): the names of the condition values holding, see
+                                                  `locations`.
+
+        Returns:
+            The EncounterRates of the area, per Pokémon, version and method, but will raise a
+            ValueError if a name is not in the index.
+        """
+        code: int = self._code("areas", area, add=False)
+        start, stop = np.searchsorted(self._sorted_areas, [code, code + 1])
+        return self._aggregate(self._by_area[start:stop], "pokemon", version, method, conditions)
+
+    def _aggregate(
+        self,
+        rows: "np.ndarray",
+        by: str,
+        version: Optional[str],
+        method: Optional[str],
+        conditions: Optional[Iterable[str]],
+    ) -> EncounterRates:
+        """Sums up the chances of the matching rows, per 'by' column value, version and method."""
+        columns: Dict[str, np.ndarray] = self._columns
+        if version is not None:
+            rows = rows[columns["versions"][rows] == self._code("versions", version, add=False)]
+        if method is not None:
+            rows = rows[columns["methods"][rows] == self._code("methods", method, add=False)]
+        if conditions is not None:
+            allowed: np.ndarray = self._mask(
+                [self._code("conditions", value, add=False) for value in conditions]
+            )
+            rows = rows[~np.any(self._condition_masks[rows] & ~allowed, axis=1)]
+
+        names: np.ndarray = columns[by][rows].astype(np.int64)
+        versions: np.ndarray = columns["versions"][rows].astype(np.int64)
+        methods: np.ndarray = columns["methods"][rows].astype(np.int64)
+        groups, inverse = np.unique(names << 32 | versions << 16 | methods, return_inverse=True)
+        chances: np.ndarray = np.bincount(
+            inverse, weights=columns["chances"][rows], minlength=len(groups)
+        )
+        min_levels: np.ndarray = np.full(len(groups), np.iinfo(np.int16).max, dtype=np.int16)
+        np.minimum.at(min_levels, inverse, columns["min_levels"][rows])
+        max_levels: np.ndarray = np.zeros(len(groups), dtype=np.int16)
+        np.maximum.at(max_levels, inverse, columns["max_levels"][rows])
+        return EncounterRates(
+            names=self._names[by][groups >> 32],
+            versions=self._names["versions"][groups >> 16 & 0xFFFF],
+            methods=self._names["methods"][groups & 0xFFFF],
+            chances=np.minimum(chances / 100, 1.0),
+            min_levels=min_levels,
+            max_levels=max_levels,
+        )
+
+    def _code(self, vocabulary: str, name: str, add: bool = True) -> int:
+        """Returns the code of a name, adding it to the vocabulary if it is new and allowed to."""
+        codes: Dict[str, int] = self._codes[vocabulary]
+        if name not in codes:
+            if not add:
+                logger.error(f"'{name}' is not among the indexed {vocabulary}")
+                raise ValueError(f"Unknown name '{name}', not among the indexed {vocabulary}.")
+            codes[name] = len(codes)
+            getattr(self, vocabulary).append(name)
+        return codes[name]
+
+    def _mask(self, codes: Iterable[int]) -> "np.ndarray":
+        """Returns the bitmask of the provided condition value codes."""
+        mask: np.ndarray = np.zeros(_words(len(self.conditions)), dtype=np.uint64)
+        for code in codes:
+            mask[code // 64] |= np.uint64(1) << np.uint64(code % 64)
+        return mask
+
+    def _set_rows(self, columns: Dict[str, "np.ndarray"], condition_masks: "np.ndarray") -> None:
+        """Sets the rows of the index, sorted by Pokémon, and works out their order by area."""
+        self._names = {
+            vocabulary: np.array(getattr(self, vocabulary), dtype=str)
+            for vocabulary in _VOCABULARIES
+        }
+        self._columns = columns
+        self._condition_masks = condition_masks
+        self._by_area = np.argsort(columns["areas"], kind="stable")
+        self._sorted_areas = columns["areas"][self._by_area]
+
+
+def _words(count: int) -> int:
+    """Returns the number of 64 bits words holding a bitmask of the provided number of bits."""
+    return max(1, -(-count // 64))
+
@@ -0,0 +1,258 @@
+"""
+Evolution index, precomputed from all EvolutionChain items, so that a species' family tree and
+the conditions of its evolutions are looked up in constant time instead of querying and walking
+evolution chains.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from loguru import logger
+
+from pokedex.client.endpoints import parse_resource_url
+from pokedex.models.evolution import ChainLink, EvolutionChain, EvolutionDetail
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pokedex.client import PokeClient
+
+# How the values of the relative_physical_stats condition compare the Attack and Defense stats
+_PHYSICAL_STATS: Dict[int, str] = {
+    1: "attack > defense",
+    0: "attack = defense",
+    -1: "attack < defense",
+}
+
+_GENDERS: Dict[int, str] = {1: "female", 2: "male"}
+
+
+class EvolutionNode(NamedTuple):
+    """The place of a species in its evolution chain, and how it is evolved into."""
+
+    species: str
+    species_id: int
+    chain_id: int
+    is_baby: bool
+    # The stage of the species in its chain, 0 being the base form
+    stage: int
+    parent: Optional[str]
+    children: Tuple[str, ...]
+    # All species the species evolves from, from the base form down to its parent
+    ancestors: Tuple[str, ...]
+    # All species the species evolves into, stage by stage
+    descendants: Tuple[str, ...]
+    # The trigger names and summaries of the ways to evolve into the species from its parent
+    triggers: Tuple[str, ...]
+    conditions: Tuple[str, ...]
+
+    @property
+    def base_form(self) -> str:
+        """The name of the first species of the family."""
+        return self.ancestors[0] if self.ancestors else self.species
+
+
+class EvolutionIndex:
+    """
+    Family trees of all species, worked out once from the evolution chains. Species are looked up
+    either by name or by ID number:
+
+        index = EvolutionIndex.from_client(client)
+        index.base_form("raichu")  # 'pichu'
+        index.conditions("raichu")  # ('use-item (item thunder-stone)',)
+    """
+
+    def __init__(self, nodes: Iterable[EvolutionNode]):
+        """
+        Args:
+            nodes (Iterable[EvolutionNode]): the nodes of all indexed species.
+        """
+        self.nodes: Dict[str, EvolutionNode] = {node.species: node for node in nodes}
+        self._names: Dict[int, str] = {
+            node.species_id: node.species for node in self.nodes.values()
+        }
+        self.chains: Dict[int, Tuple[str, ...]] = {}
+        for node in self.nodes.values():
+            self.chains[node.chain_id] = self.chains.get(node.chain_id, ()) + (node.species,)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, species: Union[str, int]) -> bool:
+        return species in self.nodes or species in self._names
+
+    def __getitem__(self, species: Union[str, int]) -> EvolutionNode:
+        """
+        Returns the node of a species.
+
+        Args:
+            species (Union[str, int]): the species' name or ID number.
+
+        Returns:
+            The species' EvolutionNode, but will raise a KeyError if it is not indexed.
+        """
+        try:
+            return self.nodes[self._names[species] if isinstance(species, int) else species]
+        except KeyError:
+            logger.error(f"Species '{species}' is not in the evolution index")
+            raise KeyError(f"Species '{species}' is not in any indexed evolution chain.")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self.nodes)} species, {len(self.chains)} chains)"
+
+    @classmethod
+    def from_chains(cls, chains: Iterable[EvolutionChain]) -> "EvolutionIndex":
+        """
+        Builds the index from the provided EvolutionChain models.
+
+        Args:
+            chains (Iterable[EvolutionChain]): the model objects of the chains to index.
+
+        Returns:
+            An EvolutionIndex of all species in the provided chains.
+        """
+        nodes: List[EvolutionNode] = []
+        for chain in chains:
+            nodes.extend(_chain_nodes(chain))
+        index = cls(nodes)
+        logger.debug(f"Built the evolution index of {len(index.nodes)} species")
+        return index
+
+    @classmethod
+    def from_client(cls, client: "PokeClient") -> "EvolutionIndex":
+        """
+        Builds the index from all EvolutionChain items, queried with the provided client.
+
+        Args:
+            client (PokeClient): the client to query the EvolutionChain items with.
+
+        Returns:
+            An EvolutionIndex of all species.
+        """
+        return cls.from_chains(client.iter_models("evolution-chain"))
+
+    def chain(self, species: Union[str, int]) -> int:
+        """Returns the ID number of the evolution chain a species belongs to."""
+        return self[species].chain_id
+
+    def family(self, species: Union[str, int]) -> Tuple[str, ...]:
+        """Returns the names of all species in the evolution chain of a species, stage by stage."""
+        return self.chains[self[species].chain_id]
+
+    def ancestors(self, species: Union[str, int]) -> Tuple[str, ...]:
+        """Returns the names of the species a species evolves from, base form first."""
+        return self[species].ancestors
+
+    def descendants(self, species: Union[str, int]) -> Tuple[str, ...]:
+        """Returns the names of all species a species evolves into, stage by stage."""
+        return self[species].descendants
+
+    def base_form(self, species: Union[str, int]) -> str:
+        """Returns the name of the first species of a species' family."""
+        return self[species].base_form
+
+    def stage(self, species: Union[str, int]) -> int:
+        """Returns the stage of a species in its evolution chain, 0 being the base form."""
+        return self[species].stage
+
+    def triggers(self, species: Union[str, int]) -> Tuple[str, ...]:
+        """Returns the names of the triggers evolving a species' parent into it."""
+        return self[species].triggers
+
+    def conditions(self, species: Union[str, int]) -> Tuple[str, ...]:
+        """Returns summaries of the ways to evolve a species' parent into it, see `summarize`."""
+        return self[species].conditions
+
+
+def summarize(detail: EvolutionDetail) -> str:
+    """
+    Returns a short human-readable summary of the conditions of an evolution, e.g.
+    'level-up (level 16, night)'.
+
+    Args:
+        detail (EvolutionDetail): the conditions of the evolution.
+
+    Returns:
+        The trigger's name, followed by the conditions holding a value in parentheses.
+    """
+    conditions: List[str] = []
+    if detail.min_level:
+        conditions.append(f"level {detail.min_level}")
+    if detail.item is not None:
+        conditions.append(f"item {detail.item.name}")
+    if detail.held_item is not None:
+        conditions.append(f"holding {detail.held_item.name}")
+    if detail.known_move is not None:
+        conditions.append(f"knowing {detail.known_move.name}")
+    if detail.known_move_type is not None:
+        conditions.append(f"knowing a {detail.known_move_type.name} move")
+    if detail.location is not None:
+        conditions.append(f"at {detail.location.name}")
+    if detail.min_happiness:
+        conditions.append(f"happiness {detail.min_happiness}")
+    if detail.min_beauty:
+        conditions.append(f"beauty {detail.min_beauty}")
+    if detail.min_affection:
+        conditions.append(f"affection {detail.min_affection}")
+    if detail.gender in _GENDERS:
+        conditions.append(_GENDERS[detail.gender])
+    if detail.time_of_day:
+        conditions.append(detail.time_of_day)
+    if detail.relative_physical_stats in _PHYSICAL_STATS:
+        conditions.append(_PHYSICAL_STATS[detail.relative_physical_stats])
+    if detail.party_species is not None:
+        conditions.append(f"{detail.party_species.name} in party")
+    if detail.party_type is not None:
+        conditions.append(f"{detail.party_type.name} type in party")
+    if detail.trade_species is not None:
+        conditions.append(f"for {detail.trade_species.name}")
+    if detail.needs_overworld_rain:
+        conditions.append("overworld rain")
+    if detail.turn_upside_down:
+        conditions.append("upside down")
+    trigger: str = detail.trigger.name if detail.trigger is not None else "unknown"
+    return f"{trigger} ({', '.join(conditions)})" if conditions else trigger
+
+
+def _chain_nodes(chain: EvolutionChain) -> List[EvolutionNode]:
+    """Works out the nodes of all species of an evolution chain, stage by stage."""
+    # Links of each stage, with the names of their ancestors, walked breadth first
+    stages: List[List[Tuple[ChainLink, Tuple[str, ...]]]] = [[(chain.chain, ())]]
+    while stages[-1]:
+        stages.append(
+            [
+                (child, ancestors + (link.species.name,))
+                for link, ancestors in stages[-1]
+                for child in link.evolves_to
+            ]
+        )
+
+    descendants: Dict[str, List[str]] = {}
+    for stage in stages[1:]:
+        for link, ancestors in stage:
+            for ancestor in ancestors:
+                descendants.setdefault(ancestor, []).append(link.species.name)
+
+    nodes: List[EvolutionNode] = []
+    for depth, stage in enumerate(stages):
+        for link, ancestors in stage:
+            name: str = link.species.name
+            nodes.append(
+                EvolutionNode(
+                    species=name,
+                    species_id=parse_resource_url(link.species.url)[1],
+                    chain_id=chain.id,
+                    is_baby=link.is_baby,
+                    stage=depth,
+                    parent=ancestors[-1] if ancestors else None,
+                    children=tuple(child.species.name for child in link.evolves_to),
+                    ancestors=ancestors,
+                    descendants=tuple(descendants.get(name, ())),
+                    triggers=tuple(
+                        dict.fromkeys(
+                            detail.trigger.name
+                            for detail in link.evolution_details
+                            if detail.trigger is not None
+                        )
+                    ),
+                    conditions=tuple(summarize(detail) for detail in link.evolution_details),
+                )
+            )
+    return nodes
@@ -0,0 +1,339 @@
+"""
+Inverted learnset index, precomputed from the moves of all Pokemon items, so that the Pokémon
+learning a move are looked up with binary searches instead of querying every Pokémon and walking
+their moves. It requires the optional 'numpy' dependency, installable with the 'indexes' extra.
+
+Each way a Pokémon learns a move is a row of the index: an integer key coding the move, version
+group and learn method, the level it is learned at, and the Pokémon's ID number. Rows are sorted
+by key then level, so that the rows of a move, of a move in a version group, or of a move in a
+version group by a learn method are contiguous, and level ranges within the latter are found
+with a binary search.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from pokedex.indexes.arrays import np, require_numpy
+from pokedex.models import Pokemon
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pokedex.client import PokeClient
+
+# Bit offsets of the move and version group codes in the keys, the learn method's taking the
+# lowest bits
+_MOVE_SHIFT: int = 32
+_VERSION_GROUP_SHIFT: int = 16
+
+_VOCABULARIES: Tuple[str, ...] = ("moves", "version_groups", "methods")
+
+
+class LearnsetIndex:
+    """
+    The Pokémon learning each move, per version group and learn method, along with the level they
+    learn it at. Moves, version groups and learn methods are looked up by name, and Pokémon are
+    returned as ID numbers, see `names` to get their names:
+
+        index = LearnsetIndex.from_client(client, path="learnsets.npz")
+        pokemon_ids, levels = index.learners("earthquake", "sword-shield", "level-up", max_level=39)
+
+    The index can be saved to and loaded from disk, and updated with the new data of some Pokémon
+    without being built again from all of them.
+    """
+
+    def __init__(self):
+        require_numpy()
+        # The names behind the codes of moves, version groups and learn methods
+        self.moves: List[str] = []
+        self.version_groups: List[str] = []
+        self.methods: List[str] = []
+        self._codes: Dict[str, Dict[str, int]] = {vocabulary: {} for vocabulary in _VOCABULARIES}
+        self.pokemon: Dict[int, str] = {}
+        self._pokemon_ids: Dict[str, int] = {}
+        # The rows of the index, sorted by key and level
+        self._keys: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._levels: np.ndarray = np.zeros(0, dtype=np.int16)
+        self._pokemon: np.ndarray = np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({len(self.pokemon)} pokemon, {len(self.moves)} moves, "
+            f"{len(self)} rows)"
+        )
+
+    @classmethod
+    def from_pokemon(cls, pokemons: Iterable[Pokemon]) -> "LearnsetIndex":
+        """
+        Builds the index from the moves of the provided Pokemon models.
+
+        Args:
+            pokemons (Iterable[Pokemon]): the model objects of the Pokémon to index.
+
+        Returns:
+            A LearnsetIndex of the provided Pokémon.
+        """
+        index = cls()
+        index.update(pokemons)
+        return index
+
+    @classmethod
+    def from_client(
+        cls, client: "PokeClient", path: Union[str, Path, None] = None
+    ) -> "LearnsetIndex":
+        """
+        Builds the index from all Pokemon items, queried with the provided client. If a path is
+        provided, the index is loaded from it when it exists, and saved to it otherwise.
+
+        Args:
+            client (PokeClient): the client to query the Pokemon items with.
+            path (Union[str, Path, None]): location of the index's file, see `save`.
+
+        Returns:
+            A LearnsetIndex of all Pokémon.
+        """
+        if path is not None and Path(path).exists():
+            return cls.load(path)
+        index: LearnsetIndex = cls.from_pokemon(client.iter_models("pokemon"))
+        if path is not None:
+            index.save(path)
+        return index
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Saves the index to a NumPy '.npz' file.
+
+        Args:
+            path (Union[str, Path]): location of the file, created or replaced.
+        """
+        logger.debug(f"Saving the learnset index to '{path}'")
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                keys=self._keys,
+                levels=self._levels,
+                pokemon=self._pokemon,
+                pokemon_ids=np.array(list(self.pokemon), dtype=np.int32),
+                pokemon_names=np.array(list(self.pokemon.values()), dtype=str),
+                **{
+                    vocabulary: np.array(getattr(self, vocabulary), dtype=str)
+                    for vocabulary in _VOCABULARIES
+                },
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LearnsetIndex":
+        """
+        Loads an index saved with `save`.
+
+        Args:
+            path (Union[str, Path]): location of the file.
+
+        Returns:
+            The saved LearnsetIndex.
+        """
+        index = cls()
+        logger.debug(f"Loading the learnset index from '{path}'")
+        with np.load(path, allow_pickle=False) as data:
+            for vocabulary in _VOCABULARIES:
+                names: List[str] = data[vocabulary].tolist()
+                setattr(index, vocabulary, names)
+                index._codes[vocabulary] = {name: code for code, name in enumerate(names)}
+            index.pokemon = dict(
+                zip(data["pokemon_ids"].tolist(), data["pokemon_names"].tolist())
+            )
+            index._pokemon_ids = {name: pokemon_id for pokemon_id, name in index.pokemon.items()}
+            index._keys = data["keys"]
+            index._levels = data["levels"]
+            index._pokemon = data["pokemon"]
+        return index
+
+    def update(self, pokemons: Iterable[Pokemon]) -> None:
+        """
+        Indexes the moves of the provided Pokemon models, replacing the rows of those already
+        indexed. Only the new rows are worked out, and merged with the others.
+
+        Args:
+            pokemons (Iterable[Pokemon]): the model objects of the Pokémon to (re)index.
+        """
+        updated: List[int] = []
+        keys: List[int] = []
+        levels: List[int] = []
+        pokemon: List[int] = []
+        for model in pokemons:
+            updated.append(model.id)
+            previous: Optional[str] = self.pokemon.get(model.id)
+            if previous is not None and self._pokemon_ids.get(previous) == model.id:
+                del self._pokemon_ids[previous]  # the Pokémon was renamed
+            self.pokemon[model.id] = model.name
+            self._pokemon_ids[model.name] = model.id
+            for pokemon_move in model.moves:
+                move: int = self._code("moves", pokemon_move.move.name) << _MOVE_SHIFT
+                for detail in pokemon_move.version_group_details:
+                    version_group: int = self._code("version_groups", detail.version_group.name)
+                    method: int = self._code("methods", detail.move_learn_method.name)
+                    keys.append(move | (version_group << _VERSION_GROUP_SHIFT) | method)
+                    levels.append(detail.level_learned_at or 0)
+                    pokemon.append(model.id)
+
+        self._merge(
+            ~np.isin(self._pokemon, np.array(updated, dtype=np.int32)),
+            np.array(keys, dtype=np.int64),
+            np.array(levels, dtype=np.int16),
+            np.array(pokemon, dtype=np.int32),
+        )
+        logger.debug(f"Indexed {len(keys)} learnset rows, {len(self)} in total")
+
+    def remove(self, pokemon: Union[str, int]) -> None:
+        """
+        Removes a Pokémon, and all of its rows, from the index.
+
+        Args:
+            pokemon (Union[str, int]): the Pokémon's name or ID number.
+        """
+        pokemon_id: int = self._pokemon_id(pokemon)
+        self._pokemon_ids.pop(self.pokemon.pop(pokemon_id))
+        self._merge(self._pokemon != pokemon_id)
+
+    def learners(
+        self,
+        move: str,
+        version_group: Optional[str] = None,
+        method: Optional[str] = None,
+        min_level: Optional[int] = None,
+        max_level: Optional[int] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Returns the Pokémon learning a move, and the level they learn it at. A Pokémon learning
+        the move in several ways, e.g. in several version groups, is returned for each of them.
+
+        Args:
+            move (str): the move's name, e.g. 'earthquake'.
+            version_group (Optional[str]): the name of the version group to learn the move in.
+                                           None means any.
+            method (Optional[str]): the name of the learn method, e.g. 'level-up'. None means
+                                    any. Can only be provided along with a version group.
+            min_level (Optional[int]): the lowest level to learn the move at, included.
+            max_level (Optional[int]): the highest level to learn the move at, included.
+
+        Returns:
+            A tuple of two arrays: the Pokémon's ID numbers, and the levels they learn the move
+            at, 0 for learn methods without levels. They are ordered by level when both the
+            version group and method are provided, but will raise a ValueError if a name is not
+            in the index.
+        """
+        if method is not None and version_group is None:
+            logger.error("A learn method was provided without any version group")
+            raise ValueError("Querying by learn method requires a version group.")
+        low: int = self._code("moves", move, add=False) << _MOVE_SHIFT
+        span: int = 1 << _MOVE_SHIFT
+        if version_group is not None:
+            low |= self._code("version_groups", version_group, add=False) << _VERSION_GROUP_SHIFT
+            span = 1 << _VERSION_GROUP_SHIFT
+        if method is not None:
+            low |= self._code("methods", method, add=False)
+            span = 1
+        start, stop = np.searchsorted(self._keys, [low, low + span])
+        levels: np.ndarray = self._levels[start:stop]
+        pokemon: np.ndarray = self._pokemon[start:stop]
+
+        if span == 1:  # levels are sorted within a single key
+            first, last = 0, len(levels)
+            if min_level is not None:
+                first = np.searchsorted(levels, min_level, side="left")
+            if max_level is not None:
+                last = np.searchsorted(levels, max_level, side="right")
+            return pokemon[first:last], levels[first:last]
+        mask: np.ndarray = np.ones(len(levels), dtype=bool)
+        if min_level is not None:
+            mask &= levels >= min_level
+        if max_level is not None:
+            mask &= levels <= max_level
+        return pokemon[mask], levels[mask]
+
+    def moves_of(
+        self,
+        pokemon: Union[str, int],
+        version_group: Optional[str] = None,
+        method: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Returns the names of the moves a Pokémon learns.
+
+        Args:
+            pokemon (Union[str, int]): the Pokémon's name or ID number.
+            version_group (Optional[str]): the name of the version group to learn the moves in.
+                                           None means any.
+            method (Optional[str]): the name of the learn method. None means any.
+
+        Returns:
+            The sorted names of the moves.
+        """
+        keys: np.ndarray = self._keys[self._pokemon == self._pokemon_id(pokemon)]
+        if version_group is not None:
+            code: int = self._code("version_groups", version_group, add=False)
+            keys = keys[(keys >> _VERSION_GROUP_SHIFT) & 0xFFFF == code]
+        if method is not None:
+            keys = keys[keys & 0xFFFF == self._code("methods", method, add=False)]
+        return sorted(self.moves[code] for code in np.unique(keys >> _MOVE_SHIFT).tolist())
+
+    def names(self, pokemon_ids: Iterable[int]) -> List[str]:
+        """Returns the names of the Pokémon with the provided ID numbers."""
+        return [self.pokemon[pokemon_id] for pokemon_id in np.asarray(pokemon_ids).tolist()]
+
+    def _code(self, vocabulary: str, name: str, add: bool = True) -> int:
+        """Returns the code of a name, adding it to the vocabulary if it is new and allowed to."""
+        codes: Dict[str, int] = self._codes[vocabulary]
+        if name not in codes:
+            if not add:
+                logger.error(f"'{name}' is not among the indexed {vocabulary}")
+                raise ValueError(f"Unknown name '{name}', not among the indexed {vocabulary}.")
+            codes[name] = len(codes)
+            getattr(self, vocabulary).append(name)
+        return codes[name]
+
+    def _pokemon_id(self, pokemon: Union[str, int]) -> int:
+        """Returns the ID number of an indexed Pokémon."""
+        pokemon_id: Optional[int] = (
+            pokemon if isinstance(pokemon, int) else self._pokemon_ids.get(pokemon)
+        )
+        if pokemon_id not in self.pokemon:
+            logger.error(f"Pokemon '{pokemon}' is not in the learnset index")
+            raise KeyError(f"Pokemon '{pokemon}' is not in the learnset index.")
+        return pokemon_id
+
+    def _merge(
+        self,
+        kept: "np.ndarray",
+        keys: Optional["np.ndarray"] = None,
+        levels: Optional["np.ndarray"] = None,
+        pokemon: Optional["np.ndarray"] = None,
+    ) -> None:
+        """Keeps the masked rows of the index, adds the provided ones, and sorts them all."""
+        self._keys, self._levels, self._pokemon = (
+            self._keys[kept],
+            self._levels[kept],
+            self._pokemon[kept],
+        )
+        if keys is None or not len(keys):
+            return
+        order: np.ndarray = np.lexsort((pokemon, levels, keys))
+        keys, levels, pokemon = keys[order], levels[order], pokemon[order]
+        # Both sets of rows are sorted, find where each new one goes among the kept ones
+        positions: np.ndarray = _insertion_points(self._keys, self._levels, keys, levels)
+        self._keys = np.insert(self._keys, positions, keys)
+        self._levels = np.insert(self._levels, positions, levels)
+        self._pokemon = np.insert(self._pokemon, positions, pokemon)
+
+
+def _insertion_points(
+    keys: "np.ndarray", levels: "np.ndarray", new_keys: "np.ndarray", new_levels: "np.ndarray"
+) -> "np.ndarray":
+    """Returns where to insert sorted rows among sorted ones, to keep them sorted."""
+    # Keys take 47 bits as long as there are fewer than 32768 moves, and levels fit in 16, so that
+    # rows sort as a single integer
+    combined: np.ndarray = keys << 16 | levels.astype(np.int64)
+    return np.searchsorted(combined, new_keys << 16 | new_levels.astype(np.int64), side="right")
@@ -0,0 +1,410 @@
+"""
+Multilingual full-text search over the localized texts of items, such as their names, flavor texts,
+effects and genera. Texts are tokenized into an inverted index ranked with BM25, which is saved
+as plain NumPy arrays and memory-mapped when loaded, so that queries only touch the postings of
+their terms. It requires the optional 'numpy' dependency, installable with the 'indexes' extra.
+
+Each item is indexed as one document per language, holding all of its texts in that language.
+Words are lowercased and stripped of accents, so that 'pokemon' matches 'POKéMON', while runs of
+Chinese and Japanese characters, which are not separated by spaces, are split into overlapping
+bigrams. These characters are also indexed on their own, so that single-character queries match.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pokedex.client.endpoints import ENDPOINTS
+from pokedex.indexes.arrays import np, require_numpy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pokedex.client import PokeClient
+
+# The resources indexed by default, whose items are the ones looked up in a search box
+SEARCHABLE_RESOURCES: Tuple[str, ...] = ("pokemon-species", "move", "item", "ability")
+
+# The fields of localized entries holding text, e.g. Name.name or VerboseEffect.short_effect
+_TEXT_FIELDS: Tuple[str, ...] = (
+    "name",
+    "genus",
+    "flavor_text",
+    "text",
+    "effect",
+    "short_effect",
+    "description",
+)
+
+# Han characters, kana and half-width kana, written without spaces between words
+_CJK_CHARACTERS = "぀-ヿ㐀-䶿一-鿿豈-﫿ｦ-ﾟ"
+_TOKEN = re.compile(rf"([{_CJK_CHARACTERS}]+)|((?:(?![{_CJK_CHARACTERS}])\w)+)")
+
+# BM25 parameters: term frequency saturation and document length normalization
+_K1: float = 1.2
+_B: float = 0.75
+
+# The arrays of a saved index, each in its own file so that it can be memory-mapped
+_ARRAYS: Tuple[str, ...] = (
+    "terms",
+    "indptr",
+    "documents",
+    "impacts",
+    "resources",
+    "languages",
+    "item_ids",
+    "item_names",
+    "resource_names",
+    "language_names",
+)
+
+_MODEL_RESOURCES: Dict[Type[BaseModel], str] = {
+    endpoint.model: endpoint.name for endpoint in ENDPOINTS.values()
+}
+
+
+class SearchHit(NamedTuple):
+    """A document matching a query: an item's texts in one language."""
+
+    resource: str
+    item_id: int
+    name: str
+    language: str
+    score: float
+
+
+def tokenize(text: str, unigrams: bool = False) -> List[str]:
+    """
+    Splits a text into the terms it is indexed and queried with: lowercased words stripped of
+    accents, and overlapping bigrams of Chinese and Japanese characters. Single characters are
+    kept as they are.
+
+    Args:
+        text (str): the text to tokenize, in any language.
+        unigrams (bool): whether to also keep each Chinese and Japanese character on its own, as
+                         done for indexed texts, so that single-character queries match them.
+
+    Returns:
+        The text's terms, in order.
+    """
+    tokens: List[str] = []
+    for cjk, word in _TOKEN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if cjk:
+            if unigrams or len(cjk) == 1:
+                tokens.extend(cjk)
+            tokens.extend(cjk[i : i + 2] for i in range(len(cjk) - 1))
+        else:
+            stripped = "".join(
+                character
+                for character in unicodedata.normalize("NFKD", word)
+                if not unicodedata.combining(character)
+            )
+            tokens.append(unicodedata.normalize("NFC", stripped))
+    return tokens
+
+
+class SearchIndex:
+    """
+    Inverted index of the localized texts of items, ranking matches with BM25. Postings are held
+    in compressed sparse row arrays: the documents holding each term, along with the precomputed
+    BM25 impact of the term on them, so that scoring a query sums a few array slices:
+
+        index = SearchIndex.from_snapshot("pokeapi.db", path="search-index")
+        index.search("thunder stone", resources=["item"], language="en")
+        index.search("ピカチュウ")
+
+    Indexes are saved to a directory of NumPy files, which `load` memory-maps.
+    """
+
+    def __init__(self, arrays: Dict[str, "np.ndarray"]):
+        """
+        Args:
+            arrays (Dict[str, np.ndarray]): the arrays of the index, as built by `from_models`.
+        """
+        require_numpy()
+        # Arrays are held as plain views: memory-mapped ones stay backed by their files, without
+        # the overhead of indexing np.memmap objects.
+        # Sorted terms, and for each of them the range of its postings
+        self.terms: np.ndarray = np.asarray(arrays["terms"])
+        self.indptr: np.ndarray = np.asarray(arrays["indptr"])
+        # The document and BM25 impact of each posting
+        self.documents: np.ndarray = np.asarray(arrays["documents"])
+        self.impacts: np.ndarray = np.asarray(arrays["impacts"])
+        # The resource and language codes, item ID number and item name of each document
+        self.resources: np.ndarray = np.asarray(arrays["resources"])
+        self.languages: np.ndarray = np.asarray(arrays["languages"])
+        self.item_ids: np.ndarray = np.asarray(arrays["item_ids"])
+        self.item_names: np.ndarray = np.asarray(arrays["item_names"])
+        self.resource_names: List[str] = arrays["resource_names"].tolist()
+        self.language_names: List[str] = arrays["language_names"].tolist()
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} documents, {len(self.terms)} terms)"
+
+    @classmethod
+    def from_models(cls, models: Iterable[BaseModel]) -> "SearchIndex":
+        """
+        Builds the index from the localized texts of the provided model objects, which should be
+        of endpoint model classes, e.g. Move or PokemonSpecies.
+
+        Args:
+            models (Iterable[BaseModel]): the model objects of the items to index.
+
+        Returns:
+            A SearchIndex of the provided items.
+        """
+        require_numpy()
+        resource_codes: Dict[str, int] = {}
+        language_codes: Dict[str, int] = {}
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        resources: List[int] = []
+        languages: List[int] = []
+        item_ids: List[int] = []
+        item_names: List[str] = []
+        lengths: List[int] = []
+
+        for model in models:
+            resource: int = resource_codes.setdefault(
+                _MODEL_RESOURCES[type(model)], len(resource_codes)
+            )
+            for language, texts in _localized_texts(model).items():
+                counts: Counter = Counter(
+                    token for text in texts for token in tokenize(text, unigrams=True)
+                )
+                if not counts:
+                    continue
+                document: int = len(resources)
+                for term, frequency in counts.items():
+                    postings.setdefault(term, []).append((document, frequency))
+                resources.append(resource)
+                languages.append(language_codes.setdefault(language, len(language_codes)))
+                item_ids.append(model.id)
+                item_names.append(model.name)
+                lengths.append(sum(counts.values()))
+
+        terms: List[str] = sorted(postings)
+        lengths_array: np.ndarray = np.array(lengths, dtype=np.float32)
+        average_length: float = float(lengths_array.mean()) if lengths else 1.0
+        norms: np.ndarray = _K1 * (1 - _B + _B * lengths_array / average_length)
+        indptr: np.ndarray = np.zeros(len(terms) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(postings[term]) for term in terms])
+        documents: np.ndarray = np.empty(indptr[-1], dtype=np.int32)
+        impacts: np.ndarray = np.empty(indptr[-1], dtype=np.float32)
+        for position, term in enumerate(terms):
+            term_documents, frequencies = zip(*postings[term])
+            start, stop = indptr[position], indptr[position + 1]
+            documents[start:stop] = term_documents
+            frequencies = np.array(frequencies, dtype=np.float32)
+            matched: int = len(frequencies)
+            idf: float = np.log(1 + (len(lengths) - matched + 0.5) / (matched + 0.5))
+            impacts[start:stop] = (
+                idf * frequencies * (_K1 + 1) / (frequencies + norms[documents[start:stop]])
+            )
+
+        index = cls(
+            {
+                "terms": np.array(terms, dtype=str),
+                "indptr": indptr,
+                "documents": documents,
+                "impacts": impacts,
+                "resources": np.array(resources, dtype=np.int16),
+                "languages": np.array(languages, dtype=np.int16),
+                "item_ids": np.array(item_ids, dtype=np.int32),
+                "item_names": np.array(item_names, dtype=str),
+                "resource_names": np.array(list(resource_codes), dtype=str),
+                "language_names": np.array(list(language_codes), dtype=str),
+            }
+        )
+        logger.debug(f"Built the search index of {len(index)} documents")
+        return index
+
+    @classmethod
+    def from_client(
+        cls,
+        client: "PokeClient",
+        resources: Iterable[str] = SEARCHABLE_RESOURCES,
+        path: Union[str, Path, None] = None,
+    ) -> "SearchIndex":
+        """
+        Builds the index from all items of the provided resources, queried with the provided
+        client. If a path is provided, the index is loaded from it when it exists, and saved to
+        it otherwise.
+
+        Args:
+            client (PokeClient): the client to query the items with.
+            resources (Iterable[str]): the API resource names whose items to index.
+            path (Union[str, Path, None]): location of the index's directory, see `save`.
+
+        Returns:
+            A SearchIndex of all items of the resources.
+        """
+        if path is not None and Path(path).exists():
+            return cls.load(path)
+        index: SearchIndex = cls.from_models(
+            model for resource in resources for model in client.iter_models(resource)
+        )
+        if path is not None:
+            index.save(path)
+        return index
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot_path: Union[str, Path],
+        resources: Iterable[str] = SEARCHABLE_RESOURCES,
+        path: Union[str, Path, None] = None,
+    ) -> "SearchIndex":
+        """
+        Builds the index from the items of a snapshot, see `from_client`.
+
+        Args:
+            snapshot_path (Union[str, Path]): location of the snapshot file to read from.
+            resources (Iterable[str]): the API resource names whose items to index.
+            path (Union[str, Path, None]): location of the index's directory, see `save`.
+
+        Returns:
+            A SearchIndex of all items of the resources in the snapshot.
+        """
+        from pokedex.client import OfflinePokeClient
+
+        with OfflinePokeClient(snapshot_path, cache_size=0) as client:
+            return cls.from_client(client, resources, path)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Saves the index to a directory, holding one NumPy '.npy' file per array.
+
+        Args:
+            path (Union[str, Path]): location of the directory, created if needed. Files of a
+                                     previously saved index are replaced.
+        """
+        logger.debug(f"Saving the search index to '{path}'")
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        arrays: Dict[str, np.ndarray] = {
+            **{name: getattr(self, name) for name in _ARRAYS[:-2]},
+            "resource_names": np.array(self.resource_names, dtype=str),
+            "language_names": np.array(self.language_names, dtype=str),
+        }
+        for name, array in arrays.items():
+            np.save(directory / f"{name}.npy", array, allow_pickle=False)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SearchIndex":
+        """
+        Loads an index saved with `save`, memory-mapping its arrays rather than reading them.
+
+        Args:
+            path (Union[str, Path]): location of the directory.
+
+        Returns:
+            The saved SearchIndex.
+        """
+        require_numpy()
+        logger.debug(f"Loading the search index from '{path}'")
+        return cls(
+            {
+                name: np.load(Path(path) / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+                for name in _ARRAYS
+            }
+        )
+
+    def search(
+        self,
+        query: str,
+        resources: Optional[Iterable[str]] = None,
+        language: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[SearchHit]:
+        """
+        Returns the documents best matching a query, ranked by their BM25 score.
+
+        Args:
+            query (str): the text to search for, in any language.
+            resources (Optional[Iterable[str]]): the API resource names to restrict the search to,
+                                                 e.g. ['move']. None means all of them.
+            language (Optional[str]): the name of the language to restrict the search to, e.g.
+                                      'ja'. None means all of them.
+            limit (int): the maximum number of hits to return.
+
+        Returns:
+            The best matching documents, best first.
+        """
+        terms: np.ndarray = np.unique(np.array(tokenize(query), dtype=str))
+        if not len(terms) or not len(self.terms):
+            return []
+        positions: np.ndarray = np.minimum(np.searchsorted(self.terms, terms), len(self.terms) - 1)
+        positions = positions[self.terms[positions] == terms]
+
+        if not len(positions):
+            return []
+        # Postings of all query terms, summed per document
+        bounds: List[Tuple[int, int]] = [
+            (self.indptr[position], self.indptr[position + 1]) for position in positions.tolist()
+        ]
+        documents, inverse = np.unique(
+            np.concatenate([self.documents[start:stop] for start, stop in bounds]),
+            return_inverse=True,
+        )
+        scores: np.ndarray = np.bincount(
+            inverse, weights=np.concatenate([self.impacts[start:stop] for start, stop in bounds])
+        )
+
+        kept: np.ndarray = np.ones(len(documents), dtype=bool)
+        if resources is not None:
+            codes: List[int] = [
+                self.resource_names.index(name) for name in resources if name in self.resource_names
+            ]
+            kept &= np.isin(self.resources[documents], codes)
+        if language is not None:
+            code: int = (
+                self.language_names.index(language) if language in self.language_names else -1
+            )
+            kept &= self.languages[documents] == code
+        documents, scores = documents[kept], scores[kept]
+
+        if len(documents) > limit:
+            best: np.ndarray = np.argpartition(-scores, limit)[:limit]
+            documents, scores = documents[best], scores[best]
+        order: np.ndarray = np.argsort(-scores, kind="stable")
+        documents, scores = documents[order], scores[order]
+        return [
+            SearchHit(
+                resource=self.resource_names[resource],
+                item_id=item_id,
+                name=name,
+                language=self.language_names[language_code],
+                score=score,
+            )
+            for resource, item_id, name, language_code, score in zip(
+                self.resources[documents].tolist(),
+                self.item_ids[documents].tolist(),
+                self.item_names[documents].tolist(),
+                self.languages[documents].tolist(),
+                scores.tolist(),
+            )
+        ]
+
+
+def _localized_texts(model: BaseModel) -> Dict[str, List[str]]:
+    """Gathers the texts of the localized entries of a model object, per language name."""
+    texts: Dict[str, List[str]] = {}
+    for field in model.__fields__:
+        value = getattr(model, field)
+        if not isinstance(value, (list, tuple)):
+            continue
+        for entry in value:
+            language = getattr(entry, "language", None)
+            if language is None:
+                continue
+            for text_field in _TEXT_FIELDS:
+                text = getattr(entry, text_field, None)
+                if isinstance(text, str):
+                    texts.setdefault(language.name, []).append(text)
+    return texts
@@ -0,0 +1,247 @@
+"""
+Type effectiveness chart, precomputed from the damage relations of all Type items into a NumPy
+matrix, so that matchups are scored by array lookups instead of walking the relations lists of
+Type models. It requires the optional 'numpy' dependency, installable with the 'indexes' extra.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+
+from pokedex.indexes.arrays import np, require_numpy
+from pokedex.models import Type
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pokedex.client import PokeClient
+
+# The index standing for no type at all, e.g. for the second type of single-typed defenders
+NO_TYPE: int = -1
+
+# The damage multiplier each relations list stands for, and whether the Type holding the list is
+# the attacking one
+_RELATIONS: Tuple[Tuple[str, float, bool], ...] = (
+    ("no_damage_to", 0.0, True),
+    ("half_damage_to", 0.5, True),
+    ("double_damage_to", 2.0, True),
+    ("no_damage_from", 0.0, False),
+    ("half_damage_from", 0.5, False),
+    ("double_damage_from", 2.0, False),
+)
+
+TypeIndices = Union[str, int, Sequence[Optional[str]], Sequence[int], "np.ndarray"]
+
+
+class TypeChart:
+    """
+    Damage multipliers of every attacking type against every defending type, held in an N×N
+    matrix with rows for attacking types and columns for defending ones. Types are identified
+    either by name or by their index in the chart, see `indices`, and scoring methods take
+    arrays of them to score many matchups in a single NumPy call:
+
+        chart = TypeChart.from_client(client, path="typechart.npz")
+        chart.score(["electric", "ground"], ["water", "electric"], ["flying", None])
+        # array([4., 2.])
+
+    Charts can be saved to and loaded from disk, which is much faster than building them from the
+    Type items again.
+    """
+
+    def __init__(self, names: Sequence[str], matrix: "np.ndarray"):
+        """
+        Args:
+            names (Sequence[str]): the names of the types, in the order of the matrix' rows and
+                                   columns.
+            matrix (np.ndarray): the N×N damage multipliers, attacking types along the rows.
+        """
+        require_numpy()
+        self.names: Tuple[str, ...] = tuple(names)
+        self.matrix: np.ndarray = np.asarray(matrix, dtype=np.float32)
+        if self.matrix.shape != (len(self.names), len(self.names)):
+            logger.error(f"Matrix of shape {self.matrix.shape} for {len(self.names)} types")
+            raise ValueError(
+                f"The matrix should be of shape {(len(self.names), len(self.names))}, "
+                f"got {self.matrix.shape}."
+            )
+        self.index: Dict[str, int] = {name: index for index, name in enumerate(self.names)}
+        # Sorted names, to look up arrays of names at once with a binary search
+        self._order: np.ndarray = np.argsort(np.array(self.names))
+        self._sorted_names: np.ndarray = np.array(self.names)[self._order]
+        # Same matrix with an extra row and column of ones, which NO_TYPE indices land on
+        self._padded: np.ndarray = np.ones((len(self.names) + 1,) * 2, dtype=np.float32)
+        self._padded[:-1, :-1] = self.matrix
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} types)"
+
+    @classmethod
+    def from_types(cls, types: Iterable[Type]) -> "TypeChart":
+        """
+        Builds the chart from the damage relations of the provided Type models. Relations to
+        types not among them are ignored.
+
+        Args:
+            types (Iterable[Type]): the model objects of all types to chart.
+
+        Returns:
+            A TypeChart of the provided types, in the provided order.
+        """
+        require_numpy()
+        types = list(types)
+        index: Dict[str, int] = {type_.name: position for position, type_ in enumerate(types)}
+        matrix: np.ndarray = np.ones((len(types), len(types)), dtype=np.float32)
+        for position, type_ in enumerate(types):
+            for relation, multiplier, attacking in _RELATIONS:
+                for other in getattr(type_.damage_relations, relation):
+                    if other.name not in index:
+                        continue
+                    if attacking:
+                        matrix[position, index[other.name]] = multiplier
+                    else:
+                        matrix[index[other.name], position] = multiplier
+        logger.debug(f"Built the type chart of {len(types)} types")
+        return cls([type_.name for type_ in types], matrix)
+
+    @classmethod
+    def from_client(
+        cls, client: "PokeClient", path: Union[str, Path, None] = None
+    ) -> "TypeChart":
+        """
+        Builds the chart from all Type items, queried with the provided client. If a path is
+        provided, the chart is loaded from it when it exists, and saved to it otherwise.
+
+        Args:
+            client (PokeClient): the client to query the Type items with.
+            path (Union[str, Path, None]): location of the chart's file, see `save`.
+
+        Returns:
+            A TypeChart of all types, ordered as listed by the API.
+        """
+        if path is not None and Path(path).exists():
+            return cls.load(path)
+        chart: TypeChart = cls.from_types(client.iter_models("type"))
+        if path is not None:
+            chart.save(path)
+        return chart
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Saves the chart to a NumPy '.npz' file.
+
+        Args:
+            path (Union[str, Path]): location of the file, created or replaced.
+        """
+        logger.debug(f"Saving the type chart to '{path}'")
+        with open(path, "wb") as file:
+            np.savez(file, names=np.array(self.names), matrix=self.matrix)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TypeChart":
+        """
+        Loads a chart saved with `save`.
+
+        Args:
+            path (Union[str, Path]): location of the file.
+
+        Returns:
+            The saved TypeChart.
+        """
+        require_numpy()
+        logger.debug(f"Loading the type chart from '{path}'")
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["names"].tolist(), data["matrix"])
+
+    def indices(self, types: TypeIndices) -> "np.ndarray":
+        """
+        Returns the chart indices of the provided types. None stands for no type at all, and gets
+        the NO_TYPE index. Integers are taken as indices already, and returned as they are.
+
+        Args:
+            types (TypeIndices): a type name, or an array of them, or of indices.
+
+        Returns:
+            An integer array of the same shape, holding the indices of the types, but will raise
+            a ValueError if a name is not in the chart.
+        """
+        array: np.ndarray = np.asarray(types)
+        if array.dtype.kind in "iu":
+            return array.astype(np.intp, copy=False)
+        missing: np.ndarray = np.equal(array, None)
+        array = np.where(missing, "", array).astype(str)
+        positions: np.ndarray = np.minimum(
+            np.searchsorted(self._sorted_names, array), len(self.names) - 1
+        )
+        found: np.ndarray = (self._sorted_names[positions] == array) | missing
+        if not found.all():
+            unknown = sorted(set(np.atleast_1d(array[~found]).tolist()))
+            logger.error(f"Types {unknown} are not in the chart")
+            raise ValueError(f"Unknown types {unknown}, should be among {list(self.names)}.")
+        return np.where(missing, NO_TYPE, self._order[positions])
+
+    def effectiveness(
+        self, attacking: str, defending: str, second_defending: Optional[str] = None
+    ) -> float:
+        """
+        Returns the damage multiplier of a single matchup.
+
+        Args:
+            attacking (str): the name of the attacking type.
+            defending (str): the name of the defender's type.
+            second_defending (Optional[str]): the name of the defender's second type, if any.
+
+        Returns:
+            The damage multiplier, e.g. 4.0 for an electric attack on a water and flying typing.
+        """
+        multiplier: float = float(self.matrix[self.index[attacking], self.index[defending]])
+        if second_defending is not None:
+            multiplier *= float(self.matrix[self.index[attacking], self.index[second_defending]])
+        return multiplier
+
+    def score(
+        self,
+        attacking: TypeIndices,
+        defending: TypeIndices,
+        second_defending: Optional[TypeIndices] = None,
+    ) -> "np.ndarray":
+        """
+        Scores matchups element-wise, with NumPy broadcasting rules: e.g. attacking types of shape
+        (A, 1) against defenders of shape (D,) score all A×D matchups at once. Passing indices, as
+        returned by `indices`, skips the lookup of names and is the fastest.
+
+        Args:
+            attacking (TypeIndices): the attacking types.
+            defending (TypeIndices): the defenders' types.
+            second_defending (Optional[TypeIndices]): the defenders' second types, NO_TYPE or
+                                                     None for single-typed defenders. None means
+                                                     all defenders are single-typed.
+
+        Returns:
+            A float array of the damage multipliers of the matchups.
+        """
+        attack: np.ndarray = self.indices(attacking)
+        multipliers: np.ndarray = self._padded[attack, self.indices(defending)]
+        if second_defending is not None:
+            multipliers = multipliers * self._padded[attack, self.indices(second_defending)]
+        return multipliers
+
+    def score_all(
+        self, defending: TypeIndices, second_defending: Optional[TypeIndices] = None
+    ) -> "np.ndarray":
+        """
+        Scores every attacking type of the chart against each of the provided defenders.
+
+        Args:
+            defending (TypeIndices): the defenders' types, as an array of shape (D,).
+            second_defending (Optional[TypeIndices]): the defenders' second types, see `score`.
+
+        Returns:
+            A float array of shape (N, D), N being the number of types in the chart.
+        """
+        return self.score(
+            np.arange(len(self.names))[:, None],
+            np.atleast_1d(self.indices(defending)),
+            np.atleast_1d(self.indices(second_defending)) if second_defending is not None else None,
+        )
@@ -2,15 +2,45 @@
 Model classes for the 'Utility' objects.
 """
 
-from typing import List, Optional
+import threading
+import weakref
+from typing import TYPE_CHECKING, List, Optional, Tuple, TypeVar, Union
 
 from pydantic import BaseModel
 
+if TYPE_CHECKING:  # pragma: no cover
+    from pokedex.client import AsyncPokeClient, PokeClient
+
+
+class ResourceReference:
+    """Mixin of the references to API resources, regular models and compact records alike."""
+
+    __slots__ = ()
+    url: str
+
+    def resolve(self, client: Union["PokeClient", "AsyncPokeClient"]):
+        """
+        Query the referenced resource with the provided client. With an AsyncPokeClient, the
+        result has to be awaited.
+
+        Args:
+            client (Union[PokeClient, AsyncPokeClient]): the client to query the resource with.
+
+        Returns:
+            The model object of the referenced resource.
+        """
+        return client.get_by_url(self.url)
+
+
+class NamedAPIResource(BaseModel, ResourceReference):
+    __slots__ = ("__weakref__",)
 
-class NamedAPIResource(BaseModel):
     name: str
     url: str
 
+    class Config:
+        allow_mutation = False
+
 
 class Name(BaseModel):
     name: str
@@ -28,9 +58,41 @@ class Language(BaseModel):
     names: List[Name]
 
 
-class APIResource(BaseModel):
+class APIResource(BaseModel, ResourceReference):
+    __slots__ = ("__weakref__",)
+
     url: str
 
+    class Config:
+        allow_mutation = False
+
+
+Resource = TypeVar("Resource", NamedAPIResource, APIResource)
+
+_RESOURCES: "weakref.WeakValueDictionary[Tuple, BaseModel]" = weakref.WeakValueDictionary()
+_RESOURCES_LOCK = threading.Lock()
+
+
+def intern_resource(resource: Resource) -> Resource:
+    """
+    Returns the shared instance of a NamedAPIResource or APIResource, so that identical references
+    held by different models, such as the language of every Name, all point to the same immutable
+    object. The provided resource becomes the shared instance if there was none yet. Shared
+    instances are dropped from the pool once no model holds them anymore.
+
+    Args:
+        resource (Resource): a NamedAPIResource or APIResource object.
+
+    Returns:
+        The shared instance equal to the provided resource.
+    """
+    key = (type(resource), resource.__dict__.get("name"), resource.url)
+    with _RESOURCES_LOCK:
+        shared = _RESOURCES.get(key)
+        if shared is None:
+            _RESOURCES[key] = shared = resource
+    return shared
+
 
 class Description(BaseModel):
     description: str
@@ -0,0 +1,130 @@
+"""
+Compact, read-only variants of the most repeated model classes, which clients can build in place
+of the regular models to reduce the memory held by large caches. They are slotted frozen records
+exposing the same attribute names as the models they stand for, but neither validate nor convert
+their data, and hold tuples instead of lists.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from pokedex.models.commons import (
+    APIResource,
+    Encounter,
+    FlavorText,
+    Name,
+    NamedAPIResource,
+    ResourceReference,
+)
+from pokedex.models.pokemon import PokemonMoveVersion, PokemonStat
+
+
+class CompactRecord:
+    """Base class of the compact records."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        # Frozen slotted records can't have their state restored attribute by attribute
+        return type(self), tuple(getattr(self, field.name) for field in fields(self))
+
+
+@dataclass(frozen=True)
+class CompactNamedAPIResource(CompactRecord, ResourceReference):
+    __slots__ = ("name", "url", "__weakref__")
+
+    name: str
+    url: str
+
+
+@dataclass(frozen=True)
+class CompactAPIResource(CompactRecord, ResourceReference):
+    __slots__ = ("url", "__weakref__")
+
+    url: str
+
+
+@dataclass(frozen=True)
+class CompactName(CompactRecord):
+    __slots__ = ("name", "language")
+
+    name: str
+    language: Optional[CompactNamedAPIResource]
+
+
+@dataclass(frozen=True)
+class CompactFlavorText(CompactRecord):
+    __slots__ = ("flavor_text", "language", "version")
+
+    flavor_text: str
+    language: Optional[CompactNamedAPIResource]
+    version: Optional[CompactNamedAPIResource]
+
+
+@dataclass(frozen=True)
+class CompactPokemonMoveVersion(CompactRecord):
+    __slots__ = ("move_learn_method", "version_group", "level_learned_at")
+
+    move_learn_method: Optional[CompactNamedAPIResource]
+    version_group: Optional[CompactNamedAPIResource]
+    level_learned_at: int
+
+
+@dataclass(frozen=True)
+class CompactPokemonStat(CompactRecord):
+    __slots__ = ("stat", "effort", "base_stat")
+
+    stat: Optional[CompactNamedAPIResource]
+    effort: int
+    base_stat: int
+
+
+@dataclass(frozen=True)
+class CompactEncounter(CompactRecord):
+    __slots__ = ("min_level", "max_level", "condition_values", "chance", "method")
+
+    min_level: int
+    max_level: int
+    condition_values: Tuple[CompactNamedAPIResource, ...]
+    chance: int
+    method: Optional[CompactNamedAPIResource]
+
+
+# The compact record class standing for each model class, whose fields come in the same order
+COMPACT_CLASSES: Dict[Type[BaseModel], Type[CompactRecord]] = {
+    NamedAPIResource: CompactNamedAPIResource,
+    APIResource: CompactAPIResource,
+    Name: CompactName,
+    FlavorText: CompactFlavorText,
+    PokemonMoveVersion: CompactPokemonMoveVersion,
+    PokemonStat: CompactPokemonStat,
+    Encounter: CompactEncounter,
+}
+
+_RECORDS: "weakref.WeakValueDictionary[Tuple, CompactRecord]" = weakref.WeakValueDictionary()
+_RECORDS_LOCK = threading.Lock()
+
+
+def intern_record(
+    record: Union[CompactNamedAPIResource, CompactAPIResource]
+) -> Union[CompactNamedAPIResource, CompactAPIResource]:
+    """
+    Returns the shared instance of a compact resource reference, as `intern_resource` does for
+    the regular models.
+
+    Args:
+        record (Union[CompactNamedAPIResource, CompactAPIResource]): the record to intern.
+
+    Returns:
+        The shared instance equal to the provided record.
+    """
+    key = (type(record), getattr(record, "name", None), record.url)
+    with _RECORDS_LOCK:
+        shared = _RECORDS.get(key)
+        if shared is None:
+            _RECORDS[key] = shared = record
+    return shared
@@ -4,7 +4,7 @@ Model classes for the 'Evolution' endpoint objects. Available endpoints are:
 - Evolution Triggers (https://pokeapi.co/api/v2/evolution-trigger/{id or name}/)
 """
 
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -14,19 +14,19 @@ from pokedex.models.commons import Name, NamedAPIResource
 class EvolutionDetail(BaseModel):
     item: Optional[NamedAPIResource]
     trigger: Optional[NamedAPIResource]
-    gender: int
+    gender: Optional[int]
     held_item: Optional[NamedAPIResource]
     known_move: Optional[NamedAPIResource]
     known_move_type: Optional[NamedAPIResource]
     location: Optional[NamedAPIResource]
-    min_level: int
-    min_happiness: int
-    min_beauty: int
-    min_affection: int
+    min_level: Optional[int]
+    min_happiness: Optional[int]
+    min_beauty: Optional[int]
+    min_affection: Optional[int]
     needs_overworld_rain: bool
     party_species: Optional[NamedAPIResource]
     party_type: Optional[NamedAPIResource]
-    relative_physical_stats: int
+    relative_physical_stats: Optional[int]
     time_of_day: str
     trade_species: Optional[NamedAPIResource]
     turn_upside_down: bool
@@ -36,7 +36,10 @@ class ChainLink(BaseModel):
     is_baby: bool
     species: Optional[NamedAPIResource]
     evolution_details: List[EvolutionDetail]
-    evolves_to: List[Dict]  # technically is List[ChainLink] but that would NameError
+    evolves_to: List["ChainLink"]
+
+
+ChainLink.update_forward_refs()
 
 
 class EvolutionChain(BaseModel):
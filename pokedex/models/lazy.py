@@ -0,0 +1,79 @@
+"""
+Base class for the models holding heavy sub-collections, such as a Pokémon's moves, which can be
+left unparsed when the model is built and only parsed on first access.
+"""
+
+import threading
+from typing import Any, Callable, ClassVar, Dict, Tuple
+
+from pydantic import BaseModel
+
+_LOCK = threading.Lock()
+
+
+class LazyModel(BaseModel):
+    """
+    Base class of the models whose heavy sub-collections, listed in `__lazy_fields__`, can be
+    deferred: such a field then holds a loader instead of its value, and is parsed into the usual
+    model objects the first time it is accessed. Access patterns and types are the same as for
+    regular models, and exporting or comparing a model parses all of its deferred fields first.
+
+    Models built the regular way, with validation, behave exactly as any other model.
+    """
+
+    __slots__ = ("__lazy_loaders__",)
+    __lazy_fields__: ClassVar[Tuple[str, ...]] = ()
+
+    def defer(self, loaders: Dict[str, Callable[[], Any]]) -> None:
+        """
+        Defers the parsing of some fields to their first access.
+
+        Args:
+            loaders (Dict[str, Callable[[], Any]]): for each deferred field, the function with no
+                                                    arguments returning its parsed value.
+        """
+        for name in loaders:
+            self.__dict__.pop(name, None)
+        object.__setattr__(self, "__lazy_loaders__", dict(loaders))
+
+    def __getattr__(self, name: str) -> Any:
+        loader = self._lazy_loaders().get(name)
+        if loader is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = loader()
+        with _LOCK:
+            value = self.__dict__.setdefault(name, value)
+            self._lazy_loaders().pop(name, None)
+        return value
+
+    def _lazy_loaders(self) -> Dict[str, Callable[[], Any]]:
+        try:
+            return object.__getattribute__(self, "__lazy_loaders__")
+        except AttributeError:
+            return {}
+
+    def _load_deferred(self) -> None:
+        """Parses all deferred fields, keeping the fields in their declaration order."""
+        loaders = self._lazy_loaders()
+        if not loaders:
+            return
+        for name in list(loaders):
+            getattr(self, name)
+        with _LOCK:
+            loaders.clear()
+        values = self.__dict__
+        ordered = {name: values[name] for name in self.__fields__ if name in values}
+        ordered.update((name, value) for name, value in values.items() if name not in ordered)
+        object.__setattr__(self, "__dict__", ordered)
+
+    def _iter(self, *args, **kwargs):
+        self._load_deferred()
+        return super()._iter(*args, **kwargs)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._load_deferred()
+        return super().__getstate__()
+
+    def __repr_args__(self):
+        self._load_deferred()
+        return super().__repr_args__()
@@ -16,6 +16,7 @@ from pokedex.models.commons import (
     NamedAPIResource,
     VersionEncounterDetail,
 )
+from pokedex.models.lazy import LazyModel
 
 
 class Location(BaseModel):
@@ -47,12 +48,14 @@ class PokemonEncounter(BaseModel):
     version_details: List[VersionEncounterDetail]
 
 
-class LocationArea(BaseModel):
+class LocationArea(LazyModel):
     """
     Location areas are sections of areas, such as floors in a building or cave. Each area has its
     own set of possible Pokémon encounters.
     """
 
+    __lazy_fields__ = ("pokemon_encounters",)
+
     id: int
     name: str
     game_index: int
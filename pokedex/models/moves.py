@@ -21,6 +21,7 @@ from pokedex.models.commons import (
     NamedAPIResource,
     VerboseEffect,
 )
+from pokedex.models.lazy import LazyModel
 from pokedex.models.pokemon import AbilityEffectChange
 
 
@@ -70,13 +71,15 @@ class MoveStatChange(BaseModel):
     stat: Optional[NamedAPIResource]
 
 
-class Move(BaseModel):
+class Move(LazyModel):
     """
     Moves are the skills of Pokémon in battle. In battle, a Pokémon uses one move each turn. Some
     moves (including those learned by Hidden Machine) can be used outside of battle as well,
     usually for the purpose of removing obstacles or exploring new areas.
     """
 
+    __lazy_fields__ = ("flavor_text_entries",)
+
     id: int
     name: str
     accuracy: Optional[int]
@@ -33,6 +33,7 @@ from pokedex.models.commons import (
     VersionEncounterDetail,
     VersionGameIndex,
 )
+from pokedex.models.lazy import LazyModel
 
 
 class AbilityEffectChange(BaseModel):
@@ -52,12 +53,14 @@ class AbilityPokemon(BaseModel):
     pokemon: Optional[NamedAPIResource]
 
 
-class Ability(BaseModel):
+class Ability(LazyModel):
     """
     Abilities provide passive effects for Pokémon in battle or in the overworld. Pokémon have
     multiple possible abilities but can have only one ability at a time.
     """
 
+    __lazy_fields__ = ("pokemon",)
+
     id: int
     name: str
     is_main_series: bool
@@ -222,7 +225,7 @@ class PokemonStat(BaseModel):
     base_stat: int
 
 
-class Pokemon(BaseModel):
+class Pokemon(LazyModel):
     """
     Pokémon are the creatures that inhabit the world of the Pokémon games. They can be caught
     using Pokéballs and trained by battling with other Pokémon. Each Pokémon belongs to a
@@ -230,6 +233,8 @@ class Pokemon(BaseModel):
     same species, such as base stats, available abilities and typings.
     """
 
+    __lazy_fields__ = ("moves",)
+
     id: int
     name: str
     base_experience: int
@@ -344,7 +349,7 @@ class PokemonSpeciesVariety(BaseModel):
     pokemon: Optional[NamedAPIResource]
 
 
-class PokemonSpecies(BaseModel):
+class PokemonSpecies(LazyModel):
     """
     A Pokémon Species forms the basis for at least one Pokémon. Attributes of a Pokémon species
     are shared across all varieties of Pokémon within the species. A good example is Wormadam;
@@ -352,6 +357,8 @@ class PokemonSpecies(BaseModel):
     Wormadam-Sandy and Wormadam-Plant.
     """
 
+    __lazy_fields__ = ("flavor_text_entries",)
+
     id: int
     name: str
     order: int
@@ -425,13 +432,15 @@ class TypePokemon(BaseModel):
     pokemon: Optional[NamedAPIResource]
 
 
-class Type(BaseModel):
+class Type(LazyModel):
     """
     Types are properties for Pokémon and their moves. Each type has three properties: which types
     of Pokémon it is super effective against, which types of Pokémon it is not very effective
     against, and which types of Pokémon it is completely ineffective against.
     """
 
+    __lazy_fields__ = ("pokemon",)
+
     id: int
     name: str
     damage_relations: TypeRelations
@@ -5,7 +5,7 @@ like to change this just add a 'limit' query parameter to the GET request, e.g.
 'offset' to move to the next page, e.g. ?limit=60&offset=60.
 """
 
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -14,13 +14,13 @@ from pokedex.models.commons import APIResource, NamedAPIResource
 
 class APIResourceList(BaseModel):
     count: int
-    next: str
-    previous: bool
+    next: Optional[str]
+    previous: Optional[str]
     results: List[APIResource]
 
 
 class NamedAPIResourceList(BaseModel):
     count: int
-    next: str
-    previous: bool
+    next: Optional[str]
+    previous: Optional[str]
     results: List[NamedAPIResource]
@@ -0,0 +1,10 @@
+import pytest
+
+from tests.stub import StubAPI
+
+
+@pytest.fixture
+def api() -> StubAPI:
+    """A running local stand-in for the PokeAPI, see `StubAPI`."""
+    with StubAPI() as stub:
+        yield stub
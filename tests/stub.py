@@ -0,0 +1,216 @@
+"""
+Local stand-in for the PokeAPI, serving fixture JSON over HTTP, and generation of valid fixture
+data for any model class. Used by the tests, and by the benchmarks to avoid hitting the real API.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Type
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, ModelField
+
+from pokedex.models.commons import APIResource, NamedAPIResource
+
+_SAMPLES: Dict[type, Any] = {int: 1, float: 1.0, str: "sample", bool: False}
+
+
+def sample_data(
+    model_class: Type[BaseModel],
+    sizes: Optional[Dict[str, int]] = None,
+    _parents: Tuple[type, ...] = (),
+    **overrides: Any,
+) -> Dict[str, Any]:
+    """
+    Returns valid data for a model class, as the API would send it. Every field holds a value,
+    and every list holds a single element unless a size is provided for it.
+
+    Args:
+        model_class (Type[BaseModel]): the model class to generate data for.
+        sizes (Optional[Dict[str, int]]): the number of elements of the lists of the provided
+                                          field names, at any depth, e.g. {'moves': 100}.
+        **overrides: values of top-level fields to use instead of generated ones.
+
+    Returns:
+        A dictionary of the data, keyed by field aliases.
+    """
+    sizes = sizes or {}
+    data: Dict[str, Any] = {}
+    for name, field in model_class.__fields__.items():
+        if name in overrides:
+            data[field.alias] = overrides[name]
+        elif field.shape == SHAPE_LIST:
+            # Recursive models, such as the ChainLink, get empty lists of themselves
+            size: int = 0 if field.type_ in _parents + (model_class,) else sizes.get(name, 1)
+            data[field.alias] = [
+                _sample_value(field, name, index, sizes, _parents + (model_class,))
+                for index in range(size)
+            ]
+        else:
+            data[field.alias] = _sample_value(field, name, 0, sizes, _parents + (model_class,))
+    return data
+
+
+def _sample_value(
+    field: ModelField, name: str, index: int, sizes: Dict[str, int], parents: Tuple[type, ...]
+) -> Any:
+    type_: type = field.type_
+    if type_ in (NamedAPIResource, APIResource):
+        endpoint: str = name.rstrip("s").replace("_", "-")
+        url: str = f"https://pokeapi.co/api/v2/{endpoint}/{index + 1}/"
+        if type_ is APIResource:
+            return {"url": url}
+        return {"name": "en" if name == "language" else f"{endpoint}-{index + 1}", "url": url}
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        if type_ in parents:
+            return None
+        return sample_data(type_, sizes, parents)
+    return _SAMPLES.get(type_, "sample")
+
+
+class StubAPI:
+    """
+    A local HTTP server standing in for the PokeAPI, on a free port. It serves the items added to
+    it, pages of their endpoints' lists, and scripted responses returned before the actual item,
+    e.g. to throttle requests:
+
+        with StubAPI() as api:
+            api.add("gender", sample_data(Gender, id=1, name="female"))
+            api.script("/api/v2/gender/1/", (429, {"Retry-After": "0"}))
+            client = PokeClient(base_url=api.base_url)
+
+    Items are served with an ETag, and conditional requests still matching it get a 304. Every
+    request is counted per path, query string excluded, its arrival time recorded and its status
+    code counted.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Args:
+            delay (float): seconds to wait before answering each request.
+        """
+        self.delay: float = delay
+        self.items: Dict[str, Dict[str, bytes]] = {}
+        self._listed: Dict[str, Dict[int, Optional[str]]] = {}
+        self.requests: Counter = Counter()
+        self.arrivals: List[float] = []
+        self.statuses: Counter = Counter()
+        self._scripts: Dict[str, List[Tuple[int, Dict[str, str]]]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/api/v2/"
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def __enter__(self) -> "StubAPI":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add(self, endpoint: str, data: Dict[str, Any]) -> None:
+        """Serves an item's data, under its ID number and under its name if it has one."""
+        content: bytes = json.dumps(data).encode()
+        items = self.items.setdefault(endpoint, {})
+        items[str(data["id"])] = content
+        if "name" in data:
+            items[data["name"]] = content
+        self._listed.setdefault(endpoint, {})[data["id"]] = data.get("name")
+
+    def script(self, path: str, *responses: Tuple[int, Dict[str, str]]) -> None:
+        """Returns the provided (status code, headers) responses to the next requests of a path."""
+        with self._lock:
+            self._scripts.setdefault(path, []).extend(responses)
+
+    def respond(
+        self, path: str, query: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Returns the status code, headers and body answering a request, and counts its status."""
+        status, response_headers, body = self._respond(path, query, headers or {})
+        with self._lock:
+            self.statuses[status] += 1
+        return status, response_headers, body
+
+    def _respond(
+        self, path: str, query: str, headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        with self._lock:
+            self.requests[path] += 1
+            self.arrivals.append(time.time())
+            script = self._scripts.get(path)
+            if script:
+                status, scripted = script.pop(0)
+                return status, scripted, b"{}"
+        if self.delay:
+            time.sleep(self.delay)
+
+        parts: List[str] = [part for part in path.split("/") if part][2:]  # after /api/v2/
+        if len(parts) == 1 and parts[0] in self.items:
+            return 200, {}, self._list_page(parts[0], parse_qs(query))
+        if len(parts) == 2 and parts[1] in self.items.get(parts[0], {}):
+            content: bytes = self.items[parts[0]][parts[1]]
+            etag: str = f'"{hashlib.md5(content).hexdigest()}"'
+            if headers.get("If-None-Match") == etag:
+                return 304, {"ETag": etag}, b""
+            return 200, {"ETag": etag}, content
+        return 404, {}, b"Not Found"
+
+    def _list_page(self, endpoint: str, parameters: Dict[str, List[str]]) -> bytes:
+        limit: int = int(parameters.get("limit", ["20"])[0])
+        offset: int = int(parameters.get("offset", ["0"])[0])
+        items: List[Tuple[int, Optional[str]]] = sorted(self._listed[endpoint].items())
+        results = [
+            {"url": f"{self.base_url}{endpoint}/{item_id}/", **({"name": name} if name else {})}
+            for item_id, name in items[offset : offset + limit]
+        ]
+        has_next: bool = offset + limit < len(items)
+        return json.dumps(
+            {
+                "count": len(items),
+                "next": (
+                    f"{self.base_url}{endpoint}/?limit={limit}&offset={offset + limit}"
+                    if has_next
+                    else None
+                ),
+                "previous": None,
+                "results": results,
+            }
+        ).encode()
+
+
+def _handler(api: StubAPI) -> Type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately, so Nagle's algorithm would stall keep-alive
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            status, headers, body = api.respond(url.path, url.query, dict(self.headers))
+            self.send_response(status)
+            for name, value in {**headers, "Content-Length": str(len(body))}.items():
+                self.send_header(name, value)
+            if self.close_connection:
+                # Tell the client the socket is not reusable, as a real server would
+                self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
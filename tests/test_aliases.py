@@ -0,0 +1,30 @@
+import pytest
+
+from pokedex.client.aliases import AliasTable
+from pokedex.client.snapshot import Snapshot
+
+
+@pytest.fixture
+def aliases() -> AliasTable:
+    table = AliasTable()
+    table.learn("pokemon", 25, "pikachu")
+    return table
+
+
+def test_identifiers_resolve_to_the_same_key(aliases):
+    assert aliases.canonical("pokemon", 25) == 25
+    assert aliases.canonical("pokemon", "25") == 25
+    assert aliases.canonical("pokemon", "pikachu") == 25
+    assert aliases.canonical("pokemon", "raichu") == "raichu"
+
+
+@pytest.mark.parametrize("name", ["²", "①"])
+def test_non_decimal_digits_are_names(aliases, name):
+    assert aliases.canonical("pokemon", name) == name
+
+
+def test_snapshot_looks_up_non_decimal_digits_by_name(tmp_path):
+    with Snapshot(tmp_path / "snapshot.db") as snapshot:
+        snapshot.put("pokemon", 2, "²", b"{}")
+        assert snapshot.get("pokemon", "²") == b"{}"
+        assert snapshot.get("pokemon", "2") == b"{}"
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+from pokedex.client import AsyncPokeClient, PokeClient
+from pokedex.models import Gender
+from tests.stub import StubAPI, sample_data
+
+
+def _add_genders(api: StubAPI) -> None:
+    for gender_id, name in enumerate(["female", "male", "genderless"], start=1):
+        api.add("gender", sample_data(Gender, id=gender_id, name=name))
+
+
+def test_results_follow_the_identifiers(api):
+    _add_genders(api)
+    with PokeClient(base_url=api.base_url) as client:
+        results = client.get_many("gender", [3, "female", 99, 2])
+
+    assert [result.item_id for result in results] == [3, "female", 99, 2]
+    assert [result.ok for result in results] == [True, True, False, True]
+    assert [result.model.name for result in results if result.ok] == [
+        "genderless",
+        "female",
+        "male",
+    ]
+    assert results[2].model is None
+
+
+def test_streamed_results_cover_all_identifiers(api):
+    _add_genders(api)
+    with PokeClient(base_url=api.base_url) as client:
+        results = list(client.get_many("gender", [1, 2, 3], stream=True, fields=["name"]))
+
+    assert sorted(result.model.name for result in results) == ["female", "genderless", "male"]
+
+
+def test_queries_run_concurrently():
+    with StubAPI(delay=0.2) as api:
+        _add_genders(api)
+        with PokeClient(base_url=api.base_url) as client:
+            start = time.perf_counter()
+            results = client.get_many("gender", [1, 2, 3], max_workers=3)
+            elapsed = time.perf_counter() - start
+
+    assert all(result.ok for result in results)
+    assert elapsed < 0.5
+
+
+def test_async_results_follow_the_identifiers(api):
+    _add_genders(api)
+
+    async def query():
+        async with AsyncPokeClient(base_url=api.base_url) as client:
+            return await client.get_many("gender", [2, 99, "genderless"])
+
+    results = asyncio.run(query())
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].model.name == "male"
+    assert results[2].model.id == 3
@@ -0,0 +1,47 @@
+from pokedex.client import PokeClient
+from pokedex.client.cache import CacheManager
+from pokedex.models import Gender, Pokemon
+from tests.stub import sample_data
+
+
+def test_invalidate_removes_partial_views():
+    cache = CacheManager()
+    cache.set("pokemon", 25, "pikachu", size=10)
+    cache.set("pokemon", (25, ("name",)), "pikachu name", size=1)
+    cache.set("pokemon", (25, ("moves", "name")), "pikachu moves", size=5)
+    cache.set("pokemon", 26, "raichu", size=10)
+    cache.set("pokemon", (26, ("name",)), "raichu name", size=1)
+
+    cache.invalidate("pokemon", 25)
+
+    assert cache.get("pokemon", 25) is None
+    assert cache.get("pokemon", (25, ("name",))) is None
+    assert cache.get("pokemon", (25, ("moves", "name"))) is None
+    assert cache.get("pokemon", 26) == "raichu"
+    assert cache.get("pokemon", (26, ("name",))) == "raichu name"
+    assert cache.cache_info("pokemon").size == 11
+
+
+def test_invalidated_partial_view_is_queried_again(api):
+    api.add("gender", sample_data(Gender, id=1, name="female"))
+    with PokeClient(base_url=api.base_url) as client:
+        client.get_gender(1)
+        client.get_gender(1, fields=["name"])
+        client.cache.invalidate("gender", 1)
+        client.get_gender(1, fields=["name"])
+
+    assert api.requests["/api/v2/gender/1/"] == 3
+
+
+def test_partial_views_are_sized_by_the_share_of_data_they_hold(api):
+    api.add("pokemon", sample_data(Pokemon, {"moves": 50}, id=1, name="bulbasaur"))
+    with PokeClient(base_url=api.base_url) as client:
+        client.get_pokemon(1)
+        full_size = client.cache.cache_info("pokemon").size
+        client.get_pokemon(1, fields=["name"])
+        name_size = client.cache.cache_info("pokemon").size - full_size
+        client.get_pokemon(1, fields=["moves"])
+        moves_size = client.cache.cache_info("pokemon").size - full_size - name_size
+
+    assert 0 < name_size < full_size / 10
+    assert full_size / 2 < moves_size < full_size
@@ -0,0 +1,76 @@
+import time
+
+from pokedex.client import PokeClient
+from pokedex.client.disk_cache import DiskCache
+from pokedex.models import Gender
+from tests.stub import sample_data
+
+URL = "/api/v2/gender/1/"
+
+
+def test_fresh_response_is_served_without_request(api, tmp_path):
+    api.add("gender", sample_data(Gender, id=1, name="female"))
+    with DiskCache(tmp_path / "cache.db") as disk_cache:
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            client.get_gender(1)
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            assert client.get_gender(1).name == "female"
+
+    assert api.requests[URL] == 1
+
+
+def test_expired_response_is_refetched(api, tmp_path):
+    api.add("gender", sample_data(Gender, id=1, name="female"))
+    with DiskCache(tmp_path / "cache.db", ttls={"gender": 0.05}) as disk_cache:
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            client.get_gender(1)
+        api.add("gender", sample_data(Gender, id=1, name="male"))
+        time.sleep(0.1)
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            assert client.get_gender(1).name == "male"
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            assert client.get_gender(1).name == "male"
+
+    assert api.requests[URL] == 2
+    assert api.statuses[200] == 2
+
+
+def test_not_modified_response_reuses_cached_body(api, tmp_path):
+    api.add("gender", sample_data(Gender, id=1, name="female"))
+    with DiskCache(tmp_path / "cache.db", default_ttl=0) as disk_cache:
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            client.get_gender(1)
+        with PokeClient(base_url=api.base_url, disk_cache=disk_cache) as client:
+            assert client.get_gender(1).name == "female"
+
+    assert api.requests[URL] == 2
+    assert api.statuses[304] == 1
+
+
+def test_eviction_removes_least_recently_accessed(tmp_path):
+    with DiskCache(tmp_path / "cache.db", max_size=None, compression_level=0) as disk_cache:
+        for index in range(3):
+            disk_cache.set(f"url/{index}", "gender", b"x" * 100)
+        entry_size = disk_cache.size() // 3
+        disk_cache.get("url/0")
+        disk_cache.max_size = 3 * entry_size
+        disk_cache.set("url/3", "gender", b"x" * 100)
+
+        assert disk_cache.get("url/1") is None
+        assert all(disk_cache.get(f"url/{index}") for index in (0, 2, 3))
+        assert disk_cache.size() == 3 * entry_size
+
+
+def test_size_follows_replacements_and_deletions(tmp_path):
+    with DiskCache(tmp_path / "cache.db") as disk_cache:
+        disk_cache.set("url/1", "gender", b"x" * 100)
+        entry_size = disk_cache.size()
+        disk_cache.set("url/1", "gender", b"x" * 100)
+        disk_cache.set("url/2", "move", b"x" * 100)
+        assert disk_cache.size() == 2 * entry_size
+
+        disk_cache.delete(endpoint="move")
+        assert disk_cache.size() == entry_size
+
+    with DiskCache(tmp_path / "cache.db") as disk_cache:
+        assert disk_cache.size() == entry_size
@@ -0,0 +1,68 @@
+import pytest
+
+from pokedex.models import LocationArea
+from tests.stub import sample_data
+
+pytest.importorskip("numpy")
+
+from pokedex.indexes import UNKNOWN_METHOD, EncounterIndex  # noqa: E402
+
+
+def _resource(endpoint: str, name: str) -> dict:
+    return {"name": name, "url": f"https://pokeapi.co/api/v2/{endpoint}/1/"}
+
+
+def _encounter(chance: int, method) -> dict:
+    return {
+        "min_level": 2,
+        "max_level": 4,
+        "condition_values": [],
+        "chance": chance,
+        "method": method,
+    }
+
+
+def _area(pokemon_encounters) -> LocationArea:
+    return LocationArea(
+        **sample_data(
+            LocationArea, id=1, name="viridian-forest", pokemon_encounters=pokemon_encounters
+        )
+    )
+
+
+def test_missing_resources_are_skipped_or_unknown():
+    area = _area(
+        [
+            {
+                "pokemon": _resource("pokemon", "pikachu"),
+                "version_details": [
+                    {
+                        "version": _resource("version", "red"),
+                        "max_chance": 10,
+                        "encounter_details": [
+                            _encounter(5, _resource("encounter-method", "walk")),
+                            _encounter(10, None),
+                        ],
+                    },
+                    {"version": None, "max_chance": 10, "encounter_details": [_encounter(5, None)]},
+                ],
+            },
+            {
+                "pokemon": None,
+                "version_details": [
+                    {
+                        "version": _resource("version", "red"),
+                        "max_chance": 10,
+                        "encounter_details": [_encounter(5, None)],
+                    }
+                ],
+            },
+        ]
+    )
+    index = EncounterIndex.from_areas([area])
+
+    assert len(index) == 2
+    rates = index.locations("pikachu")
+    assert sorted(rates.methods.tolist()) == sorted(["walk", UNKNOWN_METHOD])
+    unknown = index.locations("pikachu", method=UNKNOWN_METHOD)
+    assert unknown.chances.tolist() == [pytest.approx(0.1)]
@@ -0,0 +1,78 @@
+import pytest
+
+from pokedex.indexes import EvolutionIndex
+from pokedex.models.evolution import EvolutionChain, EvolutionDetail
+
+
+def _resource(endpoint: str, name: str, resource_id: int = 1) -> dict:
+    return {"name": name, "url": f"https://pokeapi.co/api/v2/{endpoint}/{resource_id}/"}
+
+
+def _detail(trigger: str, **conditions) -> dict:
+    detail = {name: None for name in EvolutionDetail.__fields__}
+    detail.update(needs_overworld_rain=False, turn_upside_down=False, time_of_day="")
+    detail["trigger"] = _resource("evolution-trigger", trigger)
+    detail.update(conditions)
+    return detail
+
+
+def _link(name: str, species_id: int, details=(), children=(), is_baby=False) -> dict:
+    return {
+        "is_baby": is_baby,
+        "species": _resource("pokemon-species", name, species_id),
+        "evolution_details": list(details),
+        "evolves_to": list(children),
+    }
+
+
+@pytest.fixture(scope="module")
+def index() -> EvolutionIndex:
+    pikachu = _link(
+        "pikachu",
+        25,
+        [_detail("level-up", min_happiness=220)],
+        [_link("raichu", 26, [_detail("use-item", item=_resource("item", "thunder-stone"))])],
+    )
+    eevee = _link(
+        "eevee",
+        133,
+        children=[
+            _link("umbreon", 197, [_detail("level-up", min_happiness=160, time_of_day="night")]),
+            _link("espeon", 196, [_detail("level-up", min_happiness=160, time_of_day="day")]),
+        ],
+    )
+    return EvolutionIndex.from_chains(
+        [
+            EvolutionChain(id=10, chain=_link("pichu", 172, children=[pikachu], is_baby=True)),
+            EvolutionChain(id=67, chain=eevee),
+        ]
+    )
+
+
+def test_ancestry_of_a_linear_chain(index):
+    assert index.base_form("raichu") == "pichu"
+    assert index.ancestors("raichu") == ("pichu", "pikachu")
+    assert index.descendants("pichu") == ("pikachu", "raichu")
+    assert index.stage(26) == 2
+    assert index.family("pikachu") == ("pichu", "pikachu", "raichu")
+    assert index["pichu"].is_baby
+
+
+def test_branches_of_a_chain(index):
+    assert index["eevee"].children == ("umbreon", "espeon")
+    assert index["espeon"].parent == "eevee"
+    assert index.chain("umbreon") == index.chain(133) == 67
+    assert index.descendants("umbreon") == ()
+
+
+def test_conditions_are_summarized(index):
+    assert index.triggers("raichu") == ("use-item",)
+    assert index.conditions("raichu") == ("use-item (item thunder-stone)",)
+    assert index.conditions("umbreon") == ("level-up (happiness 160, night)",)
+    assert index.conditions("pichu") == ()
+
+
+def test_unknown_species_is_rejected(index):
+    assert "mew" not in index
+    with pytest.raises(KeyError):
+        index["mew"]
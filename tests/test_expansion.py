@@ -0,0 +1,45 @@
+import pytest
+
+from pokedex.client import PokeClient
+from pokedex.client.expansion import collect_references
+from pokedex.models import Pokemon, Type
+from tests.stub import sample_data
+
+
+@pytest.fixture
+def pokemon_api(api):
+    types = [
+        {"slot": slot, "type": {"name": name, "url": f"{api.base_url}type/{slot}/"}}
+        for slot, name in enumerate(["electric", "steel"], start=1)
+    ]
+    api.add("pokemon", sample_data(Pokemon, {"moves": 3}, id=25, name="pikachu", types=types))
+    api.add("type", sample_data(Type, id=1, name="electric"))
+    api.add("type", sample_data(Type, id=2, name="steel"))
+    return api
+
+
+@pytest.mark.parametrize("paths", [None, ["moves.move", "types.type", "stats.stat"]])
+def test_compact_models_hold_the_same_references(pokemon_api, paths):
+    with PokeClient(base_url=pokemon_api.base_url) as client:
+        regular = collect_references(client.get_pokemon(25), paths)
+    with PokeClient(base_url=pokemon_api.base_url, compact=True) as client:
+        compact = collect_references(client.get_pokemon(25), paths)
+
+    assert regular
+    assert compact == regular
+
+
+def test_expand_compact_model(pokemon_api):
+    with PokeClient(base_url=pokemon_api.base_url, compact=True) as client:
+        pokemon = client.get_pokemon(25)
+        expanded = client.expand(pokemon, paths=["types.type"])
+
+    assert sorted(model.name for model in expanded.values()) == ["electric", "steel"]
+    assert expanded[pokemon.types[0].type.url].name == "electric"
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["regular", "compact"])
+def test_resolve_reference(pokemon_api, compact):
+    with PokeClient(base_url=pokemon_api.base_url, compact=compact) as client:
+        reference = client.get_pokemon(25).types[1].type
+        assert reference.resolve(client).name == "steel"
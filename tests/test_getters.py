@@ -0,0 +1,82 @@
+import inspect
+from pathlib import Path
+
+import pytest
+
+from pokedex.client import AsyncPokeClient, PokeClient
+from pokedex.client.endpoints import ENDPOINTS
+from pokedex.models import Berry, Pokemon
+from tests.stub import sample_data
+
+STUB = Path(__file__).parents[1] / "pokedex" / "client" / "getters.pyi"
+
+_HEADER = '''"""
+Declarations of the get_* methods bound to the clients, see getters.py. Generated from the
+endpoints registry with `python -m tests.test_getters`, which should be run again whenever an
+endpoint is added.
+"""
+
+from typing import AsyncIterator, Awaitable, Iterable, Iterator, List, Optional, Union
+
+from pokedex import models
+from pokedex.client.endpoints import FetchResult
+'''
+
+
+def render_stub() -> str:
+    """Returns the content getters.pyi should have for the registered endpoints."""
+    classes = {
+        "EndpointGetters": ("def", "Union[List[FetchResult], Iterator[FetchResult]]"),
+        "AsyncEndpointGetters": (
+            "async def",
+            "Union[Awaitable[List[FetchResult]], AsyncIterator[FetchResult]]",
+        ),
+    }
+    lines = [_HEADER]
+    for class_name, (definition, batch_return) in classes.items():
+        lines.append(f"\nclass {class_name}:")
+        for endpoint in ENDPOINTS.values():
+            lines.append(
+                f"    {definition} {endpoint.getter_name}(\n"
+                f"        self,\n"
+                f"        {endpoint.parameter_name}: Union[str, int],\n"
+                f"        fields: Optional[Iterable[str]] = ...,\n"
+                f"    ) -> models.{endpoint.model.__name__}: ..."
+            )
+            lines.append(
+                f"    def {endpoint.batch_getter_name}(\n"
+                f"        self,\n"
+                f"        item_ids: Iterable[Union[str, int]],\n"
+                f"        stream: bool = ...,\n"
+                f"        fields: Optional[Iterable[str]] = ...,\n"
+                f"    ) -> {batch_return}: ..."
+            )
+    return "\n".join(lines) + "\n"
+
+
+def test_stub_declares_every_getter():
+    assert STUB.read_text() == render_stub(), "run `python -m tests.test_getters` to update it"
+
+
+@pytest.mark.parametrize("client_class", [PokeClient, AsyncPokeClient])
+def test_getters_keep_their_parameter_names(client_class):
+    assert list(inspect.signature(client_class.get_berry).parameters) == [
+        "self",
+        "berry_id",
+        "fields",
+    ]
+    assert "pokemon_id" in inspect.signature(client_class.get_pokemon_form).parameters
+    assert "item_id" in inspect.signature(client_class.get_item).parameters
+    assert inspect.signature(client_class.get_pokemon).return_annotation is Pokemon
+
+
+def test_getters_accept_their_parameter_by_keyword(api):
+    api.add("berry", sample_data(Berry, id=1, name="cheri"))
+    api.add("pokemon", sample_data(Pokemon, id=25, name="pikachu"))
+    with PokeClient(base_url=api.base_url) as client:
+        assert client.get_berry(berry_id=1).name == "cheri"
+        assert client.get_pokemon(pokemon_id="pikachu", fields=["id"]).id == 25
+
+
+if __name__ == "__main__":
+    STUB.write_text(render_stub())
@@ -0,0 +1,47 @@
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from pokedex.client import PokeClient
+from pokedex.models import Pokemon
+from pokedex.models.pokemon import PokemonMove
+from tests.stub import sample_data
+
+
+@pytest.fixture
+def pokemon_api(api):
+    api.add("pokemon", sample_data(Pokemon, {"moves": 5}, id=1, name="bulbasaur"))
+    return api
+
+
+def test_heavy_fields_are_parsed_on_first_access(pokemon_api):
+    with PokeClient(base_url=pokemon_api.base_url, lazy=True) as client:
+        pokemon = client.get_pokemon(1)
+
+    assert "moves" not in pokemon.__dict__
+    assert all(isinstance(move, PokemonMove) for move in pokemon.moves)
+    assert "moves" in pokemon.__dict__
+    assert len(pokemon.moves) == 5
+
+
+def test_lazy_model_equals_eager_model(pokemon_api):
+    with PokeClient(base_url=pokemon_api.base_url) as client:
+        eager = client.get_pokemon(1)
+    with PokeClient(base_url=pokemon_api.base_url, lazy=True) as client:
+        lazy = client.get_pokemon(1)
+
+    assert lazy.dict() == eager.dict()
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+
+
+def test_invalid_heavy_field_fails_on_access(api):
+    data = sample_data(Pokemon, id=1, name="bulbasaur")
+    data["moves"][0]["version_group_details"][0]["level_learned_at"] = "not-an-int"
+    api.add("pokemon", data)
+
+    with PokeClient(base_url=api.base_url, lazy=True) as client:
+        pokemon = client.get_pokemon(1)
+        assert pokemon.name == "bulbasaur"
+        with pytest.raises(ValidationError):
+            pokemon.moves
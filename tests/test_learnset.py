@@ -0,0 +1,77 @@
+import pytest
+
+from pokedex.models import Pokemon
+from tests.stub import sample_data
+
+np = pytest.importorskip("numpy")
+
+from pokedex.indexes import LearnsetIndex  # noqa: E402
+
+
+def _pokemon(pokemon_id: int, name: str, *moves: tuple) -> Pokemon:
+    return Pokemon(
+        **sample_data(
+            Pokemon,
+            id=pokemon_id,
+            name=name,
+            moves=[
+                {
+                    "move": {"name": move, "url": "https://x/1/"},
+                    "version_group_details": [
+                        {
+                            "level_learned_at": level,
+                            "version_group": {"name": "red-blue", "url": "https://x/1/"},
+                            "move_learn_method": {"name": "level-up", "url": "https://x/1/"},
+                        }
+                    ],
+                }
+                for move, level in moves
+            ],
+        )
+    )
+
+
+@pytest.fixture
+def index() -> LearnsetIndex:
+    return LearnsetIndex.from_pokemon(
+        [
+            _pokemon(1, "bulbasaur", ("tackle", 1), ("vine-whip", 9)),
+            _pokemon(4, "charmander", ("scratch", 1), ("ember", 9)),
+            _pokemon(7, "squirtle", ("tackle", 1), ("bubble", 8)),
+        ]
+    )
+
+
+def test_learners_by_level(index):
+    pokemon_ids, levels = index.learners("tackle", "red-blue", "level-up", max_level=5)
+
+    assert sorted(index.names(pokemon_ids)) == ["bulbasaur", "squirtle"]
+    assert levels.tolist() == [1, 1]
+    assert index.learners("ember", "red-blue", "level-up", max_level=5)[0].tolist() == []
+
+
+def test_update_replaces_rows(index):
+    index.update([_pokemon(4, "charmander", ("tackle", 1))])
+
+    assert index.moves_of("charmander") == ["tackle"]
+    assert sorted(index.learners("tackle")[0].tolist()) == [1, 4, 7]
+
+
+def test_update_forgets_previous_name(index):
+    index.update([_pokemon(4, "hitokage", ("scratch", 1))])
+
+    assert index.moves_of("hitokage") == ["scratch"]
+    assert index.moves_of(4) == ["scratch"]
+    with pytest.raises(KeyError):
+        index.moves_of("charmander")
+
+
+def test_remove_then_save_and_load(index, tmp_path):
+    index.remove("squirtle")
+    index.save(tmp_path / "learnsets.npz")
+    loaded = LearnsetIndex.load(tmp_path / "learnsets.npz")
+
+    assert loaded.learners("tackle")[0].tolist() == [1]
+    assert loaded.moves_of("bulbasaur") == ["tackle", "vine-whip"]
+    with pytest.raises(KeyError):
+        loaded.moves_of("squirtle")
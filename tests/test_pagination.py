@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from pokedex.client import AsyncPokeClient, PokeClient
+from pokedex.models import Gender
+from tests.stub import sample_data
+
+LIST = "/api/v2/gender/"
+
+
+def _add_genders(api, count: int) -> None:
+    for gender_id in range(1, count + 1):
+        api.add("gender", sample_data(Gender, id=gender_id, name=f"gender-{gender_id}"))
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_iteration_covers_all_pages(api):
+    _add_genders(api, 7)
+    with PokeClient(base_url=api.base_url) as client:
+        names = [reference.name for reference in client.iter_resources("gender", page_size=3)]
+
+    assert names == [f"gender-{gender_id}" for gender_id in range(1, 8)]
+    assert api.requests[LIST] == 3
+
+
+def test_next_page_is_prefetched(api):
+    _add_genders(api, 6)
+    with PokeClient(base_url=api.base_url) as client:
+        references = client.iter_resources("gender", page_size=3)
+        next(references)
+        # The second page is requested while the first one is still being consumed
+        assert _wait_for(lambda: api.requests[LIST] == 2)
+        references.close()
+
+
+def test_iter_models_in_listed_order(api):
+    _add_genders(api, 5)
+    with PokeClient(base_url=api.base_url) as client:
+        ids = [model.id for model in client.iter_models("gender", page_size=2, max_workers=2)]
+
+    assert ids == [1, 2, 3, 4, 5]
+
+
+def test_async_iteration_covers_all_pages(api):
+    _add_genders(api, 7)
+
+    async def query():
+        async with AsyncPokeClient(base_url=api.base_url) as client:
+            return [
+                reference.name async for reference in client.iter_resources("gender", page_size=3)
+            ]
+
+    assert asyncio.run(query()) == [f"gender-{gender_id}" for gender_id in range(1, 8)]
+    assert api.requests[LIST] == 3
@@ -0,0 +1,49 @@
+import pytest
+from pydantic import ValidationError
+
+from pokedex.client import PokeClient
+from pokedex.models import Pokemon
+from tests.stub import sample_data
+
+
+@pytest.fixture
+def pokemon_api(api):
+    data = sample_data(Pokemon, {"moves": 5}, id=1, name="bulbasaur")
+    data["stats"][0]["base_stat"] = "not-an-int"
+    api.add("pokemon", data)
+    return api
+
+
+def test_projection_drops_unrequested_fields(pokemon_api):
+    with PokeClient(base_url=pokemon_api.base_url) as client:
+        pokemon = client.get_pokemon(1, fields=["moves"])
+
+    assert pokemon.__fields_set__ == {"id", "name", "moves"}
+    assert set(pokemon.dict(exclude_unset=True)) == {"id", "name", "moves"}
+    assert len(pokemon.moves) == 5
+    with pytest.raises(AttributeError):
+        pokemon.stats
+
+
+def test_projection_skips_validating_unrequested_fields(pokemon_api):
+    with PokeClient(base_url=pokemon_api.base_url) as client:
+        assert client.get_pokemon(1, fields=["name"]).name == "bulbasaur"
+        with pytest.raises(ValidationError):
+            client.get_pokemon(1)
+
+
+def test_projections_are_cached_apart(pokemon_api):
+    with PokeClient(base_url=pokemon_api.base_url) as client:
+        names = client.get_pokemon(1, fields=["name"])
+        assert client.get_pokemon("bulbasaur", fields=["name"]) is names
+        client.get_pokemon(1, fields=["moves"])
+
+    assert pokemon_api.requests["/api/v2/pokemon/1/"] == 2
+
+
+def test_unknown_field_is_rejected(pokemon_api):
+    with PokeClient(base_url=pokemon_api.base_url) as client:
+        with pytest.raises(ValueError, match="Unknown fields"):
+            client.get_pokemon(1, fields=["wingspan"])
+
+    assert pokemon_api.total_requests == 0
@@ -0,0 +1,166 @@
+import asyncio
+import multiprocessing
+import socket
+import time
+
+import pytest
+import requests
+
+from pokedex.client import (
+    AsyncPokeClient,
+    PokeClient,
+    RateLimiter,
+    RateLimitError,
+    SharedTokenBucket,
+    ratelimit,
+)
+from pokedex.models import Gender
+from tests.stub import sample_data
+
+GENDER_PATH = "/api/v2/gender/1/"
+
+RATE = 20.0
+BURST = 5
+WORKERS = 4
+QUERIES = 12
+
+
+def _query_all(base_url: str, bucket_path: str) -> None:
+    bucket = SharedTokenBucket(bucket_path, rate=RATE, burst=BURST)
+    with PokeClient(base_url=base_url, rate_limiter=RateLimiter(bucket=bucket)) as client:
+        for item_id in range(1, QUERIES + 1):
+            client.get_gender(item_id)
+
+
+@pytest.mark.skipif(ratelimit.fcntl is None, reason="SharedTokenBucket requires POSIX")
+def test_shared_bucket_bounds_aggregate_rate_of_processes(api, tmp_path):
+    for item_id in range(1, QUERIES + 1):
+        api.add("gender", sample_data(Gender, id=item_id, name=f"gender-{item_id}"))
+
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_query_all, args=(api.base_url, str(tmp_path / "bucket")))
+        for _ in range(WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    arrivals = sorted(api.arrivals)
+    assert len(arrivals) == WORKERS * QUERIES
+    # Any window of requests fits the burst plus the tokens refilled over its duration, with
+    # some slack for the time requests take between drawing a token and reaching the server
+    for first in range(len(arrivals)):
+        for last in range(first, len(arrivals)):
+            elapsed = arrivals[last] - arrivals[first]
+            assert last - first + 1 <= BURST + RATE * (elapsed + 0.05) + 1
+    # A per-process bucket would let all processes through in about a quarter of that time
+    assert arrivals[-1] - arrivals[0] >= 0.9 * (len(arrivals) - BURST) / RATE
+
+
+@pytest.fixture
+def gender_api(api):
+    api.add("gender", sample_data(Gender, id=1, name="female"))
+    return api
+
+
+def test_throttled_requests_are_retried(gender_api):
+    gender_api.script(GENDER_PATH, (429, {"Retry-After": "0"}), (503, {}))
+    limiter = RateLimiter(backoff_base=0.01, max_concurrency=8)
+    with PokeClient(base_url=gender_api.base_url, rate_limiter=limiter) as client:
+        assert client.get_gender(1).name == "female"
+
+    assert gender_api.requests[GENDER_PATH] == 3
+    assert limiter.concurrency.limit < 4  # halved twice, then grown back a little
+
+
+def test_async_throttled_requests_are_retried(gender_api):
+    gender_api.script(GENDER_PATH, (429, {"Retry-After": "0"}), (429, {"Retry-After": "0"}))
+
+    async def query():
+        limiter = RateLimiter(max_concurrency=8)
+        async with AsyncPokeClient(base_url=gender_api.base_url, rate_limiter=limiter) as client:
+            return await client.get_gender(1), limiter
+
+    gender, limiter = asyncio.run(query())
+    assert gender.name == "female"
+    assert gender_api.requests[GENDER_PATH] == 3
+    assert limiter.concurrency.limit < 4
+
+
+def test_retries_are_bounded_per_endpoint(gender_api):
+    gender_api.script(GENDER_PATH, *[(429, {"Retry-After": "7"})] * 3)
+    limiter = RateLimiter(max_retries=5, endpoint_max_retries={"gender": 2}, backoff_max=0.01)
+    with PokeClient(base_url=gender_api.base_url, rate_limiter=limiter) as client:
+        with pytest.raises(RateLimitError) as error:
+            client.get_gender(1)
+
+    assert gender_api.requests[GENDER_PATH] == 3
+    assert error.value.retry_after == 7
+
+
+def test_retry_after_is_capped_by_backoff_max(gender_api):
+    assert RateLimiter(backoff_max=2.0).backoff(0, retry_after=86400) == 2.0
+
+    gender_api.script(GENDER_PATH, (429, {"Retry-After": "86400"}))
+    limiter = RateLimiter(backoff_max=0.05)
+    start = time.monotonic()
+    with PokeClient(base_url=gender_api.base_url, rate_limiter=limiter) as client:
+        assert client.get_gender(1).name == "female"
+    assert time.monotonic() - start < 5
+
+
+def test_server_errors_are_retried_without_lowering_concurrency(gender_api):
+    gender_api.script(GENDER_PATH, (500, {}), (502, {}))
+    limiter = RateLimiter(backoff_base=0.01, max_concurrency=8)
+    limiter.concurrency.limit = 4.0
+    with PokeClient(base_url=gender_api.base_url, rate_limiter=limiter) as client:
+        assert client.get_gender(1).name == "female"
+
+    assert gender_api.requests[GENDER_PATH] == 3
+    assert limiter.concurrency.limit > 4  # only grown by the final success
+
+
+def test_connection_errors_do_not_lower_concurrency():
+    with socket.socket() as listener:  # a port nothing listens on once closed
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+    limiter = RateLimiter(max_concurrency=8)
+    with PokeClient(base_url=f"http://127.0.0.1:{port}/api/v2/", rate_limiter=limiter) as client:
+        with pytest.raises(requests.ConnectionError):
+            client.get_gender(1)
+
+    assert limiter.concurrency.limit == 8
+
+
+def test_cancelled_rate_waits_give_their_slot_back():
+    async def scenario():
+        limiter = RateLimiter(rate=0.2, burst=1, max_concurrency=2)
+        await limiter.acquire_async()  # draws the only token
+        await limiter.release_async(200)
+        for _ in range(2):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(limiter.acquire_async(), timeout=0.05)
+        return limiter.concurrency._in_flight
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_interrupted_rate_waits_give_their_slot_back(monkeypatch):
+    limiter = RateLimiter(rate=0.2, burst=1, max_concurrency=2)
+
+    def interrupt() -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(limiter.bucket, "acquire", interrupt)
+    for _ in range(2):
+        with pytest.raises(KeyboardInterrupt):
+            limiter.acquire()
+    assert limiter.concurrency._in_flight == 0
+
+
+@pytest.mark.parametrize("value, expected", [("7", 7.0), (" 0 ", 0.0), ("²", None), ("", None)])
+def test_retry_after_parsing(value, expected):
+    assert ratelimit.parse_retry_after(value) == expected
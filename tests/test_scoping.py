@@ -0,0 +1,92 @@
+from pokedex.client import PokeClient
+from pokedex.models import Move, Pokemon, VersionGroup
+from tests.stub import sample_data
+
+
+def _resource(endpoint: str, name: str) -> dict:
+    return {"name": name, "url": f"https://pokeapi.co/api/v2/{endpoint}/{name}/"}
+
+
+def _pokemon() -> dict:
+    data = sample_data(Pokemon, id=1, name="bulbasaur")
+    learned, unlearned = data["moves"][0], {**data["moves"][0], "move": _resource("move", "cut")}
+    learned["version_group_details"] = [
+        {**learned["version_group_details"][0], "version_group": _resource("version-group", name)}
+        for name in ("red-blue", "gold-silver")
+    ]
+    unlearned["version_group_details"] = learned["version_group_details"][1:]
+    data["moves"] = [learned, unlearned]
+
+    held, unheld = data["held_items"][0], {**data["held_items"][0]}
+    held["version_details"] = [
+        {"version": _resource("version", name), "rarity": 5} for name in ("red", "gold")
+    ]
+    unheld["version_details"] = held["version_details"][1:]
+    data["held_items"] = [held, unheld]
+
+    data["game_indices"] = [
+        {"game_index": 1, "version": _resource("version", name)} for name in ("red", "gold")
+    ]
+    return data
+
+
+def test_version_group_scope_drops_other_games(api):
+    api.add(
+        "version-group",
+        sample_data(
+            VersionGroup,
+            id=1,
+            name="red-blue",
+            versions=[_resource("version", "red"), _resource("version", "blue")],
+        ),
+    )
+    api.add("pokemon", _pokemon())
+
+    with PokeClient(base_url=api.base_url, version_group="red-blue") as client:
+        pokemon = client.get_pokemon(1)
+
+    assert [move.move.name for move in pokemon.moves] == ["move-1"]
+    details = pokemon.moves[0].version_group_details
+    assert [detail.version_group.name for detail in details] == ["red-blue"]
+    assert len(pokemon.held_items) == 1
+    assert [detail.version.name for detail in pokemon.held_items[0].version_details] == ["red"]
+    assert [index.version.name for index in pokemon.game_indices] == ["red"]
+
+
+def test_unscoped_client_keeps_all_games(api):
+    api.add("pokemon", _pokemon())
+
+    with PokeClient(base_url=api.base_url) as client:
+        pokemon = client.get_pokemon(1)
+
+    assert len(pokemon.moves) == 2
+    assert len(pokemon.moves[0].version_group_details) == 2
+    assert len(pokemon.held_items) == 2
+    assert len(pokemon.game_indices) == 2
+
+
+def test_language_scope_drops_other_languages(api):
+    data = sample_data(Move, id=1, name="pound")
+    data["names"] = [
+        {"name": name, "language": _resource("language", language)}
+        for name, language in (("Pound", "en"), ("Écras'Face", "fr"), ("はたく", "ja"))
+    ]
+    api.add("move", data)
+
+    with PokeClient(base_url=api.base_url, languages=["en", "ja"]) as client:
+        move = client.get_move(1)
+
+    assert [name.name for name in move.names] == ["Pound", "はたく"]
+
+
+def test_scoped_items_are_sized_by_the_share_of_data_kept(api):
+    api.add("move", sample_data(Move, {"flavor_text_entries": 40, "names": 10}, id=1))
+
+    sizes = []
+    for languages in (None, ["fr"]):  # the generated entries are all in English
+        with PokeClient(base_url=api.base_url, languages=languages) as client:
+            client.get_move(1)
+            sizes.append(client.cache.cache_info("move").size)
+
+    unscoped_size, scoped_size = sizes
+    assert 0 < scoped_size < unscoped_size
@@ -0,0 +1,86 @@
+import pytest
+
+from pokedex.models import Move, PokemonSpecies
+from tests.stub import sample_data
+
+np = pytest.importorskip("numpy")
+
+from pokedex.indexes import SearchIndex, tokenize  # noqa: E402
+
+
+def _names(**names: str) -> list:
+    return [
+        {"name": name, "language": {"name": language.replace("_", "-"), "url": "https://x/1/"}}
+        for language, name in names.items()
+    ]
+
+
+@pytest.fixture(scope="module")
+def index() -> SearchIndex:
+    models = [
+        PokemonSpecies(
+            **sample_data(
+                PokemonSpecies,
+                id=25,
+                name="pikachu",
+                names=_names(en="Pikachu", ja="ピカチュウ", zh_Hans="皮卡丘"),
+                flavor_text_entries=[],
+                genera=[],
+            )
+        ),
+        Move(
+            **sample_data(
+                Move,
+                id=52,
+                name="ember",
+                names=_names(en="Ember", fr="Flammèche", ja="ひのこ", zh_Hans="火花"),
+                flavor_text_entries=[],
+                effect_entries=[],
+            )
+        ),
+        Move(
+            **sample_data(
+                Move,
+                id=53,
+                name="flamethrower",
+                names=_names(en="Flamethrower", ja="かえんほうしゃ", zh_Hans="喷射火焰"),
+                flavor_text_entries=[],
+                effect_entries=[],
+            )
+        ),
+    ]
+    return SearchIndex.from_models(models)
+
+
+def test_tokenize():
+    assert tokenize("POKéMON Électrique") == ["pokemon", "electrique"]
+    assert tokenize("ピカチュウ") == ["ピカ", "カチ", "チュ", "ュウ"]
+    assert tokenize("火") == ["火"]
+    assert tokenize("火花", unigrams=True) == ["火", "花", "火花"]
+
+
+def test_search(index):
+    hits = index.search("flammeche")
+    assert [(hit.name, hit.language) for hit in hits] == [("ember", "fr")]
+    assert index.search("チュウ")[0].name == "pikachu"
+
+
+def test_single_character_query(index):
+    hits = index.search("火", language="zh-Hans")
+    assert sorted(hit.name for hit in hits) == ["ember", "flamethrower"]
+
+
+def test_filters(index):
+    assert index.search("皮卡丘", resources=["move"]) == []
+    assert [hit.resource for hit in index.search("皮卡丘", resources=["pokemon-species"])] == [
+        "pokemon-species"
+    ]
+    assert index.search("pikachu", language="ja") == []
+
+
+def test_saved_index_is_memory_mapped(index, tmp_path):
+    index.save(tmp_path / "search")
+    loaded = SearchIndex.load(tmp_path / "search")
+
+    assert loaded.search("火", limit=5) == index.search("火", limit=5)
+    assert isinstance(loaded.documents.base, np.memmap)
@@ -0,0 +1,88 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pokedex.client import AsyncPokeClient, PokeClient
+from pokedex.client.singleflight import AsyncSingleFlight
+from pokedex.models import Pokemon
+from tests.stub import StubAPI, sample_data
+
+CALLERS = 32
+
+
+@pytest.fixture
+def slow_api() -> StubAPI:
+    """A stand-in API slow enough for concurrent queries to overlap."""
+    with StubAPI(delay=0.2) as stub:
+        stub.add("pokemon", sample_data(Pokemon, id=6, name="charizard"))
+        yield stub
+
+
+def test_concurrent_threads_share_one_request(slow_api):
+    with PokeClient(base_url=slow_api.base_url) as client:
+        with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+            models = list(executor.map(lambda _: client.get_pokemon("charizard"), range(CALLERS)))
+
+    assert slow_api.total_requests == 1
+    assert all(model is models[0] for model in models)
+
+
+def test_concurrent_tasks_share_one_request(slow_api):
+    async def query():
+        async with AsyncPokeClient(base_url=slow_api.base_url) as client:
+            return await asyncio.gather(*(client.get_pokemon("charizard") for _ in range(CALLERS)))
+
+    models = asyncio.run(query())
+    assert slow_api.total_requests == 1
+    assert all(model is models[0] for model in models)
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def call(started: asyncio.Event) -> str:
+        started.set()
+        await asyncio.sleep(0.1)
+        return "result"
+
+    async def scenario():
+        flight = AsyncSingleFlight()
+        started = asyncio.Event()
+        leader = asyncio.ensure_future(flight.do("key", lambda: call(started)))
+        await started.wait()
+        follower = asyncio.ensure_future(flight.do("key", lambda: call(started)))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower, leader.cancelled()
+
+    assert asyncio.run(scenario()) == ("result", True)
+
+
+def test_errors_propagate_to_all_callers():
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    async def scenario():
+        flight = AsyncSingleFlight()
+        return await asyncio.gather(
+            *(flight.do("key", fail) for _ in range(3)), return_exceptions=True
+        )
+
+    assert all(isinstance(result, ValueError) for result in asyncio.run(scenario()))
+
+
+def test_late_caller_reuses_the_cached_result(slow_api, monkeypatch):
+    with PokeClient(base_url=slow_api.base_url) as client:
+        model = client.get_pokemon(6)
+        cache_get = client.cache.get
+        lookups = []
+
+        def get(*args):
+            # The caller's lookup misses, as if it ran just before the first call cached its model
+            lookups.append(args)
+            return cache_get(*args) if len(lookups) > 1 else None
+
+        monkeypatch.setattr(client.cache, "get", get)
+        assert client.get_pokemon(6) is model
+
+    assert slow_api.total_requests == 1
@@ -0,0 +1,92 @@
+import pytest
+
+from pokedex.client import OfflinePokeClient, PokeAPIError, PokeClient, mirror_snapshot
+from pokedex.client import snapshot as snapshot_module
+from pokedex.client.snapshot import Snapshot
+from pokedex.models import Characteristic, Gender, Pokemon
+from tests.stub import sample_data
+
+RESOURCES = ["gender", "characteristic", "pokemon"]
+
+
+@pytest.fixture
+def fixture_api(api):
+    """A stand-in API serving named and unnamed items over several list pages."""
+    for item_id in range(1, 4):
+        api.add("gender", sample_data(Gender, id=item_id, name=f"gender-{item_id}"))
+    for item_id in range(1, 6):
+        api.add("characteristic", sample_data(Characteristic, id=item_id))
+    for item_id, name in [(1, "bulbasaur"), (25, "pikachu")]:
+        api.add("pokemon", sample_data(Pokemon, {"moves": 4}, id=item_id, name=name))
+    return api
+
+
+def test_mirror_serves_offline_client(fixture_api, tmp_path):
+    with PokeClient(base_url=fixture_api.base_url) as client:
+        assert mirror_snapshot(client, tmp_path / "snapshot.db", RESOURCES, page_size=2) == 0
+        expected = [client.get_gender(2), client.get_characteristic(4), client.get_pokemon(25)]
+
+    with OfflinePokeClient(tmp_path / "snapshot.db") as offline:
+        assert [
+            offline.get_gender("gender-2"),
+            offline.get_characteristic(4),
+            offline.get_pokemon("pikachu"),
+        ] == expected
+        assert [pokemon.name for pokemon in offline.iter_models("pokemon")] == [
+            "bulbasaur",
+            "pikachu",
+        ]
+        with pytest.raises(PokeAPIError):
+            offline.get_gender(4)
+
+
+def test_mirror_resumes_and_skips_completed_endpoints(fixture_api, tmp_path):
+    with PokeClient(base_url=fixture_api.base_url) as client:
+        assert mirror_snapshot(client, tmp_path / "snapshot.db", ["gender"]) == 0
+        requests_sent = fixture_api.total_requests
+        assert mirror_snapshot(client, tmp_path / "snapshot.db", RESOURCES) == 0
+
+    # Only the lists and items of the two endpoints not mirrored yet were queried again
+    assert fixture_api.total_requests - requests_sent == 2 + 5 + 2
+
+
+@pytest.mark.parametrize(
+    "client_options",
+    [{}, {"lazy": True}, {"compact": True, "languages": ["en"]}],
+    ids=["eager", "lazy", "compact-scoped"],
+)
+def test_mirror_rejects_invalid_items(fixture_api, tmp_path, client_options):
+    data = sample_data(Pokemon, id=4, name="charmander")
+    data["moves"][0]["version_group_details"][0]["level_learned_at"] = "not-an-int"
+    fixture_api.add("pokemon", data)
+
+    with PokeClient(base_url=fixture_api.base_url, **client_options) as client:
+        assert mirror_snapshot(client, tmp_path / "snapshot.db", ["pokemon"]) == 1
+
+    with Snapshot(tmp_path / "snapshot.db", readonly=True) as snapshot:
+        assert snapshot.ids("pokemon") == {1, 25}
+        assert not snapshot.is_completed("pokemon")
+
+
+def test_interrupted_mirroring_keeps_committed_items(fixture_api, tmp_path, monkeypatch):
+    mirror_item = snapshot_module._mirror_item
+
+    def interrupted(client, endpoint, item_id):
+        if item_id == 5:
+            raise KeyboardInterrupt
+        return mirror_item(client, endpoint, item_id)
+
+    def killed(snapshot):  # closes without committing, as if the process had been killed
+        snapshot._connection.close()
+
+    monkeypatch.setattr(snapshot_module, "_mirror_item", interrupted)
+    monkeypatch.setattr(Snapshot, "close", killed)
+    with PokeClient(base_url=fixture_api.base_url) as client:
+        with pytest.raises(KeyboardInterrupt):
+            mirror_snapshot(
+                client, tmp_path / "snapshot.db", ["characteristic"], max_workers=1, commit_every=2
+            )
+
+    monkeypatch.undo()
+    with Snapshot(tmp_path / "snapshot.db", readonly=True) as snapshot:
+        assert snapshot.ids("characteristic") == {1, 2, 3, 4}
@@ -0,0 +1,56 @@
+import pytest
+from pydantic import ValidationError
+
+from pokedex.client import PokeClient
+from pokedex.client.disk_cache import DiskCache
+from pokedex.models import Gender, Pokemon
+from tests.stub import sample_data
+
+
+def _client(api, tmp_path, **kwargs) -> PokeClient:
+    return PokeClient(
+        base_url=api.base_url, disk_cache=DiskCache(tmp_path / "cache.db"), trusted=True, **kwargs
+    )
+
+
+def _is_validated(client: PokeClient, endpoint: str, item_id: int) -> bool:
+    return client.disk_cache.get(client.format_query_url(item_id, endpoint)).validated
+
+
+def test_invalid_cached_body_is_never_trusted(api, tmp_path):
+    data = sample_data(Pokemon, id=1, name="bulbasaur")
+    data["moves"][0]["version_group_details"][0]["level_learned_at"] = "not-an-int"
+    api.add("pokemon", data)
+
+    with _client(api, tmp_path) as client:
+        with pytest.raises(ValidationError):
+            client.get_pokemon(1)
+        assert not _is_validated(client, "pokemon", 1)
+    with _client(api, tmp_path) as client:
+        with pytest.raises(ValidationError):
+            client.get_pokemon(1)
+    assert api.total_requests == 1
+
+
+def test_fully_validated_body_is_trusted(api, tmp_path):
+    api.add("gender", sample_data(Gender, id=1, name="female"))
+
+    with _client(api, tmp_path) as client:
+        assert client.get_gender(1).name == "female"
+        assert _is_validated(client, "gender", 1)
+    with _client(api, tmp_path) as client:
+        assert client.get_gender(1).name == "female"
+    assert api.total_requests == 1
+
+
+@pytest.mark.parametrize(
+    "client_options, query_options",
+    [({}, {"fields": ["name"]}), ({"lazy": True}, {}), ({"languages": ["en"]}, {})],
+    ids=["projected", "lazy", "scoped"],
+)
+def test_partially_validated_body_is_not_flagged(api, tmp_path, client_options, query_options):
+    api.add("pokemon", sample_data(Pokemon, id=1, name="bulbasaur"))
+
+    with _client(api, tmp_path, **client_options) as client:
+        client.get_pokemon(1, **query_options)
+        assert not _is_validated(client, "pokemon", 1)
@@ -0,0 +1,64 @@
+import pytest
+
+from pokedex.models import Type
+from tests.stub import sample_data
+
+np = pytest.importorskip("numpy")
+
+from pokedex.indexes import NO_TYPE, TypeChart  # noqa: E402
+
+RELATIONS = ("no_damage_to", "half_damage_to", "double_damage_to") + tuple(
+    f"{multiplier}_damage_from" for multiplier in ("no", "half", "double")
+)
+
+
+def _type(type_id: int, name: str, **relations: list) -> Type:
+    damage_relations = {
+        relation: [{"name": other, "url": "https://x/1/"} for other in relations.get(relation, [])]
+        for relation in RELATIONS
+    }
+    return Type(**sample_data(Type, id=type_id, name=name, damage_relations=damage_relations))
+
+
+@pytest.fixture(scope="module")
+def chart() -> TypeChart:
+    return TypeChart.from_types(
+        [
+            _type(13, "electric", double_damage_to=["water", "flying"], no_damage_to=["ground"]),
+            _type(11, "water", half_damage_from=["water"], double_damage_to=["ground"]),
+            _type(3, "flying", half_damage_from=["ground", "fairy"]),
+            _type(5, "ground", double_damage_to=["electric"], no_damage_to=["flying"]),
+        ]
+    )
+
+
+def test_relations_fill_the_matrix(chart):
+    assert chart.effectiveness("electric", "water", "flying") == 4.0
+    assert chart.effectiveness("electric", "ground") == 0.0
+    assert chart.effectiveness("water", "water") == 0.5
+    assert chart.effectiveness("water", "electric") == 1.0
+    # Relations to types left out of the chart, such as fairy, are ignored
+    assert chart.effectiveness("ground", "flying") == 0.0
+
+
+def test_score_broadcasts_matchups(chart):
+    scores = chart.score(["electric", "ground"], ["water", "electric"], ["flying", None])
+    assert scores.tolist() == [4.0, 2.0]
+
+    defending = chart.indices(["water", "ground"])
+    all_scores = chart.score_all(defending, [NO_TYPE, NO_TYPE])
+    assert all_scores.shape == (4, 2)
+    assert all_scores[chart.index["electric"]].tolist() == [2.0, 0.0]
+
+
+def test_unknown_type_is_rejected(chart):
+    with pytest.raises(ValueError, match="Unknown types"):
+        chart.indices(["electric", "fairy"])
+
+
+def test_save_and_load(chart, tmp_path):
+    chart.save(tmp_path / "typechart.npz")
+    loaded = TypeChart.load(tmp_path / "typechart.npz")
+
+    assert loaded.names == chart.names
+    assert np.array_equal(loaded.matrix, chart.matrix)